@@ -0,0 +1,38 @@
+"""
+Script para empaquetar tilesets y sprites en atlas de texturas
+
+Genera assets/atlases/atlas_N.png y assets/atlases/atlas.json. En tiempo de
+ejecución ResourceManager sirve los tiles y sprites desde el atlas en lugar
+de decodificar cada PNG por separado; las imágenes que cambien después de
+generar el atlas se vuelven a cargar sueltas hasta que se regenere.
+
+Uso:
+    python build_atlases.py
+"""
+
+import os
+import sys
+
+import pygame
+
+from src.utils.texture_atlas import build_atlases
+
+
+def main():
+    """Genera los atlas y muestra un resumen"""
+    pygame.init()
+    try:
+        manifest_path = build_atlases()
+    except Exception as e:
+        print(f"[ERROR] No se pudo generar el atlas: {e}")
+        return 1
+
+    output_dir = os.path.dirname(manifest_path)
+    for name in sorted(os.listdir(output_dir)):
+        size_kb = os.path.getsize(os.path.join(output_dir, name)) / 1024
+        print(f"[OK] {name} ({size_kb:.1f} KB)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,47 @@
+"""
+Script para compilar los mapas .tmx de data/maps/ al formato binario .tmxb
+
+MapManager.load_compiled usa el .tmxb si está al día con su .tmx y así evita
+parsear XML en cada carga. Volver a ejecutar este script después de editar
+un mapa en Tiled (los binarios desactualizados se ignoran automáticamente).
+
+Uso:
+    python compile_maps.py              # Compila todos los mapas de data/maps/
+    python compile_maps.py map_01.tmx   # Compila solo los mapas indicados
+    python compile_maps.py --force      # Recompila aunque estén al día
+"""
+
+import os
+import sys
+
+from src.config import DATA_DIR
+from src.map.compiled_map import compile_map, compiled_path_for, is_compiled_map_stale
+
+
+def main():
+    """Compila los mapas indicados (o todos) y muestra un resumen"""
+    maps_dir = os.path.join(DATA_DIR, "maps")
+    names = sys.argv[1:] or sorted(f for f in os.listdir(maps_dir) if f.endswith(".tmx"))
+    force = "--force" in names
+    names = [n for n in names if n != "--force"]
+
+    errors = 0
+    for name in names:
+        tmx_path = os.path.join(maps_dir, name)
+        compiled_path = compiled_path_for(tmx_path)
+        if not force and not is_compiled_map_stale(compiled_path, tmx_path):
+            print(f"[OK] {name} ya está compilado")
+            continue
+        try:
+            output = compile_map(tmx_path)
+            size_kb = os.path.getsize(output) / 1024
+            print(f"[OK] {name} -> {os.path.basename(output)} ({size_kb:.1f} KB)")
+        except Exception as e:
+            print(f"[ERROR] No se pudo compilar {name}: {e}")
+            errors += 1
+
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,54 @@
+"""
+Script para simular combates por lotes y medir el balance
+
+Usa el núcleo de combate sin gráficos de src/combat/simulator.py con los
+personajes, enemigos y habilidades de data/.
+
+Uso:
+    python simulate_combat.py                                  # Grupo 1 2 contra 1001 1002
+    python simulate_combat.py --party 1 --enemies 1002 -n 50000
+    python simulate_combat.py -n 1000000 --workers 0           # Todos los núcleos
+    python simulate_combat.py --level 5 --policy random --seed 42 --json
+"""
+
+import argparse
+import json
+import sys
+import time
+
+from src.combat.simulator import CombatSimulator, POLICIES
+
+
+def main():
+    """Corre el lote pedido y muestra el reporte"""
+    parser = argparse.ArgumentParser(description="Simulador de combate por lotes")
+    parser.add_argument("--party", type=int, nargs="+", default=[1, 2], help="IDs de personajes")
+    parser.add_argument("--enemies", type=int, nargs="+", default=[1001, 1002], help="IDs de enemigos")
+    parser.add_argument("-n", "--fights", type=int, default=10000, help="Cantidad de combates")
+    parser.add_argument("--seed", type=int, default=0, help="Semilla del lote")
+    parser.add_argument("--workers", type=int, default=1, help="Procesos (0 = todos los núcleos)")
+    parser.add_argument("--level", type=int, default=1, help="Nivel del grupo")
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="basic", help="Política de acciones")
+    parser.add_argument("--json", action="store_true", help="Imprimir el resumen como JSON")
+    args = parser.parse_args()
+
+    try:
+        simulator = CombatSimulator.from_ids(args.party, args.enemies, level=args.level, policy=args.policy)
+    except (KeyError, OSError, ValueError) as e:
+        print(f"[ERROR] No se pudo preparar la simulación: {e}")
+        return 1
+
+    start = time.perf_counter()
+    report = simulator.run(args.fights, seed=args.seed, workers=args.workers)
+    elapsed = time.perf_counter() - start
+
+    if args.json:
+        print(json.dumps(report.summary(), indent=2, ensure_ascii=False))
+    else:
+        print(report.format())
+        print(f"[OK] {args.fights} combates en {elapsed:.2f} s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
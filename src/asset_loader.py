@@ -0,0 +1,193 @@
+"""
+Carga asíncrona de assets - cola de trabajos en hilos de fondo
+
+Los hilos solo hacen el trabajo que no toca la pantalla (decodificar PNG,
+parsear JSON/TMX). El paso final de cada trabajo (convert/convert_alpha y
+guardar en la caché) se hace en el hilo principal desde pump(), un poco en
+cada frame, para no congelar la pantalla de carga.
+"""
+
+import os
+import time
+import pygame
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+from src.config import ASSETS_DIR, ASSET_LOADER_WORKERS, ASSET_PUMP_BUDGET_MS
+from src.utils.data_loader import load_data
+from src.utils.image_cache import load_image_file
+
+
+class AssetJob:
+    """Trabajo de carga: una parte en un hilo de fondo y otra en el hilo principal"""
+
+    def __init__(self, name: str, future: Optional[Future],
+                 finish: Optional[Callable[[Any], None]], required: bool):
+        self.name = name
+        self.future = future
+        self.finish = finish
+        self.required = required
+        self.done = future is None
+        self.error: Optional[str] = None
+
+
+class AssetLoader:
+    """Cola de trabajos de carga con progreso real"""
+
+    def __init__(self, resource_manager, max_workers: int = ASSET_LOADER_WORKERS):
+        """
+        Inicializa el cargador
+
+        Args:
+            resource_manager: ResourceManager donde se guardan las imágenes cargadas
+            max_workers: Hilos de fondo
+        """
+        self.resource_manager = resource_manager
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._jobs: List[AssetJob] = []
+        self._by_name: Dict[str, AssetJob] = {}
+
+    def _submit(self, name: str, work: Optional[Callable[[], Any]],
+                finish: Optional[Callable[[Any], None]], required: bool) -> AssetJob:
+        """Registra un trabajo (si ya existe, solo puede volverse obligatorio)"""
+        job = self._by_name.get(name)
+        if job is not None:
+            job.required = job.required or required
+            return job
+
+        future = None
+        if work is not None:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                    thread_name_prefix="asset-loader")
+            future = self._executor.submit(work)
+
+        job = AssetJob(name, future, finish, required)
+        self._jobs.append(job)
+        self._by_name[name] = job
+        return job
+
+    def queue_image(self, path: str, use_alpha: bool = True, required: bool = False) -> AssetJob:
+        """
+        Encola una imagen: se decodifica en un hilo y se convierte en el principal
+
+        Las imágenes que ya están en caché o en el atlas cuentan como cargadas.
+
+        Args:
+            path: Ruta relativa desde assets/
+            use_alpha: Si True, convert_alpha; si no, convert
+            required: Si la pantalla de carga debe esperarla
+
+        Returns:
+            Trabajo encolado
+        """
+        resource_manager = self.resource_manager
+        if resource_manager.get_image(path) is not None or (
+                use_alpha and resource_manager.atlas.has_source(path)):
+            return self._submit(f"image:{path}", None, None, required)
+
+        full_path = os.path.join(ASSETS_DIR, path)
+
+        def finish(image: pygame.Surface):
+            image = image.convert_alpha() if use_alpha else image.convert()
+            resource_manager.store_image(path, image)
+
+        return self._submit(f"image:{path}", lambda: load_image_file(full_path), finish, required)
+
+    def queue_data(self, path: str, required: bool = False) -> AssetJob:
+        """
+        Encola un JSON de data/ (queda en la caché de load_data)
+
+        Args:
+            path: Ruta relativa a data/
+            required: Si la pantalla de carga debe esperarlo
+
+        Returns:
+            Trabajo encolado
+        """
+        return self._submit(f"data:{path}", lambda: load_data(path), None, required)
+
+    def queue_call(self, name: str, work: Callable[[], Any],
+                   finish: Optional[Callable[[Any], None]] = None,
+                   required: bool = False) -> AssetJob:
+        """
+        Encola un trabajo genérico
+
+        Args:
+            name: Nombre único del trabajo
+            work: Función que se ejecuta en un hilo de fondo (no debe tocar la pantalla)
+            finish: Función opcional que recibe el resultado en el hilo principal
+            required: Si la pantalla de carga debe esperarlo
+
+        Returns:
+            Trabajo encolado
+        """
+        return self._submit(name, work, finish, required)
+
+    def pump(self, time_budget: float = ASSET_PUMP_BUDGET_MS / 1000.0):
+        """
+        Termina en el hilo principal los trabajos que los hilos ya completaron
+
+        Se llama una vez por frame. Siempre termina al menos un trabajo listo,
+        y luego sigue mientras quede tiempo del presupuesto.
+
+        Args:
+            time_budget: Segundos máximos a usar en este frame
+        """
+        start = time.perf_counter()
+        for job in self._jobs:
+            if job.done or not job.future.done():
+                continue
+
+            job.done = True
+            try:
+                result = job.future.result()
+                if job.finish is not None:
+                    job.finish(result)
+            except Exception as e:
+                job.error = str(e)
+                print(f"[WARNING] No se pudo cargar {job.name}: {e}")
+
+            if time.perf_counter() - start >= time_budget:
+                break
+
+    def finish_all(self):
+        """
+        Espera a todos los trabajos pendientes y los termina en el hilo principal
+
+        Para las sesiones sin ventana o con guion: así lo que se carga no
+        depende de la velocidad real de los hilos, solo de los ticks.
+        """
+        for job in self._jobs:
+            if not job.done:
+                try:
+                    job.future.result()
+                except Exception:
+                    pass  # pump() registra el error
+        self.pump(float("inf"))
+
+    def get_progress(self, required_only: bool = True) -> float:
+        """
+        Retorna la fracción de trabajos terminados (0.0 a 1.0)
+
+        Args:
+            required_only: Si True, solo cuenta los trabajos obligatorios
+        """
+        jobs = [job for job in self._jobs if job.required or not required_only]
+        if not jobs:
+            return 1.0
+        return sum(1 for job in jobs if job.done) / len(jobs)
+
+    def is_ready(self) -> bool:
+        """Retorna True si todos los trabajos obligatorios ya están terminados"""
+        return all(job.done for job in self._jobs if job.required)
+
+    def is_idle(self) -> bool:
+        """Retorna True si no queda ningún trabajo pendiente"""
+        return all(job.done for job in self._jobs)
+
+    def shutdown(self):
+        """Cancela los trabajos pendientes"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
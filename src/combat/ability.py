@@ -4,6 +4,7 @@ Sistema de habilidades
 
 from typing import Dict, List, Optional
 from enum import Enum
+from src.combat.status_effect import StatusEffect
 
 
 class ElementType(Enum):
@@ -15,6 +16,26 @@ class ElementType(Enum):
     PHYSICAL = "Físico"
     NONE = "Ninguno"
 
+    @classmethod
+    def parse(cls, text) -> "ElementType":
+        """
+        Convierte un texto de los JSON en un elemento
+
+        Args:
+            text: Nombre en inglés ("FIRE") o en español ("Fuego"), o un ElementType
+
+        Returns:
+            ElementType correspondiente (NONE si no se reconoce)
+        """
+        if isinstance(text, cls):
+            return text
+        if not text:
+            return cls.NONE
+        for element in cls:
+            if text.upper() in (element.name, element.value.upper()):
+                return element
+        return cls.NONE
+
 
 class Ability:
     """Representa una habilidad"""
@@ -47,11 +68,7 @@ class Ability:
         self.tipo = data.get("tipo", "ataque")  # ataque, soporte, defensa
         
         # Elemento
-        elemento_str = data.get("elemento", "Ninguno")
-        try:
-            self.elemento = ElementType[elemento_str.upper()]
-        except:
-            self.elemento = ElementType.NONE
+        self.elemento = ElementType.parse(data.get("elemento", "Ninguno"))
         
         # Daño/cura
         self.damage = data.get("damage", 0)
@@ -63,8 +80,8 @@ class Ability:
         self.target_all = data.get("target_all", False)
         
         # Efectos adicionales
-        self.status_effects = data.get("status_effects", [])
-        self.stat_buffs = data.get("stat_buffs", {})
+        self.status_effects = list(data.get("status_effects", []))
+        self.stat_buffs = dict(data.get("stat_buffs", {}))
         
         # Requisitos
         self.required_level = data.get("required_level", 1)
@@ -138,13 +155,8 @@ class Ability:
         else:
             actual_targets = []
         
-        # Aplicar efectos
-        results = []
-        for tgt in actual_targets:
-            result = self._apply_to_target(caster, tgt)
-            results.append(result)
-        
-        return results
+        # Aplicar efectos (daño y curación de todos los objetivos en un solo lote)
+        return self._apply_to_targets(caster, actual_targets)
     
     def _apply_to_target(self, caster, target) -> Dict:
         """
@@ -157,45 +169,53 @@ class Ability:
         Returns:
             Diccionario con el resultado
         """
-        result = {
-            "target": target,
-            "damage": 0,
-            "heal": 0,
-            "status_effects": []
-        }
+        return self._apply_to_targets(caster, [target])[0]
+    
+    def _apply_to_targets(self, caster, targets: List) -> List[Dict]:
+        """
+        Aplica la habilidad a varios objetivos a la vez
         
-        # Calcular daño
-        if self.damage > 0:
-            base_damage = self.damage
-            
-            # Aplicar stats del caster
-            if self.damage_type == "fisico":
-                base_damage += caster.stats.get("ATK", 0)
-            else:  # mágico
-                base_damage += caster.stats.get("MAG", 0)
+        Args:
+            caster: Personaje que usa la habilidad
+            targets: Objetivos
             
-            # Aplicar defensa del objetivo
+        Returns:
+            Lista de resultados, uno por objetivo
+        """
+        from src.combat.damage_resolver import apply_hit, apply_heal
+        
+        results = [
+            {"target": target, "damage": 0, "heal": 0, "status_effects": []}
+            for target in targets
+        ]
+        
+        # Calcular daño (los objetivos ya no tienen que recorrerse uno a uno)
+        if self.damage > 0:
             if self.damage_type == "fisico":
-                defense = target.stats.get("DEF", 0)
-            else:
-                defense = target.stats.get("MAG", 0)  # Resistencia mágica
-            
-            damage = max(1, base_damage - defense)
-            result["damage"] = damage
-            target.stats["HP"] = max(0, target.stats["HP"] - damage)
+                power = self.damage + caster.stats.get("ATK", 0)
+                defense_stat = "DEF"
+            else:  # mágico: la resistencia mágica es el MAG del objetivo
+                power = self.damage + caster.stats.get("MAG", 0)
+                defense_stat = "MAG"
+            for result, damage in zip(results, apply_hit(targets, power, self.elemento, defense_stat)):
+                result["damage"] = damage
         
         # Calcular curación
         if self.heal > 0:
             heal_amount = self.heal + caster.stats.get("MAG", 0)
-            result["heal"] = heal_amount
-            target.stats["HP"] = min(target.max_hp, target.stats["HP"] + heal_amount)
+            for result, heal in zip(results, apply_heal(targets, heal_amount)):
+                result["heal"] = heal
         
         # Aplicar efectos de estado
-        for status_effect_data in self.status_effects:
-            # TODO: Crear StatusEffect desde los datos
-            pass
+        for target, result in zip(targets, results):
+            status_manager = getattr(target, "status_manager", None)
+            if status_manager is not None:
+                for status_effect_data in self.status_effects:
+                    effect = StatusEffect.from_dict(status_effect_data)
+                    status_manager.add_effect(effect)
+                    result["status_effects"].append(effect.name)
         
-        return result
+        return results
     
     def update_cooldown(self):
         """Actualiza el cooldown (llamar al final de cada turno)"""
@@ -223,3 +243,35 @@ class Ability:
             "required_position": self.required_position
         }
 
+
+def load_ability_table() -> Dict[int, Dict]:
+    """
+    Carga las habilidades de data/abilities/
+
+    Returns:
+        Diccionario id -> datos de la habilidad
+    """
+    from src.utils.data_loader import load_data
+
+    data = load_data("abilities/abilities_base.json")
+    return {ability["id"]: ability for ability in data.get("abilities", [])}
+
+
+def create_abilities(ability_ids: List[int]) -> List[Ability]:
+    """
+    Crea las habilidades de un personaje o enemigo a partir de sus IDs
+
+    Args:
+        ability_ids: IDs en data/abilities/abilities_base.json (los que no
+            existan se ignoran)
+
+    Returns:
+        Lista de Ability nuevas (cada una con su propio cooldown)
+    """
+    table = load_ability_table()
+    return [
+        Ability(ability_id, table[ability_id].get("nombre", ""), table[ability_id])
+        for ability_id in ability_ids
+        if ability_id in table
+    ]
+
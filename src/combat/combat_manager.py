@@ -6,8 +6,9 @@ from typing import List, Optional, Dict
 from enum import Enum
 from src.entities.character import Character
 from src.combat.enemy import Enemy
-from src.combat.ability import Ability
+from src.combat.ability import Ability, ElementType
 from src.combat.status_effect import StatusManager, StatusEffect, StatusType
+from src.combat.timeline import InitiativeTimeline, effective_vel
 
 
 class CombatAction:
@@ -53,17 +54,14 @@ class CombatAction:
     
     def _execute_attack(self) -> List[Dict]:
         """Ejecuta un ataque básico"""
-        results = []
-        for target in self.targets:
-            damage = self.actor.stats.get("ATK", 0) - target.stats.get("DEF", 0)
-            damage = max(1, damage)
-            target.stats["HP"] = max(0, target.stats["HP"] - damage)
-            results.append({
-                "target": target,
-                "damage": damage,
-                "heal": 0
-            })
-        return results
+        from src.combat.damage_resolver import apply_hit
+        
+        power = self.actor.stats.get("ATK", 0)
+        damages = apply_hit(self.targets, power, ElementType.PHYSICAL, "DEF")
+        return [
+            {"target": target, "damage": damage, "heal": 0}
+            for target, damage in zip(self.targets, damages)
+        ]
     
     def _execute_defend(self) -> List[Dict]:
         """Ejecuta una defensa"""
@@ -78,7 +76,8 @@ class CombatManager:
         """Inicializa el gestor de combate"""
         self.party: List[Character] = []
         self.enemies: List[Enemy] = []
-        self.turn_order: List[Character] = []
+        self.timeline = InitiativeTimeline()
+        self.turn_order: List[Character] = []  # Turnos previstos de la ronda actual
         self.current_turn = 0
         self.turn_count = 0
         
@@ -105,26 +104,35 @@ class CombatManager:
         self.defeat = False
         self.turn_count = 0
         
-        # Crear orden de turnos basado en velocidad
-        all_combatants = party + enemies
-        self.turn_order = sorted(
-            all_combatants,
-            key=lambda c: c.stats.get("VEL", 0),
-            reverse=True
-        )
-        
-        self.current_turn = 0
-        
         # Inicializar gestores de estado para todos
+        all_combatants = party + enemies
         for combatant in all_combatants:
             if not hasattr(combatant, 'status_manager'):
                 combatant.status_manager = StatusManager()
+        
+        # Línea de tiempo de iniciativa basada en la velocidad efectiva
+        self.timeline = InitiativeTimeline()
+        for combatant in all_combatants:
+            self.timeline.add(combatant, effective_vel(combatant))
+        
+        self.current_turn = 0
+        self.turn_order = self.timeline.preview(len(self.timeline))
     
     def get_current_actor(self) -> Optional[Character]:
         """Retorna el personaje cuyo turno es actual"""
-        if self.current_turn < len(self.turn_order):
-            return self.turn_order[self.current_turn]
-        return None
+        return self.timeline.peek()
+    
+    def preview_turns(self, count: int) -> List[Character]:
+        """
+        Próximos turnos según la línea de tiempo (para la interfaz)
+        
+        Args:
+            count: Cantidad de turnos
+            
+        Returns:
+            Combatientes en orden de acción, empezando por el actual
+        """
+        return self.timeline.preview(count)
     
     def queue_action(self, actor: Character, action: CombatAction):
         """
@@ -171,16 +179,26 @@ class CombatManager:
             # Si no hay acción, saltar turno
             results["action_results"] = []
         
-        # Avanzar turno
+        # Avanzar turno: el actor vuelve a la línea de tiempo con su VEL actual
+        self.timeline.advance(effective_vel(actor))
+        for result in results["action_results"]:
+            target = result.get("target")
+            if target is not None and target in self.timeline:
+                # Un buff o debuff de velocidad cambia la espera que le falta
+                self.timeline.refresh(target, effective_vel(target))
+        for combatant in [actor] + [r.get("target") for r in results["action_results"]]:
+            if combatant is not None and combatant.stats.get("HP", 0) <= 0:
+                self.timeline.remove(combatant)
         self.current_turn += 1
         
-        # Si se completaron todos los turnos, iniciar nueva ronda
+        # Ronda: tantos turnos como combatientes había al empezarla
         if self.current_turn >= len(self.turn_order):
             self.current_turn = 0
             self.turn_count += 1
+            self.turn_order = self.timeline.preview(len(self.timeline))
             
             # Actualizar cooldowns de todas las habilidades
-            for combatant in self.turn_order:
+            for combatant in self.party + self.enemies:
                 if hasattr(combatant, 'abilities'):
                     for ability in combatant.abilities:
                         ability.update_cooldown()
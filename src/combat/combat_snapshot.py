@@ -0,0 +1,489 @@
+"""
+Estado de combate compacto para búsqueda y simulación
+
+CombatSnapshot guarda un combate como struct-of-arrays: una fila por
+combatiente en arrays de NumPy (stats y cooldowns) y los estados como
+tuplas inmutables. Lo que no cambia durante el combate (nombres, bandos,
+HP máximo, elementos, habilidades) se comparte entre todas las copias.
+
+clone() no copia nada: la copia comparte los arrays con el original y
+cada uno duplica un array recién la primera vez que lo modifica (copy on
+write). Así la IA puede abrir miles de ramas por frame y el simulador
+arranca cada combate clonando una plantilla.
+
+apply() juega un turno con las mismas reglas que CombatManager.execute_turn
+(estados al inicio del turno, acción, línea de tiempo de iniciativa,
+cooldowns por ronda) usando el resolvedor de daño en lote de
+damage_resolver.
+"""
+
+import numpy as np
+from typing import Dict, List, Optional, Sequence, Tuple
+from src.combat.ability import Ability, ElementType
+from src.combat.damage_resolver import resolve_damage, resolve_heal
+from src.combat.elemental_system import ELEMENT_INDEX
+from src.combat.status_effect import StatusEffect
+from src.combat.timeline import InitiativeTimeline
+
+PARTY = 0
+ENEMIES = 1
+
+# Columnas de CombatSnapshot.stats
+STATS = ("HP", "MP", "ATK", "DEF", "VEL", "MAG")
+HP, MP, ATK, DEF, VEL, MAG = range(len(STATS))
+
+# Campos de la tupla de un efecto de estado
+EFFECT_NAME, EFFECT_TURNS, EFFECT_DAMAGE, EFFECT_HEAL, EFFECT_MODIFIERS = range(5)
+
+
+def effect_tuple(effect: StatusEffect) -> Tuple:
+    """
+    Convierte un StatusEffect en la tupla inmutable que usa el snapshot
+
+    Args:
+        effect: Efecto de estado
+
+    Returns:
+        (nombre, turnos restantes, daño por turno, cura por turno,
+        modificadores de stats como tupla de pares)
+    """
+    return (effect.name, effect.turns_remaining, effect.damage_per_turn,
+            effect.heal_per_turn, tuple(sorted(effect.stat_modifiers.items())))
+
+
+class AbilitySpec:
+    """Datos fijos de una habilidad (compartidos por todas las copias)"""
+
+    def __init__(self, ability: Ability):
+        """
+        Inicializa la especificación
+
+        Args:
+            ability: Habilidad de la que se copian los datos
+        """
+        self.id = ability.id
+        self.costo_mp = ability.costo_mp
+        self.cooldown = ability.cooldown
+        self.required_level = ability.required_level
+        self.damage = ability.damage
+        self.heal = ability.heal
+        self.target_all = ability.target_all
+        self.element = ability.elemento
+        physical = ability.damage_type == "fisico"
+        self.power_stat = ATK if physical else MAG
+        self.defense_stat = DEF if physical else MAG  # La resistencia mágica es el MAG
+        self.effects = tuple(effect_tuple(StatusEffect.from_dict(data)) for data in ability.status_effects)
+        self.supports = ability.heal > 0 and ability.damage == 0
+
+
+class ActionChoice:
+    """Acción elegida sobre un snapshot: habilidad (o ataque básico) y objetivos"""
+
+    def __init__(self, ability_id: Optional[int], targets: Tuple[int, ...]):
+        """
+        Inicializa la acción
+
+        Args:
+            ability_id: ID de la habilidad, o None para el ataque básico
+            targets: Índices de los objetivos (filas del snapshot)
+        """
+        self.ability_id = ability_id
+        self.targets = targets
+
+    def __repr__(self) -> str:
+        return f"ActionChoice({self.ability_id}, {self.targets})"
+
+
+class CombatSnapshot:
+    """Estado de un combate que se puede copiar y avanzar sin tocar el combate real"""
+
+    def __init__(self, names: Sequence[str], teams: Sequence[int], stats: np.ndarray,
+                 max_hp: Sequence[int], levels: Sequence[int], elements: Sequence,
+                 abilities: Sequence[Sequence[AbilitySpec]], cooldowns: Sequence[Sequence[int]],
+                 effects: Sequence[Sequence[Tuple]], timeline: Optional[InitiativeTimeline] = None,
+                 turn_count: int = 0, round_turns: int = 0, round_length: Optional[int] = None):
+        """
+        Inicializa el snapshot
+
+        Args:
+            names: Nombre de cada combatiente (party primero, después enemigos)
+            teams: PARTY o ENEMIES por combatiente
+            stats: Matriz (combatientes x STATS)
+            max_hp: HP máximo por combatiente
+            levels: Nivel por combatiente
+            elements: Elemento por combatiente (ElementType, texto o None)
+            abilities: AbilitySpec de cada combatiente
+            cooldowns: Cooldown restante de cada habilidad, por combatiente
+            effects: Tuplas de efectos de estado (ver effect_tuple), por combatiente
+            timeline: Línea de tiempo con filas como claves (por defecto, una
+                nueva con todos los combatientes vivos según su VEL)
+            turn_count: Rondas completas
+            round_turns: Turnos jugados en la ronda actual
+            round_length: Turnos de la ronda actual (por defecto, los vivos)
+        """
+        count = len(names)
+        slots = max((len(specs) for specs in abilities), default=0)
+
+        # Datos fijos: compartidos por todas las copias
+        self.names = tuple(names)
+        self.team = np.asarray(teams, dtype=np.int8)
+        self.max_hp = np.asarray(max_hp, dtype=np.int64)
+        self.level = np.asarray(levels, dtype=np.int64)
+        self.elements = np.array([ELEMENT_INDEX[ElementType.parse(e)] for e in elements], dtype=np.intp)
+        self.abilities = tuple(tuple(specs) for specs in abilities)
+        self._party_rows = tuple(row for row, team in enumerate(teams) if team == PARTY)
+        self._enemy_rows = tuple(row for row, team in enumerate(teams) if team != PARTY)
+
+        # Datos que cambian (copy on write)
+        self.stats = np.asarray(stats, dtype=np.int64).reshape(count, len(STATS))
+        self.cooldowns = np.zeros((count, slots), dtype=np.int64)
+        for row, values in enumerate(cooldowns):
+            self.cooldowns[row, :len(values)] = values
+        self.effects = tuple(tuple(row) for row in effects)
+        if timeline is None:
+            timeline = InitiativeTimeline()
+            for row in range(count):
+                if self.stats[row, HP] > 0:
+                    timeline.add(row, self.speed(row))
+        self.timeline = timeline
+        self.turn_count = turn_count
+        self.round_turns = round_turns
+        self.round_length = len(timeline) if round_length is None else round_length
+        self._turn_status: Optional[Dict[str, int]] = None  # Estados ya aplicados en este turno
+        self._owns_stats = True
+        self._owns_cooldowns = True
+        self._owns_timeline = True
+
+    @classmethod
+    def from_combatants(cls, party: List, enemies: List, timeline: Optional[InitiativeTimeline] = None,
+                        turn_count: int = 0, round_turns: int = 0,
+                        round_length: Optional[int] = None) -> "CombatSnapshot":
+        """
+        Copia todos los combatientes (Character/Enemy o cualquier objeto con stats)
+
+        Los derrotados también se copian (con HP 0), pero solo los vivos
+        entran en la línea de tiempo.
+
+        Args:
+            party: Aliados
+            enemies: Enemigos
+            timeline: Línea de tiempo con los mismos objetos como claves (se
+                copia; por defecto, una nueva según la VEL efectiva)
+            turn_count: Rondas completas
+            round_turns: Turnos jugados en la ronda actual
+            round_length: Turnos de la ronda actual
+
+        Returns:
+            CombatSnapshot con una fila por combatiente
+        """
+        combatants = party + enemies
+        if timeline is not None:
+            timeline = timeline.copy({c: i for i, c in enumerate(combatants)})
+
+        abilities = [list(getattr(c, "abilities", [])) for c in combatants]
+        effects = []
+        for c in combatants:
+            status_manager = getattr(c, "status_manager", None)
+            effects.append([effect_tuple(e) for e in status_manager.effects] if status_manager else [])
+
+        return cls(
+            [getattr(c, "nombre", "Jugador") for c in combatants],
+            [PARTY] * len(party) + [ENEMIES] * len(enemies),
+            [[c.stats.get(stat, 0) for stat in STATS] for c in combatants],
+            [c.max_hp for c in combatants],
+            [getattr(c, "level", 1) for c in combatants],
+            [getattr(c, "elemento", None) for c in combatants],
+            [[AbilitySpec(a) for a in row_abilities] for row_abilities in abilities],
+            [[a.cooldown_remaining for a in row_abilities] for row_abilities in abilities],
+            effects,
+            timeline,
+            turn_count,
+            round_turns,
+            round_length,
+        )
+
+    @classmethod
+    def from_combat(cls, combat_manager) -> "CombatSnapshot":
+        """
+        Copia el estado de un CombatManager
+
+        Args:
+            combat_manager: Combate en curso
+
+        Returns:
+            CombatSnapshot en el mismo turno
+        """
+        return cls.from_combatants(
+            combat_manager.party, combat_manager.enemies, combat_manager.timeline,
+            combat_manager.turn_count, combat_manager.current_turn, len(combat_manager.turn_order)
+        )
+
+    @classmethod
+    def from_blocks(cls, party_blocks: List[Dict], enemy_blocks: List[Dict],
+                    abilities: Dict[int, Ability]) -> "CombatSnapshot":
+        """
+        Arma el estado inicial de un combate con bloques de stats (simulador)
+
+        Args:
+            party_blocks: Bloques del grupo (ver simulator.character_block)
+            enemy_blocks: Bloques de los enemigos (ver simulator.enemy_block)
+            abilities: Habilidades por id
+
+        Returns:
+            CombatSnapshot al inicio del combate (línea de tiempo según VEL)
+        """
+        blocks = party_blocks + enemy_blocks
+        specs = [
+            [AbilitySpec(abilities[ability_id]) for ability_id in block.get("habilidades", [])
+             if ability_id in abilities]
+            for block in blocks
+        ]
+        return cls(
+            [block["nombre"] for block in blocks],
+            [PARTY] * len(party_blocks) + [ENEMIES] * len(enemy_blocks),
+            [[block["stats"].get(stat, 0) for stat in STATS] for block in blocks],
+            [block["stats"].get("HP", 0) for block in blocks],
+            [block.get("level", 1) for block in blocks],
+            [block.get("elemento") for block in blocks],
+            specs,
+            [[0] * len(row) for row in specs],
+            [[] for _ in blocks],
+        )
+
+    def clone(self) -> "CombatSnapshot":
+        """Copia independiente (los arrays se duplican recién al modificarlos)"""
+        copy = CombatSnapshot.__new__(CombatSnapshot)
+        copy.__dict__.update(self.__dict__)
+        self._owns_stats = self._owns_cooldowns = self._owns_timeline = False
+        copy._owns_stats = copy._owns_cooldowns = copy._owns_timeline = False
+        return copy
+
+    def _write_stats(self) -> np.ndarray:
+        """Stats propios para modificar (los copia si están compartidos)"""
+        if not self._owns_stats:
+            self.stats = self.stats.copy()
+            self._owns_stats = True
+        return self.stats
+
+    def _write_cooldowns(self) -> np.ndarray:
+        """Cooldowns propios para modificar (los copia si están compartidos)"""
+        if not self._owns_cooldowns:
+            self.cooldowns = self.cooldowns.copy()
+            self._owns_cooldowns = True
+        return self.cooldowns
+
+    def _write_timeline(self) -> InitiativeTimeline:
+        """Línea de tiempo propia para modificar (la copia si está compartida)"""
+        if not self._owns_timeline:
+            self.timeline = self.timeline.copy()
+            self._owns_timeline = True
+        return self.timeline
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @property
+    def actor(self) -> int:
+        """Fila del combatiente que tiene el turno"""
+        return self.timeline.peek()
+
+    def speed(self, row: int) -> int:
+        """VEL efectiva de un combatiente (base más modificadores de sus estados)"""
+        vel = int(self.stats[row, VEL])
+        for effect in self.effects[row]:
+            for stat, value in effect[EFFECT_MODIFIERS]:
+                if stat == "VEL":
+                    vel += value
+        return max(1, vel)
+
+    def preview(self, count: int) -> List[int]:
+        """Filas de los próximos turnos (ver InitiativeTimeline.preview)"""
+        return self.timeline.preview(count)
+
+    def hp(self, row: int) -> int:
+        """HP actual de un combatiente"""
+        return int(self.stats[row, HP])
+
+    def alive(self, row: int) -> bool:
+        """True si al combatiente le queda HP"""
+        return self.stats[row, HP] > 0
+
+    def winner(self) -> Optional[int]:
+        """PARTY o ENEMIES si uno de los bandos fue derrotado, si no None"""
+        hp = self.stats[:, HP].tolist()
+        if not any(hp[row] > 0 for row in self._enemy_rows):
+            return PARTY
+        if not any(hp[row] > 0 for row in self._party_rows):
+            return ENEMIES
+        return None
+
+    def can_use(self, row: int, slot: int) -> bool:
+        """
+        Verifica si un combatiente puede usar una de sus habilidades
+
+        Args:
+            row: Fila del combatiente
+            slot: Posición de la habilidad en abilities[row]
+
+        Returns:
+            True si tiene MP, no está en cooldown y tiene el nivel
+        """
+        spec = self.abilities[row][slot]
+        return (self.stats[row, MP] >= spec.costo_mp and self.cooldowns[row, slot] == 0
+                and self.level[row] >= spec.required_level)
+
+    def usable_abilities(self, row: int) -> List[AbilitySpec]:
+        """Habilidades que el combatiente puede usar ahora"""
+        return [spec for slot, spec in enumerate(self.abilities[row]) if self.can_use(row, slot)]
+
+    def legal_actions(self) -> List[ActionChoice]:
+        """
+        Acciones posibles para el combatiente que tiene el turno
+
+        Returns:
+            Ataque básico contra cada enemigo vivo y cada habilidad usable
+            contra cada objetivo válido (las de target_all, contra todos)
+        """
+        actor = self.actor
+        hp = self.stats[:, HP].tolist()
+        own, other = ((self._party_rows, self._enemy_rows) if self.team[actor] == PARTY
+                      else (self._enemy_rows, self._party_rows))
+        foes = tuple(row for row in other if hp[row] > 0)
+        allies = tuple(row for row in own if hp[row] > 0)
+
+        actions = [ActionChoice(None, (i,)) for i in foes]
+        for spec in self.usable_abilities(actor):
+            candidates = allies if spec.supports else foes
+            if spec.target_all:
+                actions.append(ActionChoice(spec.id, candidates))
+            else:
+                actions.extend(ActionChoice(spec.id, (i,)) for i in candidates)
+        return actions
+
+    def begin_turn(self) -> Dict[str, int]:
+        """
+        Aplica los estados del combatiente que tiene el turno
+
+        Se puede llamar antes de elegir la acción para decidir con el HP ya
+        actualizado; apply() no los vuelve a aplicar en el mismo turno.
+
+        Returns:
+            Diccionario con el daño y la cura de los estados
+        """
+        if self._turn_status is None:
+            self._turn_status = self._apply_turn_effects(self.actor)
+        return self._turn_status
+
+    def apply(self, choice: Optional[ActionChoice]) -> Dict:
+        """
+        Juega el turno actual (en este snapshot, no en una copia)
+
+        Igual que CombatManager.execute_turn: estados al inicio del turno
+        (ver begin_turn), la acción, cooldowns y paso al siguiente turno.
+        Los combatientes caídos pierden su turno.
+
+        Args:
+            choice: Acción del combatiente actual (None = pasar)
+
+        Returns:
+            Diccionario con "status" (daño y cura de los estados) y
+            "action_results" (target, damage y heal por objetivo)
+        """
+        actor = self.actor
+        status = self.begin_turn()
+
+        results = []
+        if choice is not None and self.stats[actor, HP] > 0:
+            results = self._execute(actor, choice)
+
+        self._turn_status = None
+        self._end_turn(actor, [result["target"] for result in results])
+        return {"status": status, "action_results": results}
+
+    def _apply_turn_effects(self, row: int) -> Dict[str, int]:
+        """Aplica los estados del combatiente por un turno (StatusManager.apply_turn_effects)"""
+        effects = self.effects[row]
+        if not effects:
+            return {"damage": 0, "heal": 0}
+
+        damage = sum(effect[EFFECT_DAMAGE] for effect in effects)
+        heal = sum(effect[EFFECT_HEAL] for effect in effects)
+        remaining = tuple(
+            effect[:EFFECT_TURNS] + (effect[EFFECT_TURNS] - 1,) + effect[EFFECT_TURNS + 1:]
+            for effect in effects if effect[EFFECT_TURNS] > 1
+        )
+        self.effects = self.effects[:row] + (remaining,) + self.effects[row + 1:]
+
+        if damage or heal:
+            stats = self._write_stats()
+            hp = max(0, int(stats[row, HP]) - damage)
+            stats[row, HP] = min(int(self.max_hp[row]), hp + heal)
+        return {"damage": damage, "heal": heal}
+
+    def _execute(self, actor: int, choice: ActionChoice) -> List[Dict]:
+        """Resuelve la acción del actor sobre todos sus objetivos a la vez"""
+        targets = list(choice.targets)
+        stats = self._write_stats()
+        damages = heals = None
+
+        if choice.ability_id is None:
+            # Ataque básico (CombatAction._execute_attack)
+            damages, stats[targets, HP] = resolve_damage(
+                int(stats[actor, ATK]), ElementType.PHYSICAL, stats[targets, DEF],
+                self.elements[targets], stats[targets, HP]
+            )
+        else:
+            slot, spec = next((slot, spec) for slot, spec in enumerate(self.abilities[actor])
+                              if spec.id == choice.ability_id)
+            # Ability.use: MP y cooldown (CombatManager le descuenta un turno enseguida)
+            stats[actor, MP] = max(0, int(stats[actor, MP]) - spec.costo_mp)
+            self._write_cooldowns()[actor, slot] = max(0, spec.cooldown - 1)
+
+            if spec.damage > 0:
+                power = spec.damage + int(stats[actor, spec.power_stat])
+                damages, stats[targets, HP] = resolve_damage(
+                    power, spec.element, stats[targets, spec.defense_stat],
+                    self.elements[targets], stats[targets, HP]
+                )
+            if spec.heal > 0:
+                amount = spec.heal + int(stats[actor, MAG])
+                stats[targets, HP] = resolve_heal(amount, stats[targets, HP], self.max_hp[targets])
+                heals = [amount] * len(targets)
+            if spec.effects:
+                self._add_effects(targets, spec.effects)
+
+        damages = damages.tolist() if damages is not None else [0] * len(targets)
+        heals = heals or [0] * len(targets)
+        return [
+            {"target": target, "damage": damage, "heal": heal}
+            for target, damage, heal in zip(targets, damages, heals)
+        ]
+
+    def _add_effects(self, targets: List[int], new_effects: Tuple):
+        """Agrega efectos a los objetivos (un efecto reemplaza a otro del mismo nombre)"""
+        names = {effect[EFFECT_NAME] for effect in new_effects}
+        effects = list(self.effects)
+        for row in targets:
+            effects[row] = tuple(e for e in effects[row] if e[EFFECT_NAME] not in names) + new_effects
+        self.effects = tuple(effects)
+
+    def _end_turn(self, actor: int, targets: List[int]):
+        """Reprograma al actor, ajusta la espera de los objetivos y cierra la ronda"""
+        timeline = self._write_timeline()
+        timeline.advance(self.speed(actor))
+        for row in [actor] + targets:
+            if self.stats[row, HP] <= 0:
+                timeline.remove(row)
+            elif row != actor and row in timeline:
+                # Un buff o debuff de velocidad cambia la espera que le falta
+                timeline.refresh(row, self.speed(row))
+
+        # Ronda: tantos turnos como combatientes había al empezarla
+        self.round_turns += 1
+        if self.round_turns >= self.round_length:
+            self.round_turns = 0
+            self.round_length = len(timeline)
+            self.turn_count += 1
+            if self.cooldowns.any():
+                cooldowns = self._write_cooldowns()
+                np.maximum(cooldowns - 1, 0, out=cooldowns)
@@ -0,0 +1,111 @@
+"""
+Resolución de daño y curación en lote
+
+Calcula el daño de un golpe contra todos sus objetivos a la vez con arrays
+de NumPy: base + stat del atacante - defensa (mínimo 1), multiplicado por
+la efectividad elemental (EFFECTIVENESS_MATRIX indexada por ElementType) y
+restado del HP sin bajar de 0. La curación suma sin pasar del HP máximo.
+
+Lo usan Ability, CombatAction y el simulador de combate, así que las
+habilidades de área y target_all cuestan una sola llamada por acción.
+"""
+
+import numpy as np
+from typing import List, Sequence, Tuple
+from src.combat.ability import ElementType
+from src.combat.elemental_system import ELEMENT_INDEX, EFFECTIVENESS_MATRIX
+
+
+def element_indices(elements: Sequence) -> np.ndarray:
+    """
+    Convierte elementos en índices de EFFECTIVENESS_MATRIX
+
+    Args:
+        elements: ElementType, textos de los JSON ("Hielo") o None
+
+    Returns:
+        Array de índices (int)
+    """
+    return np.array([ELEMENT_INDEX[ElementType.parse(e)] for e in elements], dtype=np.intp)
+
+
+def resolve_damage(power: int, attack_element: ElementType, defense: np.ndarray,
+                   defense_elements: np.ndarray, hp: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Resuelve un golpe contra varios objetivos
+
+    Args:
+        power: Daño base más el stat del atacante (ATK o MAG)
+        attack_element: Elemento del golpe
+        defense: Defensa de cada objetivo (DEF o MAG)
+        defense_elements: Índice elemental de cada objetivo (ver element_indices)
+        hp: HP actual de cada objetivo
+
+    Returns:
+        Tupla (daño por objetivo, HP resultante)
+    """
+    multiplier = EFFECTIVENESS_MATRIX[ELEMENT_INDEX[attack_element], defense_elements]
+    damage = np.maximum(1, power - defense)
+    damage = np.maximum(1, (damage * multiplier).astype(np.int64))
+    return damage, np.maximum(0, hp - damage)
+
+
+def resolve_heal(amount: int, hp: np.ndarray, max_hp: np.ndarray) -> np.ndarray:
+    """
+    Aplica una curación a varios objetivos
+
+    Args:
+        amount: Curación por objetivo
+        hp: HP actual de cada objetivo
+        max_hp: HP máximo de cada objetivo
+
+    Returns:
+        HP resultante
+    """
+    return np.minimum(max_hp, hp + amount)
+
+
+def apply_hit(targets: List, power: int, attack_element: ElementType,
+              defense_stat: str) -> List[int]:
+    """
+    Resuelve un golpe sobre objetos con stats y escribe el HP resultante
+
+    Args:
+        targets: Objetivos con .stats (y opcionalmente .elemento)
+        power: Daño base más el stat del atacante
+        attack_element: Elemento del golpe
+        defense_stat: Stat que defiende ("DEF" o "MAG")
+
+    Returns:
+        Daño recibido por cada objetivo, en orden
+    """
+    if not targets:
+        return []
+    defense = np.array([t.stats.get(defense_stat, 0) for t in targets], dtype=np.int64)
+    hp = np.array([t.stats.get("HP", 0) for t in targets], dtype=np.int64)
+    elements = element_indices([getattr(t, "elemento", None) for t in targets])
+
+    damage, hp = resolve_damage(power, attack_element, defense, elements, hp)
+    for target, value in zip(targets, hp.tolist()):
+        target.stats["HP"] = value
+    return damage.tolist()
+
+
+def apply_heal(targets: List, amount: int) -> List[int]:
+    """
+    Cura a varios objetivos y escribe el HP resultante
+
+    Args:
+        targets: Objetivos con .stats y .max_hp
+        amount: Curación por objetivo
+
+    Returns:
+        Curación aplicada a cada objetivo (la nominal, como muestra el combate)
+    """
+    if not targets:
+        return []
+    hp = np.array([t.stats.get("HP", 0) for t in targets], dtype=np.int64)
+    max_hp = np.array([t.max_hp for t in targets], dtype=np.int64)
+    for target, value in zip(targets, resolve_heal(amount, hp, max_hp).tolist()):
+        target.stats["HP"] = value
+    return [amount] * len(targets)
@@ -2,6 +2,7 @@
 Sistema elemental - efectividad y sinergias
 """
 
+import numpy as np
 from typing import Dict, Optional
 from src.combat.ability import ElementType
 
@@ -118,3 +119,12 @@ class ElementalSystem:
         else:
             return "Efectivo"
 
+
+# Posición de cada elemento en la matriz (orden de declaración de ElementType)
+ELEMENT_INDEX: Dict[ElementType, int] = {element: i for i, element in enumerate(ElementType)}
+
+# Misma tabla como matriz: EFFECTIVENESS_MATRIX[ataque, defensa] = multiplicador
+EFFECTIVENESS_MATRIX = np.array([
+    [ElementalSystem.get_effectiveness(attack, defense) for defense in ElementType]
+    for attack in ElementType
+], dtype=np.float64)
@@ -2,13 +2,13 @@
 Clase base para enemigos
 """
 
-import json
-import os
 import pygame
 from typing import Dict, Optional, List
-from src.config import DATA_DIR, TILE_SIZE
+from src.config import TILE_SIZE, ENEMY_AI_BUDGET_MS
+from src.combat.ability import create_abilities
 from src.entities.character import Character
 from src.entities.animation import Direction
+from src.utils.data_loader import load_data
 
 
 class Enemy(Character):
@@ -27,19 +27,21 @@ class Enemy(Character):
         super().__init__(x, y, character_id=None, resource_manager=resource_manager)
         self.enemy_id = enemy_id
         
-        # Cargar datos del enemigo
-        self._load_enemy_data(enemy_id)
-        
-        # Información del enemigo
+        # Información del enemigo (valores por defecto)
         self.nombre = "Enemigo"
         self.tipo = "Normal"
         self.elemento = None
         self.exp_reward = 0
         self.loot_table = []
         self.habilidades = []
+        self.abilities = []
         
-        # AI
-        self.ai_type = "basic"  # basic, aggressive, defensive, etc.
+        # AI (ver src/combat/enemy_ai.py)
+        self.ai_type = "basic"  # basic, aggressive, defensive, expectimax
+        self.ai_budget_ms = ENEMY_AI_BUDGET_MS
+        
+        # Cargar datos del enemigo
+        self._load_enemy_data(enemy_id)
         
         # Sprite placeholder
         self._create_placeholder_sprite()
@@ -47,9 +49,7 @@ class Enemy(Character):
     def _load_enemy_data(self, enemy_id: int):
         """Carga los datos del enemigo desde JSON"""
         try:
-            enemy_file = os.path.join(DATA_DIR, "enemies", "enemies_base.json")
-            with open(enemy_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = load_data("enemies/enemies_base.json")
             
             # Buscar el enemigo por ID
             for enemy_data in data.get("enemies", []):
@@ -58,8 +58,11 @@ class Enemy(Character):
                     self.tipo = enemy_data.get("tipo", "Normal")
                     self.elemento = enemy_data.get("elemento", None)
                     self.exp_reward = enemy_data.get("exp_reward", 0)
-                    self.loot_table = enemy_data.get("loot_table", [])
-                    self.habilidades = enemy_data.get("habilidades", [])
+                    self.loot_table = list(enemy_data.get("loot_table", []))
+                    self.habilidades = list(enemy_data.get("habilidades", []))
+                    self.abilities = create_abilities(self.habilidades)
+                    self.ai_type = enemy_data.get("ai", self.ai_type)
+                    self.ai_budget_ms = enemy_data.get("ai_budget_ms", self.ai_budget_ms)
                     
                     # Cargar stats
                     stats = enemy_data.get("stats", {})
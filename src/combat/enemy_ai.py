@@ -0,0 +1,303 @@
+"""
+IA de enemigos - decide la acción de cada turno enemigo
+
+Cada Enemy tiene un ai_type ("ai" en enemies_base.json) que elige una de
+las clases de AI_TYPES. Todas trabajan sobre un CombatSnapshot, nunca sobre
+el combate real:
+
+    decision = create_ai(enemy.ai_type).decide(CombatSnapshot.from_combat(cm), budget_ms)
+    ...
+    if decision.ready:
+        choice = decision.finish()
+
+Las IAs simples deciden en el momento. ExpectimaxAI busca en un hilo de
+fondo con profundización iterativa: después de cada profundidad completa
+publica la mejor acción encontrada, y al agotarse el presupuesto de tiempo
+se queda con esa. El combate solo consulta decision.ready en update(), así
+que un jefe difícil nunca congela el frame.
+"""
+
+import threading
+import time
+import numpy as np
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Optional, Type
+from src.config import ENEMY_AI_MAX_DEPTH
+from src.combat.combat_snapshot import HP, ActionChoice, CombatSnapshot
+
+HEAL_THRESHOLD = 0.5  # DefensiveAI cura aliados por debajo de esta fracción de HP
+WIN_SCORE = 100.0
+
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Hilo compartido de la IA (se crea al primer uso)"""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="enemy-ai")
+    return _executor
+
+
+class _SearchTimeout(Exception):
+    """Se acabó el presupuesto de la búsqueda"""
+
+
+class AIDecision:
+    """Decisión en curso (puede seguir calculándose en el hilo de la IA)"""
+
+    def __init__(self, budget_ms: float):
+        """
+        Inicializa la decisión
+
+        Args:
+            budget_ms: Tiempo máximo de búsqueda
+        """
+        self.best: Optional[ActionChoice] = None
+        self.depth = 0  # Profundidad completa más grande alcanzada
+        self.nodes = 0
+        self.deadline = time.perf_counter() + budget_ms / 1000.0
+        self.future: Optional[Future] = None
+        self._stop = threading.Event()
+
+    @property
+    def stopped(self) -> bool:
+        """True si la búsqueda tiene que terminar (cancelada o sin tiempo)"""
+        return self._stop.is_set() or time.perf_counter() >= self.deadline
+
+    @property
+    def ready(self) -> bool:
+        """True si ya se puede usar la acción (búsqueda terminada o sin tiempo)"""
+        return self.future is None or self.future.done() or time.perf_counter() >= self.deadline
+
+    def finish(self) -> Optional[ActionChoice]:
+        """
+        Detiene la búsqueda y retorna la mejor acción encontrada
+
+        Returns:
+            ActionChoice o None si no hay acciones posibles
+        """
+        self._stop.set()
+        return self.best
+
+    def cancel(self):
+        """Detiene la búsqueda sin usar el resultado"""
+        self._stop.set()
+
+
+def evaluate(snapshot: CombatSnapshot, team: int) -> float:
+    """
+    Puntaje de un snapshot desde el punto de vista de un bando
+
+    Suma la fracción de HP (más medio punto por combatiente vivo) del bando
+    y resta la del rival, todo sobre las columnas del snapshot. Ganar o perder vale ±WIN_SCORE.
+
+    Args:
+        snapshot: Estado a evaluar
+        team: PARTY o ENEMIES
+
+    Returns:
+        Puntaje (más alto = mejor para team)
+    """
+    winner = snapshot.winner()
+    if winner is not None:
+        return WIN_SCORE if winner == team else -WIN_SCORE
+    hp = snapshot.stats[:, HP]
+    values = hp / np.maximum(snapshot.max_hp, 1) + 0.5 * (hp > 0)
+    own = snapshot.team == team
+    return float(values[own].sum() - values[~own].sum())
+
+
+class EnemyAI:
+    """Base de las IAs: choose() calcula y deja el resultado en decision.best"""
+
+    threaded = False  # True si choose() corre en el hilo de la IA
+
+    def decide(self, snapshot: CombatSnapshot, budget_ms: float) -> AIDecision:
+        """
+        Empieza a decidir la acción del combatiente que tiene el turno
+
+        Args:
+            snapshot: Copia del combate (la IA puede modificarla)
+            budget_ms: Tiempo máximo de búsqueda
+
+        Returns:
+            AIDecision (ready en cuanto se puede usar)
+        """
+        decision = AIDecision(budget_ms)
+        # Decidir con los estados del turno ya aplicados (el combate los aplica igual)
+        snapshot.begin_turn()
+        if not snapshot.alive(snapshot.actor):
+            return decision
+        if self.threaded:
+            decision.future = _get_executor().submit(self._run, snapshot, decision)
+        else:
+            self.choose(snapshot, decision)
+        return decision
+
+    def _run(self, snapshot: CombatSnapshot, decision: AIDecision):
+        """Envoltorio del hilo: un error no debe perder la decisión"""
+        try:
+            self.choose(snapshot, decision)
+        except Exception as e:
+            print(f"[ERROR] IA de enemigos: {e}")
+
+    def choose(self, snapshot: CombatSnapshot, decision: AIDecision):
+        """
+        Elige la acción y la deja en decision.best (las subclases la
+        redefinen; la base ataca al primer rival vivo)
+
+        Args:
+            snapshot: Estado con el turno del combatiente que decide
+            decision: Decisión donde publicar la acción
+        """
+        team = snapshot.team[snapshot.actor]
+        for row in range(len(snapshot)):
+            if snapshot.team[row] != team and snapshot.alive(row):
+                decision.best = ActionChoice(None, (row,))
+                return
+
+
+class BasicAI(EnemyAI):
+    """Ataca al primer rival vivo (el comportamiento de la base)"""
+
+
+class AggressiveAI(EnemyAI):
+    """Elige la acción que deja el mejor puntaje inmediato"""
+
+    def choose(self, snapshot: CombatSnapshot, decision: AIDecision):
+        decision.best = greedy_choice(snapshot)
+
+
+class DefensiveAI(EnemyAI):
+    """Cura al aliado más herido si hace falta; si no, juega como AggressiveAI"""
+
+    def choose(self, snapshot: CombatSnapshot, decision: AIDecision):
+        team = snapshot.team[snapshot.actor]
+        heals = [
+            action for action in snapshot.legal_actions()
+            if action.ability_id is not None and all(snapshot.team[row] == team for row in action.targets)
+        ]
+
+        def lowest_hp_fraction(action: ActionChoice) -> float:
+            return min(snapshot.hp(row) / snapshot.max_hp[row] for row in action.targets)
+
+        wounded = [action for action in heals if lowest_hp_fraction(action) < HEAL_THRESHOLD]
+        if wounded:
+            decision.best = min(wounded, key=lowest_hp_fraction)
+        else:
+            decision.best = greedy_choice(snapshot)
+
+
+def greedy_choice(snapshot: CombatSnapshot) -> Optional[ActionChoice]:
+    """
+    Acción con mejor puntaje después de jugarla (sin mirar más adelante)
+
+    Args:
+        snapshot: Estado actual
+
+    Returns:
+        ActionChoice o None si no hay acciones
+    """
+    team = snapshot.team[snapshot.actor]
+    best, best_score = None, float("-inf")
+    for action in snapshot.legal_actions():
+        child = snapshot.clone()
+        child.apply(action)
+        score = evaluate(child, team)
+        if score > best_score:
+            best, best_score = action, score
+    return best
+
+
+class ExpectimaxAI(EnemyAI):
+    """
+    Búsqueda expectimax con tiempo limitado
+
+    Los turnos del bando de la IA son nodos max. Los del rival son nodos
+    de azar (promedio de sus acciones), porque no sabemos qué elegirá el
+    jugador. Profundidad en turnos, con profundización iterativa.
+    """
+
+    threaded = True
+
+    def __init__(self, max_depth: int = ENEMY_AI_MAX_DEPTH):
+        self.max_depth = max_depth
+
+    def choose(self, snapshot: CombatSnapshot, decision: AIDecision):
+        team = snapshot.team[snapshot.actor]
+        actions = snapshot.legal_actions()
+        if not actions:
+            return
+        # Respuesta inmediata por si el presupuesto no alcanza ni para profundidad 1
+        decision.best = greedy_choice(snapshot)
+
+        for depth in range(1, self.max_depth + 1):
+            try:
+                scores = []
+                for action in actions:
+                    child = snapshot.clone()
+                    child.apply(action)
+                    scores.append(self._value(child, depth - 1, team, decision))
+            except _SearchTimeout:
+                return
+
+            best_index = max(range(len(actions)), key=lambda i: scores[i])
+            decision.best = actions[best_index]
+            decision.depth = depth
+            # Probar primero la mejor en la próxima iteración
+            actions.insert(0, actions.pop(best_index))
+
+            if abs(scores[best_index]) >= WIN_SCORE:
+                return  # Resultado forzado: no hace falta mirar más lejos
+
+    def _value(self, snapshot: CombatSnapshot, depth: int, team: int, decision: AIDecision) -> float:
+        """Valor expectimax de un snapshot"""
+        if decision.stopped:
+            raise _SearchTimeout()
+        decision.nodes += 1
+
+        if depth == 0 or snapshot.winner() is not None:
+            return evaluate(snapshot, team)
+
+        actions = snapshot.legal_actions()
+        if not actions:
+            child = snapshot.clone()
+            child.apply(None)
+            return self._value(child, depth - 1, team, decision)
+
+        values = []
+        for action in actions:
+            child = snapshot.clone()
+            child.apply(action)
+            values.append(self._value(child, depth - 1, team, decision))
+
+        if snapshot.team[snapshot.actor] == team:
+            return max(values)
+        return sum(values) / len(values)
+
+
+# IAs por nombre (el "ai" de cada enemigo en enemies_base.json)
+AI_TYPES: Dict[str, Type[EnemyAI]] = {
+    "basic": BasicAI,
+    "aggressive": AggressiveAI,
+    "defensive": DefensiveAI,
+    "expectimax": ExpectimaxAI,
+}
+
+
+def create_ai(ai_type: str) -> EnemyAI:
+    """
+    Crea la IA de un tipo
+
+    Args:
+        ai_type: Nombre en AI_TYPES (los desconocidos usan "basic")
+
+    Returns:
+        Instancia de EnemyAI
+    """
+    ai_class = AI_TYPES.get(ai_type)
+    if ai_class is None:
+        print(f"[WARNING] Tipo de IA desconocido: {ai_type}, usando basic")
+        ai_class = BasicAI
+    return ai_class()
@@ -0,0 +1,443 @@
+"""
+Simulador de combate por lotes - para pruebas de balance
+
+CombatManager trabaja con Character/Enemy vivos (sprites, animaciones), así
+que no sirve para correr miles de combates. Este módulo es un núcleo de
+combate sin pygame: los combatientes son bloques de stats cargados de data/
+y cada combate es un CombatSnapshot (clonado de una plantilla) que juega
+los turnos con las reglas de CombatManager: una línea de tiempo de
+iniciativa (ver src/combat/timeline.py) donde cada acción cuesta
+TIMELINE_ACTION_COST / VEL efectiva, así que los rápidos actúan más seguido;
+una ronda dura tantos turnos como combatientes vivos había al empezarla y los
+caídos salen de la línea de tiempo. Los estados se aplican al inicio de cada
+turno y los cooldowns bajan tras cada acción y al cerrar la ronda.
+
+    simulator = CombatSimulator.from_ids([1, 2], [1001, 1002])
+    report = simulator.run(10000, seed=7, workers=4)
+    print(report.format())
+
+Cada combate usa su propio random.Random sembrado con (seed, índice del
+combate), así que el resultado es el mismo con uno o con varios procesos.
+"""
+
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+import numpy as np
+
+from src.config import COMBAT_SIM_MAX_ROUNDS, COMBAT_SIM_CHUNK_SIZE
+from src.combat.ability import Ability, load_ability_table
+from src.combat.combat_snapshot import HP, PARTY, ENEMIES, ActionChoice, CombatSnapshot
+from src.utils.data_loader import load_data
+
+HEAL_THRESHOLD = 0.5  # La política básica cura aliados por debajo de esta fracción de HP
+
+
+def character_block(character_id: int, level: int = 1) -> Dict:
+    """
+    Arma el bloque de stats de un personaje jugable
+
+    Args:
+        character_id: ID en data/characters/character_base.json
+        level: Nivel (aplica crecimiento_stats por cada nivel sobre el 1)
+
+    Returns:
+        Bloque con nombre, elemento, level, stats y habilidades
+
+    Raises:
+        KeyError: Si el personaje no existe
+    """
+    for data in load_data("characters/character_base.json").get("characters", []):
+        if data.get("id") == character_id:
+            growth = data.get("crecimiento_stats", {})
+            stats = {
+                stat: value + growth.get(stat, 0) * (level - 1)
+                for stat, value in data.get("stats_base", {}).items()
+            }
+            return {
+                "nombre": data.get("nombre", f"Personaje {character_id}"),
+                "elemento": data.get("elemento"),
+                "level": level,
+                "stats": stats,
+                "habilidades": list(data.get("habilidades", [])),
+            }
+    raise KeyError(f"Personaje {character_id} no encontrado")
+
+
+def enemy_block(enemy_id: int) -> Dict:
+    """
+    Arma el bloque de stats de un enemigo
+
+    Args:
+        enemy_id: ID en data/enemies/enemies_base.json
+
+    Returns:
+        Bloque con nombre, elemento, level, stats y habilidades
+
+    Raises:
+        KeyError: Si el enemigo no existe
+    """
+    for data in load_data("enemies/enemies_base.json").get("enemies", []):
+        if data.get("id") == enemy_id:
+            return {
+                "nombre": data.get("nombre", f"Enemigo {enemy_id}"),
+                "elemento": data.get("elemento"),
+                "level": data.get("nivel", 1),
+                "stats": dict(data.get("stats", {})),
+                "habilidades": list(data.get("habilidades", [])),
+            }
+    raise KeyError(f"Enemigo {enemy_id} no encontrado")
+
+
+# Una política elige la acción del combatiente que tiene el turno en el snapshot
+Policy = Callable[[CombatSnapshot, random.Random], Optional[ActionChoice]]
+
+
+def _rows(snapshot: CombatSnapshot, actor: int) -> Tuple[List[int], List[int]]:
+    """Filas de aliados y enemigos vivos del actor"""
+    team = snapshot.team[actor]
+    allies = [row for row in range(len(snapshot)) if snapshot.team[row] == team and snapshot.alive(row)]
+    foes = [row for row in range(len(snapshot)) if snapshot.team[row] != team and snapshot.alive(row)]
+    return allies, foes
+
+
+def basic_policy(snapshot: CombatSnapshot, rng: random.Random) -> Optional[ActionChoice]:
+    """Cura al aliado más herido si hace falta, si no usa el ataque más fuerte disponible"""
+    actor = snapshot.actor
+    allies, foes = _rows(snapshot, actor)
+    usable = snapshot.usable_abilities(actor)
+
+    wounded = [row for row in allies if snapshot.hp(row) < snapshot.max_hp[row] * HEAL_THRESHOLD]
+    healers = [spec for spec in usable if spec.heal > 0]
+    if wounded and healers:
+        target = min(wounded, key=lambda row: snapshot.hp(row) / snapshot.max_hp[row])
+        return ActionChoice(max(healers, key=lambda spec: spec.heal).id, (target,))
+
+    attacks = [spec for spec in usable if spec.damage > 0]
+    if attacks:
+        spec = max(attacks, key=lambda spec: spec.damage)
+        return ActionChoice(spec.id, tuple(foes) if spec.target_all else (rng.choice(foes),))
+    return ActionChoice(None, (rng.choice(foes),))
+
+
+def random_policy(snapshot: CombatSnapshot, rng: random.Random) -> Optional[ActionChoice]:
+    """Elige al azar entre el ataque básico y las habilidades disponibles"""
+    actor = snapshot.actor
+    allies, foes = _rows(snapshot, actor)
+    spec = rng.choice([None] + snapshot.usable_abilities(actor))
+    if spec is None:
+        return ActionChoice(None, (rng.choice(foes),))
+    candidates = allies if spec.supports else foes
+    return ActionChoice(spec.id, tuple(candidates) if spec.target_all else (rng.choice(candidates),))
+
+
+# Políticas por nombre (los procesos del pool las reciben por nombre)
+POLICIES: Dict[str, Policy] = {
+    "basic": basic_policy,
+    "random": random_policy,
+}
+
+
+class _FightLog:
+    """Valores crudos de un lote de combates (se pasan a histogramas al final)"""
+
+    def __init__(self, combatants: int):
+        self.damage: List[int] = []
+        self.heal: List[int] = []
+        self.status_damage = 0
+        self.damage_by_combatant = [0] * combatants
+        self.heal_by_combatant = [0] * combatants
+
+
+def build_abilities(ability_table: Dict[int, Dict]) -> Dict[int, Ability]:
+    """
+    Construye una Ability por cada entrada de la tabla (una vez por lote)
+
+    Args:
+        ability_table: Habilidades por id (ver load_ability_table)
+
+    Returns:
+        Diccionario id -> Ability
+    """
+    return {ability_id: Ability(ability_id, data.get("nombre", ""), data)
+            for ability_id, data in ability_table.items()}
+
+
+def run_fight(template: CombatSnapshot, policy: Policy, rng: random.Random,
+              max_rounds: int = COMBAT_SIM_MAX_ROUNDS,
+              log: Optional[_FightLog] = None) -> Tuple[Optional[int], int, List[bool]]:
+    """
+    Simula un combate completo
+
+    Args:
+        template: Estado inicial (se clona, no se modifica)
+        policy: Política que elige las acciones de ambos bandos
+        rng: Generador aleatorio del combate
+        max_rounds: Rondas antes de declarar empate
+        log: Registro donde sumar daño y curación (opcional)
+
+    Returns:
+        Tupla (bando ganador o None si hubo empate, rondas jugadas,
+        vivos por combatiente en orden party + enemigos)
+    """
+    snapshot = template.clone()
+    winner = None
+    while snapshot.turn_count < max_rounds:
+        actor = snapshot.actor
+        # Estados primero: la política decide con el HP ya actualizado
+        snapshot.begin_turn()
+        turn = snapshot.apply(policy(snapshot, rng) if snapshot.alive(actor) else None)
+
+        if log is not None:
+            log.status_damage += turn["status"]["damage"]
+            for result in turn["action_results"]:
+                if result["damage"]:
+                    log.damage.append(result["damage"])
+                    log.damage_by_combatant[actor] += result["damage"]
+                if result["heal"]:
+                    log.heal.append(result["heal"])
+                    log.heal_by_combatant[actor] += result["heal"]
+
+        winner = snapshot.winner()
+        if winner is not None:
+            break
+
+    rounds = snapshot.turn_count + 1 if winner is not None else max_rounds
+    return winner, rounds, (snapshot.stats[:, HP] > 0).tolist()
+
+
+def _add_histogram(histogram: np.ndarray, other: np.ndarray) -> np.ndarray:
+    """Suma dos histogramas de largo distinto"""
+    if len(other) > len(histogram):
+        histogram, other = other, histogram
+    result = histogram.copy()
+    result[:len(other)] += other
+    return result
+
+
+def _histogram_stats(histogram: np.ndarray) -> Dict[str, float]:
+    """Promedio, percentiles y máximo de un histograma de valores enteros"""
+    count = int(histogram.sum())
+    if count == 0:
+        return {"count": 0, "mean": 0.0, "p50": 0.0, "p95": 0.0, "max": 0.0}
+    values = np.arange(len(histogram))
+    cumulative = np.cumsum(histogram)
+    return {
+        "count": count,
+        "mean": float((values * histogram).sum() / count),
+        "p50": float(np.searchsorted(cumulative, count * 0.50)),
+        "p95": float(np.searchsorted(cumulative, count * 0.95)),
+        "max": float(np.flatnonzero(histogram)[-1]),
+    }
+
+
+class SimulationReport:
+    """Resultados agregados de un lote de combates"""
+
+    def __init__(self, names: List[str], party_size: int):
+        """
+        Inicializa un reporte vacío
+
+        Args:
+            names: Nombres de los combatientes (party + enemigos)
+            party_size: Cuántos de ellos son del grupo
+        """
+        self.names = names
+        self.party_size = party_size
+        self.fights = 0
+        self.party_wins = 0
+        self.enemy_wins = 0
+        self.draws = 0
+        self.status_damage = 0
+        # Histogramas: posición = valor, contenido = cantidad de veces
+        self.rounds = np.zeros(0, dtype=np.int64)
+        self.damage = np.zeros(0, dtype=np.int64)
+        self.heal = np.zeros(0, dtype=np.int64)
+        self.damage_by_combatant = np.zeros(len(names), dtype=np.int64)
+        self.heal_by_combatant = np.zeros(len(names), dtype=np.int64)
+        self.survivals = np.zeros(len(names), dtype=np.int64)
+
+    def merge(self, other: "SimulationReport"):
+        """Suma otro reporte (de otro lote) a este"""
+        self.fights += other.fights
+        self.party_wins += other.party_wins
+        self.enemy_wins += other.enemy_wins
+        self.draws += other.draws
+        self.status_damage += other.status_damage
+        self.rounds = _add_histogram(self.rounds, other.rounds)
+        self.damage = _add_histogram(self.damage, other.damage)
+        self.heal = _add_histogram(self.heal, other.heal)
+        self.damage_by_combatant += other.damage_by_combatant
+        self.heal_by_combatant += other.heal_by_combatant
+        self.survivals += other.survivals
+
+    @property
+    def win_rate(self) -> float:
+        """Fracción de combates ganados por el grupo"""
+        return self.party_wins / self.fights if self.fights else 0.0
+
+    @property
+    def average_rounds(self) -> float:
+        """Rondas promedio por combate"""
+        return _histogram_stats(self.rounds)["mean"]
+
+    def summary(self) -> Dict:
+        """
+        Resumen serializable del reporte
+
+        Returns:
+            Diccionario con conteos, distribuciones y totales por combatiente
+        """
+        fights = max(1, self.fights)
+        return {
+            "fights": self.fights,
+            "party_wins": self.party_wins,
+            "enemy_wins": self.enemy_wins,
+            "draws": self.draws,
+            "win_rate": self.win_rate,
+            "rounds": _histogram_stats(self.rounds),
+            "damage": _histogram_stats(self.damage),
+            "heal": _histogram_stats(self.heal),
+            "status_damage_per_fight": self.status_damage / fights,
+            "combatants": [
+                {
+                    "nombre": name,
+                    "bando": "party" if i < self.party_size else "enemigos",
+                    "damage_per_fight": float(self.damage_by_combatant[i]) / fights,
+                    "heal_per_fight": float(self.heal_by_combatant[i]) / fights,
+                    "survival_rate": float(self.survivals[i]) / fights,
+                }
+                for i, name in enumerate(self.names)
+            ],
+        }
+
+    def format(self) -> str:
+        """Resumen legible para la consola"""
+        summary = self.summary()
+        lines = [
+            f"Combates: {self.fights}",
+            f"Victorias: {self.party_wins} ({100.0 * self.win_rate:.1f}%)  "
+            f"Derrotas: {self.enemy_wins}  Empates: {self.draws}",
+        ]
+        for key, label in (("rounds", "Rondas"), ("damage", "Daño por golpe"), ("heal", "Curación")):
+            stats = summary[key]
+            lines.append(f"{label}: promedio {stats['mean']:.2f}  p50 {stats['p50']:.0f}  "
+                         f"p95 {stats['p95']:.0f}  máx {stats['max']:.0f}  (n={stats['count']})")
+        lines.append(f"Daño por estados: {summary['status_damage_per_fight']:.2f} por combate")
+        for combatant in summary["combatants"]:
+            lines.append(f"  [{combatant['bando']}] {combatant['nombre']}: "
+                         f"daño {combatant['damage_per_fight']:.1f}  "
+                         f"curación {combatant['heal_per_fight']:.1f}  "
+                         f"sobrevive {100.0 * combatant['survival_rate']:.1f}%")
+        return "\n".join(lines)
+
+
+def _run_chunk(setup: Tuple, seed: int, start: int, count: int) -> SimulationReport:
+    """
+    Simula los combates [start, start + count) (función de nivel de módulo
+    para que ProcessPoolExecutor pueda enviarla a otro proceso)
+    """
+    party_blocks, enemy_blocks, ability_table, policy_name, max_rounds = setup
+    policy = POLICIES[policy_name]
+    template = CombatSnapshot.from_blocks(party_blocks, enemy_blocks, build_abilities(ability_table))
+    names = [block["nombre"] for block in party_blocks + enemy_blocks]
+    report = SimulationReport(names, len(party_blocks))
+    log = _FightLog(len(names))
+    rounds = []
+    rng = random.Random()
+
+    for fight in range(start, start + count):
+        rng.seed(f"{seed}:{fight}")
+        winner, fight_rounds, alive = run_fight(template, policy, rng, max_rounds, log)
+        if winner == PARTY:
+            report.party_wins += 1
+        elif winner == ENEMIES:
+            report.enemy_wins += 1
+        else:
+            report.draws += 1
+        rounds.append(fight_rounds)
+        report.survivals += np.asarray(alive, dtype=np.int64)
+
+    report.fights = count
+    report.status_damage = log.status_damage
+    report.rounds = np.bincount(np.asarray(rounds, dtype=np.int64)) if rounds else report.rounds
+    report.damage = np.bincount(np.asarray(log.damage, dtype=np.int64)) if log.damage else report.damage
+    report.heal = np.bincount(np.asarray(log.heal, dtype=np.int64)) if log.heal else report.heal
+    report.damage_by_combatant = np.asarray(log.damage_by_combatant, dtype=np.int64)
+    report.heal_by_combatant = np.asarray(log.heal_by_combatant, dtype=np.int64)
+    return report
+
+
+class CombatSimulator:
+    """Corre lotes de combates entre un grupo y un conjunto de enemigos"""
+
+    def __init__(self, party_blocks: List[Dict], enemy_blocks: List[Dict], policy: str = "basic",
+                 max_rounds: int = COMBAT_SIM_MAX_ROUNDS, ability_table: Optional[Dict[int, Dict]] = None):
+        """
+        Inicializa el simulador
+
+        Args:
+            party_blocks: Bloques de stats del grupo
+            enemy_blocks: Bloques de stats de los enemigos
+            policy: Nombre de la política de acciones (ver POLICIES)
+            max_rounds: Rondas antes de declarar empate
+            ability_table: Habilidades por id (por defecto las de data/abilities/)
+        """
+        if policy not in POLICIES:
+            raise ValueError(f"Política desconocida: {policy} (opciones: {', '.join(POLICIES)})")
+        self.party_blocks = party_blocks
+        self.enemy_blocks = enemy_blocks
+        self.policy = policy
+        self.max_rounds = max_rounds
+        self.ability_table = ability_table if ability_table is not None else load_ability_table()
+
+    @classmethod
+    def from_ids(cls, character_ids: List[int], enemy_ids: List[int], level: int = 1,
+                 **kwargs) -> "CombatSimulator":
+        """
+        Crea un simulador con personajes y enemigos de data/
+
+        Args:
+            character_ids: IDs de los personajes del grupo
+            enemy_ids: IDs de los enemigos
+            level: Nivel del grupo
+            **kwargs: Resto de argumentos de CombatSimulator
+
+        Returns:
+            CombatSimulator listo para correr
+        """
+        party = [character_block(character_id, level) for character_id in character_ids]
+        enemies = [enemy_block(enemy_id) for enemy_id in enemy_ids]
+        return cls(party, enemies, **kwargs)
+
+    def run(self, fights: int, seed: int = 0, workers: int = 1,
+            chunk_size: int = COMBAT_SIM_CHUNK_SIZE) -> SimulationReport:
+        """
+        Simula un lote de combates
+
+        Args:
+            fights: Cantidad de combates
+            seed: Semilla del lote (mismo seed = mismo reporte)
+            workers: Procesos a usar (1 = en este proceso, 0 = todos los núcleos)
+            chunk_size: Combates por tarea
+
+        Returns:
+            SimulationReport con los resultados
+        """
+        setup = (self.party_blocks, self.enemy_blocks, self.ability_table, self.policy, self.max_rounds)
+        chunks = [(start, min(chunk_size, fights - start)) for start in range(0, fights, chunk_size)]
+        names = [block["nombre"] for block in self.party_blocks + self.enemy_blocks]
+        report = SimulationReport(names, len(self.party_blocks))
+
+        workers = workers or os.cpu_count() or 1
+        if workers == 1 or len(chunks) <= 1:
+            for start, count in chunks:
+                report.merge(_run_chunk(setup, seed, start, count))
+            return report
+
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as executor:
+            futures = [executor.submit(_run_chunk, setup, seed, start, count) for start, count in chunks]
+            for future in futures:
+                report.merge(future.result())
+        return report
@@ -0,0 +1,204 @@
+"""
+Línea de tiempo de iniciativa (estilo ATB)
+
+Cada combatiente tiene el momento de su próxima acción en una cola de
+prioridad (heapq). Después de actuar vuelve a la cola a
+TIMELINE_ACTION_COST / VEL efectiva de distancia, así que los rápidos
+actúan más seguido y un buff o debuff de velocidad se nota enseguida.
+
+    timeline.add(combatant, effective_vel(combatant))
+    actor = timeline.peek()
+    ...
+    timeline.advance(effective_vel(actor))
+
+peek y advance son O(log n). Quitar o reprogramar a alguien deja su
+entrada vieja en la cola y la descarta cuando llega al frente (borrado
+perezoso). preview(k) calcula los próximos k turnos para la interfaz sin
+modificar la cola.
+
+Las claves pueden ser cualquier objeto hasheable: Character/Enemy en
+CombatManager, filas de CombatSnapshot en la búsqueda y el simulador.
+"""
+
+import heapq
+from typing import Any, Dict, Hashable, List, Mapping, Optional, Tuple
+from src.config import TIMELINE_ACTION_COST
+
+
+def effective_vel(combatant) -> int:
+    """
+    VEL efectiva: la base más los modificadores de sus estados (mínimo 1)
+
+    Args:
+        combatant: Objeto con stats (y opcionalmente status_manager)
+
+    Returns:
+        Velocidad usada por la línea de tiempo
+    """
+    vel = combatant.stats.get("VEL", 0)
+    status_manager = getattr(combatant, "status_manager", None)
+    if status_manager is not None:
+        vel += status_manager.get_stat_modifiers().get("VEL", 0)
+    return max(1, vel)
+
+
+class InitiativeTimeline:
+    """Cola de prioridad con el momento de la próxima acción de cada combatiente"""
+
+    def __init__(self, action_cost: float = TIMELINE_ACTION_COST):
+        """
+        Inicializa una línea de tiempo vacía
+
+        Args:
+            action_cost: Tiempo que espera un combatiente con VEL 1 entre acciones
+        """
+        self.action_cost = action_cost
+        self.time = 0.0
+        self._heap: List[Tuple[float, int, Any]] = []  # (momento, secuencia, clave)
+        self._seq: Dict[Hashable, int] = {}  # Secuencia de la entrada válida de cada clave
+        self._speed: Dict[Hashable, float] = {}  # VEL con la que se programó
+        self._when: Dict[Hashable, float] = {}  # Momento programado
+        self._next_seq = 0
+
+    def __len__(self) -> int:
+        return len(self._seq)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._seq
+
+    def _push(self, key: Hashable, when: float, speed: float):
+        """Programa la próxima acción de una clave (invalida la anterior)"""
+        seq = self._next_seq
+        self._next_seq += 1
+        self._seq[key] = seq
+        self._speed[key] = speed
+        self._when[key] = when
+        heapq.heappush(self._heap, (when, seq, key))
+        if len(self._heap) > 2 * len(self._seq) + 16:
+            # Demasiadas entradas viejas: reconstruir la cola con las válidas
+            self._heap = [entry for entry in self._heap if self._seq.get(entry[2]) == entry[1]]
+            heapq.heapify(self._heap)
+
+    def _discard_stale(self):
+        """Saca del frente las entradas de claves quitadas o reprogramadas"""
+        heap = self._heap
+        while heap and self._seq.get(heap[0][2]) != heap[0][1]:
+            heapq.heappop(heap)
+
+    def add(self, key: Hashable, speed: float):
+        """
+        Agrega un combatiente: su primera acción llega tras una espera completa
+
+        A igual velocidad actúa primero el que se agregó antes.
+
+        Args:
+            key: Combatiente
+            speed: VEL efectiva
+        """
+        speed = max(1, speed)
+        self._push(key, self.time + self.action_cost / speed, speed)
+
+    def remove(self, key: Hashable):
+        """
+        Quita un combatiente (por ejemplo, al caer)
+
+        Args:
+            key: Combatiente
+        """
+        self._seq.pop(key, None)
+        self._speed.pop(key, None)
+        self._when.pop(key, None)
+
+    def peek(self) -> Optional[Any]:
+        """Combatiente que actúa ahora (None si la línea está vacía)"""
+        self._discard_stale()
+        return self._heap[0][2] if self._heap else None
+
+    def advance(self, speed: float) -> Optional[Any]:
+        """
+        Cierra el turno del combatiente actual y lo vuelve a programar
+
+        Args:
+            speed: VEL efectiva del combatiente actual (la de después de actuar)
+
+        Returns:
+            El combatiente que terminó su turno (None si la línea está vacía)
+        """
+        self._discard_stale()
+        if not self._heap:
+            return None
+        when, _, key = heapq.heappop(self._heap)
+        self.time = when
+        speed = max(1, speed)
+        self._push(key, when + self.action_cost / speed, speed)
+        return key
+
+    def refresh(self, key: Hashable, speed: float):
+        """
+        Ajusta la espera de un combatiente cuya VEL cambió
+
+        La parte de la espera que falta se escala por vieja / nueva VEL: un
+        buff a mitad de camino adelanta la acción, un debuff la atrasa.
+
+        Args:
+            key: Combatiente
+            speed: VEL efectiva nueva
+        """
+        speed = max(1, speed)
+        old_speed = self._speed.get(key)
+        if old_speed is None or old_speed == speed:
+            return
+        remaining = max(0.0, self._when[key] - self.time) * old_speed / speed
+        self._push(key, self.time + remaining, speed)
+
+    def preview(self, count: int) -> List[Any]:
+        """
+        Próximos turnos, suponiendo que nadie cambia de velocidad
+
+        Args:
+            count: Cantidad de turnos a mostrar
+
+        Returns:
+            Combatientes en orden de acción (se repiten si actúan varias veces)
+        """
+        heap = [entry for entry in self._heap if self._seq.get(entry[2]) == entry[1]]
+        heapq.heapify(heap)
+        order = []
+        seq = self._next_seq
+        while heap and len(order) < count:
+            when, _, key = heapq.heappop(heap)
+            order.append(key)
+            heapq.heappush(heap, (when + self.action_cost / self._speed[key], seq, key))
+            seq += 1
+        return order
+
+    def copy(self, keys: Optional[Mapping[Hashable, Hashable]] = None) -> "InitiativeTimeline":
+        """
+        Copia independiente de la línea de tiempo
+
+        Args:
+            keys: Traducción de claves (por ejemplo, combatiente -> fila de
+                un snapshot); las claves sin traducción se descartan
+
+        Returns:
+            InitiativeTimeline con las mismas entradas pendientes
+        """
+        timeline = InitiativeTimeline(self.action_cost)
+        timeline.time = self.time
+        timeline._next_seq = self._next_seq
+        if keys is None:
+            timeline._heap = list(self._heap)
+            timeline._seq = dict(self._seq)
+            timeline._speed = dict(self._speed)
+            timeline._when = dict(self._when)
+            return timeline
+
+        for when, seq, key in self._heap:
+            if self._seq.get(key) == seq and key in keys:
+                new_key = keys[key]
+                timeline._heap.append((when, seq, new_key))
+                timeline._seq[new_key] = seq
+                timeline._speed[new_key] = self._speed[key]
+                timeline._when[new_key] = when
+        heapq.heapify(timeline._heap)
+        return timeline
@@ -14,13 +14,91 @@ SAVES_DIR = os.path.join(BASE_DIR, "saves")
 SCREEN_WIDTH = 1280
 SCREEN_HEIGHT = 720
 FPS = 60
+SIMULATION_TICK_RATE = 60  # Ticks de lógica por segundo (paso fijo, independiente de FPS)
+MAX_SIMULATION_STEPS_PER_FRAME = 5  # Ticks máximos por frame tras un frame lento
 TITLE = "El Gremio del Sol Naciente"
+DIRTY_RECTS_ENABLED = True  # Los menús estáticos solo redibujan lo que cambia (ver GameState.mark_dirty)
 
 # Configuración de tiles
 TILE_SIZE = 32
 MAP_WIDTH = 50  # Tiles
 MAP_HEIGHT = 50  # Tiles
 
+# Caché de chunks pre-renderizados del mapa
+MAP_CHUNK_TILES = 16  # Tiles por lado de cada chunk
+MAP_CHUNK_CACHE_SIZE = 48  # Máximo de chunks en memoria (LRU)
+
+# Índice espacial de objetos de colisión/eventos
+SPATIAL_GRID_CELL = TILE_SIZE * 4  # Tamaño de celda en píxeles
+
+# Caché de mapas cargados y precarga de mapas vecinos
+MAP_CACHE_SIZE = 4  # Máximo de mapas leídos en memoria (LRU)
+MAP_PRELOAD_NEIGHBORS = True  # Precargar en segundo plano los destinos de los eventos map_*
+
+# Mundo por regiones (streaming de mapas grandes)
+WORLD_REGION_TILES = 32  # Tiles por lado de cada región
+WORLD_LOAD_MARGIN = 1  # Regiones extra cargadas alrededor de la vista
+WORLD_MEMORY_BUDGET_MB = 96  # Memoria máxima de regiones cargadas
+
+# Atlas de texturas (generados con build_atlases.py)
+ATLAS_DIR = os.path.join(ASSETS_DIR, "atlases")
+ATLAS_PAGE_SIZE = 2048  # Tamaño máximo de cada página del atlas en píxeles
+ATLAS_TILESETS = [  # Tilesets que se empaquetan tile a tile
+    "tilesets/base_grass.png",
+    "tilesets/exterior.png",
+    "tilesets/house_details.png",
+    "tilesets/legacy_Buildings.png",
+    "tilesets/legacy_Tiles.png",
+    "tilesets/legacy_Tree-Assets.png",
+    "tilesets/Objects.png",
+    "tilesets/Other_objects.png",
+    "tilesets/walls_floor.png",
+    "tilesets/ground_grass_details.png",
+    "tilesets/supplies_objects.png",
+    "tilesets/pedestals.png",
+]
+ATLAS_SPRITE_DIRS = ["sprites", "ui/hud"]  # Carpetas cuyas imágenes se empaquetan enteras
+
+# Presupuesto de memoria de las cachés del ResourceManager (LRU)
+RESOURCE_IMAGE_BUDGET_MB = 256
+RESOURCE_SOUND_BUDGET_MB = 64
+RESOURCE_FONT_BUDGET_MB = 8
+TEXT_CACHE_BUDGET_MB = 4  # Textos renderizados del HUD y los menús (ver src/utils/text_cache.py)
+FIRE_TEXT_CACHE_BUDGET_MB = 8  # Títulos y opciones con efecto de fuego (ver src/utils/fire_text.py)
+FIRE_TEXT_FRAMES = 8  # Frames precalculados del texto de fuego animado
+FIRE_TEXT_FPS = 10
+
+# Partículas (ver src/utils/particles.py)
+PARTICLE_CAPACITY = 32768  # Máximo de partículas vivas por sistema (tamaño del pool)
+PARTICLE_ALPHA_BUCKETS = 16  # Tramos de transparencia con sprite propio
+
+# Caché en disco de imágenes decodificadas (ver src/utils/image_cache.py)
+IMAGE_CACHE_ENABLED = True
+IMAGE_CACHE_DIR = os.path.join(BASE_DIR, ".cache", "images")
+IMAGE_CACHE_MIN_FILE_BYTES = 32 * 1024  # Los PNG más chicos se decodifican directamente
+
+# Carga asíncrona de assets (ver src/asset_loader.py)
+ASSET_LOADER_WORKERS = 4  # Hilos que decodifican imágenes y parsean datos
+ASSET_PUMP_BUDGET_MS = 8  # Tiempo máximo por frame para terminar trabajos en el hilo principal
+
+# Perfilador de frames (ver src/utils/profiler.py)
+PROFILER_ENABLED = True
+PROFILER_HISTORY_FRAMES = 600  # Frames guardados para los percentiles (10 s a 60 FPS)
+PROFILER_OVERLAY_REFRESH = 4  # Veces por segundo que se regenera el overlay (F3)
+PROFILER_DUMP_DIR = os.path.join(BASE_DIR, "profiles")
+
+# Simulador de combate por lotes (ver src/combat/simulator.py)
+COMBAT_SIM_MAX_ROUNDS = 100  # Rondas antes de declarar empate
+COMBAT_SIM_CHUNK_SIZE = 2000  # Combates por tarea en el modo multiproceso
+
+# IA de enemigos (ver src/combat/enemy_ai.py)
+ENEMY_AI_BUDGET_MS = 40  # Tiempo de búsqueda por turno (se puede cambiar por enemigo con "ai_budget_ms")
+ENEMY_AI_MAX_DEPTH = 8  # Profundidad máxima (en turnos) de la búsqueda expectimax
+
+# Línea de tiempo de iniciativa (ver src/combat/timeline.py)
+TIMELINE_ACTION_COST = 1000.0  # Espera entre acciones de un combatiente con VEL 1
+TIMELINE_PREVIEW_TURNS = 6  # Próximos turnos que muestra la interfaz de combate
+
 # Colores (RGB)
 COLOR_BLACK = (0, 0, 0)
 COLOR_WHITE = (255, 255, 255)
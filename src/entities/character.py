@@ -3,12 +3,11 @@ Clase base para personajes
 """
 
 import pygame
-import json
-import os
 from typing import Dict, Optional
-from src.config import DATA_DIR, TILE_SIZE
+from src.config import TILE_SIZE
 from src.entities.animation import SpriteSheet, Direction, Animation
 from src.items.equipment import Equipment
+from src.utils.data_loader import load_data
 
 
 class Character:
@@ -76,9 +75,7 @@ class Character:
     def _load_character_data(self, character_id: int):
         """Carga los datos del personaje desde JSON"""
         try:
-            char_file = os.path.join(DATA_DIR, "characters", "character_base.json")
-            with open(char_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = load_data("characters/character_base.json")
             
             # Buscar el personaje por ID
             for char_data in data.get("characters", []):
@@ -2,16 +2,25 @@
 Clase principal del juego - Loop principal
 """
 
+import argparse
+import os
 import pygame
 import sys
+from typing import Optional
 from src.config import (
-    SCREEN_WIDTH, SCREEN_HEIGHT, FPS, TITLE, 
+    SCREEN_WIDTH, SCREEN_HEIGHT, FPS, TITLE, DIRTY_RECTS_ENABLED,
+    SIMULATION_TICK_RATE, MAX_SIMULATION_STEPS_PER_FRAME,
     STATE_LOADING, STATE_MENU, STATE_EXPLORATION, STATE_PAUSE,
     STATE_INVENTORY, STATE_COMBAT
 )
 from src.state_manager import StateManager
 from src.resource_manager import ResourceManager
+from src.asset_loader import AssetLoader
+from src.scripted_input import ScriptedInput
 from src.utils.rpg_assets import RPGAssetLibrary
+from src.utils.profiler import profiler
+from src.utils.text_cache import text_cache
+from src.utils.fire_text import get_fire_text_stats
 from src.states.loading_state import LoadingState
 from src.states.menu_state import MenuState
 from src.states.exploration_state import ExplorationState
@@ -25,21 +34,52 @@ from src.states.combat_state import CombatState
 class Game:
     """Clase principal que maneja el loop del juego"""
     
-    def __init__(self):
-        """Inicializa Pygame y crea la ventana"""
+    def __init__(self, headless: bool = False, render: bool = True,
+                 input_script: Optional[ScriptedInput] = None):
+        """
+        Inicializa Pygame y crea la ventana
+        
+        Args:
+            headless: Si True, usa los drivers "dummy" de SDL: sin ventana ni
+                audio, la pantalla es una superficie en memoria
+            render: Si False, no se dibuja nada y la simulación corre más
+                rápido que el tiempo real
+            input_script: Entrada programada que reemplaza al teclado
+        """
+        if headless:
+            # Tiene que definirse antes de pygame.init()
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+            os.environ["SDL_AUDIODRIVER"] = "dummy"
         pygame.init()
-        pygame.mixer.init()
+        try:
+            pygame.mixer.init()
+        except pygame.error as e:
+            print(f"[WARNING] No se pudo iniciar el audio: {e}")
         
+        self.headless = headless
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption(TITLE)
         self.clock = pygame.time.Clock()
         
         self.running = True
-        self.dt = 0.0  # Delta time en segundos
+        self.input_script = input_script
+        self.tick_count = 0  # Ticks de simulación desde el inicio
+        
+        # Simulación a paso fijo: update() siempre recibe el mismo dt y el
+        # tiempo real sobrante se acumula para el frame siguiente
+        self.dt = 1.0 / SIMULATION_TICK_RATE  # Delta time de cada tick en segundos
+        self._accumulator = 0.0
+        self.interpolation = 1.0  # Fracción del próximo tick ya transcurrida (para render)
+        self.render_enabled = render  # Sin render, cada vuelta simula un tick sin esperar al reloj
+        self.profile_dump = False  # Si True, vuelca el perfil de frames al cerrar
+        self._last_rendered_state = None  # Estado dibujado entero en el último frame completo
         
         # Inicializar sistemas
         self.resource_manager = ResourceManager()
-        self.asset_lib = RPGAssetLibrary(self.resource_manager)
+        self.asset_loader = AssetLoader(self.resource_manager)
+        # El escaneo de assets y los tiles procedurales los encola LoadingState
+        self.asset_lib = RPGAssetLibrary(self.resource_manager, scan=False)
+        self.tile_generator = None
         self.state_manager = StateManager()
         
         # Pasar referencia del juego a los estados (para acceso a resource_manager y asset_lib)
@@ -84,42 +124,210 @@ class Game:
     def run(self):
         """Ejecuta el loop principal del juego"""
         while self.running:
-            # Calcular delta time
-            self.dt = self.clock.tick(FPS) / 1000.0  # Convertir a segundos
+            # Tiempo real transcurrido (sin render, la simulación va lo más rápido posible)
+            if self.render_enabled:
+                frame_time = self.clock.tick(FPS) / 1000.0  # Convertir a segundos
+            else:
+                self.clock.tick()
+                frame_time = self.dt
             
-            # Manejar eventos
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.running = False
-                else:
-                    # Pasar eventos al estado actual
-                    if self.state_manager.get_current_state():
-                        current_state = self.state_manager._states.get(
-                            self.state_manager.get_current_state()
-                        )
-                        if current_state:
-                            current_state.handle_event(event)
+            self.frame(frame_time)
+        
+        self.quit()
+    
+    def run_ticks(self, ticks: int) -> int:
+        """
+        Simula una cantidad de ticks sin esperar al reloj (sesiones sin ventana)
+        
+        Se detiene antes si llega un pygame.QUIT (por ejemplo desde el guion).
+        
+        Args:
+            ticks: Ticks a simular
             
-            # Actualizar
-            self.state_manager.update(self.dt)
+        Returns:
+            Ticks simulados
+        """
+        start = self.tick_count
+        while self.running and self.tick_count - start < ticks:
+            self.clock.tick()  # Solo para medir FPS
+            self.frame(self.dt)
+        return self.tick_count - start
+    
+    def frame(self, frame_time: float):
+        """
+        Procesa un frame: eventos, assets cargados, simulación y render
+        
+        Args:
+            frame_time: Segundos desde el frame anterior
+        """
+        profiler.begin_frame()
+        with profiler.scope("events"):
+            self.handle_events()
+        
+        # Terminar los assets que los hilos de carga ya decodificaron. Sin render
+        # o con guion se espera a toda la cola: el tick en que cada asset está
+        # listo (y el de la llegada al menú) depende solo del tiempo simulado
+        with profiler.scope("assets"):
+            if not self.render_enabled or self.input_script is not None:
+                self.asset_loader.finish_all()
+            else:
+                self.asset_loader.pump()
+        
+        # Actualizar
+        with profiler.scope("update"):
+            self.advance(frame_time)
+        
+        # Renderizar
+        if self.render_enabled:
+            with profiler.scope("render"):
+                self.render()
+        profiler.end_frame()
+    
+    def handle_events(self):
+        """Reparte los eventos de Pygame y los del guion de entrada al estado actual"""
+        events = pygame.event.get()
+        if self.input_script is not None:
+            events.extend(self.input_script.events_until(self.tick_count))
+        
+        for event in events:
+            if event.type == pygame.QUIT:
+                self.running = False
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                # Overlay de rendimiento
+                profiler.toggle_overlay()
+                self._last_rendered_state = None
+            elif event.type in (pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED):
+                # La ventana perdió su contenido: el próximo frame se dibuja entero
+                self._last_rendered_state = None
+            else:
+                # Pasar eventos al estado actual
+                if self.state_manager.get_current_state():
+                    current_state = self.state_manager.get_state(
+                        self.state_manager.get_current_state()
+                    )
+                    if current_state:
+                        current_state.handle_event(event)
+    
+    def get_pressed_keys(self):
+        """
+        Retorna las teclas mantenidas (del guion de entrada si hay uno)
+        
+        Returns:
+            Objeto indexable por constantes pygame.K_*, como pygame.key.get_pressed()
+        """
+        if self.input_script is not None:
+            return self.input_script.get_pressed()
+        return pygame.key.get_pressed()
+    
+    def advance(self, frame_time: float) -> int:
+        """
+        Avanza la simulación en ticks fijos según el tiempo transcurrido
+        
+        Args:
+            frame_time: Segundos reales desde el frame anterior
             
-            # Renderizar
-            self.screen.fill((0, 0, 0))  # Limpiar pantalla
-            self.state_manager.render(self.screen)
-            pygame.display.flip()
+        Returns:
+            Cantidad de ticks simulados
+        """
+        # Tras un frame muy lento se descarta el atraso en vez de encadenar ticks sin fin
+        self._accumulator += min(frame_time, self.dt * MAX_SIMULATION_STEPS_PER_FRAME)
         
-        self.quit()
+        ticks = 0
+        while self._accumulator >= self.dt:
+            self.state_manager.update(self.dt)
+            self._accumulator -= self.dt
+            self.tick_count += 1
+            ticks += 1
+        
+        self.interpolation = self._accumulator / self.dt
+        return ticks
+    
+    def render(self):
+        """
+        Dibuja el frame actual
+        
+        Los estados con uses_dirty_rects solo redibujan las zonas que marcaron
+        con mark_dirty() y las envían con display.update(); si no marcaron
+        nada, el frame no se dibuja. El primer frame de cada estado se dibuja
+        entero.
+        """
+        state_name = self.state_manager.get_current_state()
+        state = self.state_manager.get_state(state_name) if state_name else None
+        
+        # Con el overlay visible se dibuja todo (cambia en cada refresco)
+        if (state is not None and DIRTY_RECTS_ENABLED and state.uses_dirty_rects
+                and not profiler.overlay_visible):
+            rects = state.consume_dirty_rects(self.screen.get_rect())
+            if state_name == self._last_rendered_state:
+                if rects:
+                    self.screen.set_clip(rects[0].unionall(rects[1:]))
+                    self.screen.fill((0, 0, 0))
+                    self.state_manager.render(self.screen)
+                    self.screen.set_clip(None)
+                    pygame.display.update(rects)
+                return
+        
+        self.screen.fill((0, 0, 0))  # Limpiar pantalla
+        self.state_manager.render(self.screen)
+        if profiler.overlay_visible:
+            profiler.render_overlay(self.screen, self.clock.get_fps(), self.get_cache_stats())
+        pygame.display.flip()
+        self._last_rendered_state = state_name
+    
+    def get_cache_stats(self):
+        """
+        Retorna las estadísticas de las cachés de assets y textos
+        
+        Returns:
+            Diccionario nombre -> estadísticas (hits, misses, resident_bytes...)
+        """
+        stats = self.resource_manager.get_stats()
+        stats["text"] = text_cache.get_stats()
+        stats["fire_text"] = get_fire_text_stats()
+        return stats
+    
+    def close(self):
+        """Libera los recursos sin terminar el proceso (para encadenar sesiones)"""
+        if self.profile_dump:
+            profiler.dump()
+        self.asset_loader.shutdown()
+        exploration = self.state_manager.get_state(STATE_EXPLORATION)
+        if exploration is not None:
+            exploration.map_manager.shutdown()
+            exploration.set_village_renderer(None)
+        pygame.quit()
     
     def quit(self):
         """Limpia recursos y cierra el juego"""
-        pygame.quit()
+        self.close()
         sys.exit()
 
 
 def main():
     """Punto de entrada principal"""
-    game = Game()
-    game.run()
+    parser = argparse.ArgumentParser(description=TITLE)
+    parser.add_argument("--headless", action="store_true",
+                        help="Sin ventana ni audio (drivers dummy de SDL)")
+    parser.add_argument("--no-render", action="store_true",
+                        help="No dibujar; la simulación corre más rápido que el tiempo real")
+    parser.add_argument("--script", help="Guion JSON de entrada (ver src/scripted_input.py)")
+    parser.add_argument("--ticks", type=int,
+                        help="Simular esta cantidad de ticks y salir")
+    parser.add_argument("--profile", action="store_true",
+                        help="Guardar el perfil de frames (CSV/JSON) al salir")
+    args = parser.parse_args()
+    
+    input_script = ScriptedInput.from_file(args.script) if args.script else None
+    game = Game(headless=args.headless, render=not args.no_render, input_script=input_script)
+    game.profile_dump = args.profile
+    
+    if args.ticks is None:
+        game.run()
+        return
+    
+    simulated = game.run_ticks(args.ticks)
+    print(f"[OK] {simulated} ticks simulados, estado final: {game.state_manager.get_current_state()}")
+    game.close()
 
 
 if __name__ == "__main__":
@@ -2,10 +2,8 @@
 Clase base para items
 """
 
-import json
-import os
 from typing import Dict, List, Optional, Any
-from src.config import DATA_DIR
+from src.utils.data_loader import load_data
 
 
 class Item:
@@ -34,11 +32,11 @@ class Item:
         self.stackable = data.get("stackable", False)
         self.max_stack = data.get("max_stack", 1)
         self.precio = data.get("precio", 0)
-        self.efecto = data.get("efecto", [])
+        self.efecto = list(data.get("efecto", []))
         
         # Atributos específicos por tipo
         self.tipo_arma = data.get("tipo_arma", None)
-        self.bonus_stats = data.get("bonus_stats", {})
+        self.bonus_stats = dict(data.get("bonus_stats", {}))
         
         # Sprite path (opcional)
         self.sprite_path = data.get("sprite_path", None)
@@ -46,9 +44,7 @@ class Item:
     def _load_from_json(self, item_id: int):
         """Carga los datos del item desde el archivo JSON"""
         try:
-            items_file = os.path.join(DATA_DIR, "items", "items_base.json")
-            with open(items_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = load_data("items/items_base.json")
             
             # Buscar el item por ID
             for item_data in data.get("items", []):
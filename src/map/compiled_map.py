@@ -0,0 +1,420 @@
+"""
+Formato binario compilado de mapas (.tmxb)
+
+Un .tmxb guarda lo que MapManager necesita de un .tmx ya resuelto, para no
+tener que parsear XML/CSV en cada carga:
+
+    cabecera     struct HEADER_FORMAT (magic, versión, tamaño, origen)
+    manifiesto   JSON utf-8: tilesets (atlas), capas y tablas de objetos
+    bloqueos     1 byte por tile (ver MapManager.is_tile_blocked)
+    GIDs         una matriz uint16 o uint32 little-endian por capa de tiles
+
+Los GIDs son los de Tiled (con los bits de volteo en los 3 bits altos).
+Las secciones de datos están alineadas a 4 bytes para poder leerlas
+directamente desde un mmap.
+"""
+
+import bisect
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import Dict, List, Optional, Tuple
+
+import pygame
+
+from src.utils.image_cache import load_image_file
+
+COMPILED_EXTENSION = ".tmxb"
+COMPILED_MAGIC = b"GSNM"
+COMPILED_VERSION = 1
+
+# magic, versión, flags, ancho, alto, ancho tile, alto tile,
+# mtime del .tmx, tamaño del .tmx, longitud del manifiesto
+HEADER_FORMAT = "<4sHHIIHHdQI"
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+
+FLAG_GID32 = 0x1  # Las matrices de GIDs usan uint32 en lugar de uint16
+
+GID_FLIP_X = 0x80000000
+GID_FLIP_Y = 0x40000000
+GID_FLIP_DIAGONAL = 0x20000000
+GID_MASK = GID_FLIP_X | GID_FLIP_Y | GID_FLIP_DIAGONAL
+
+
+def compiled_path_for(tmx_path: str) -> str:
+    """Retorna la ruta del .tmxb que corresponde a un .tmx"""
+    return os.path.splitext(tmx_path)[0] + COMPILED_EXTENSION
+
+
+def _align(offset: int) -> int:
+    """Redondea un offset al siguiente múltiplo de 4"""
+    return (offset + 3) & ~3
+
+
+def read_header(path: str) -> Optional[Tuple]:
+    """
+    Lee la cabecera de un mapa compilado
+
+    Args:
+        path: Ruta al archivo .tmxb
+
+    Returns:
+        Tupla con los campos de HEADER_FORMAT, o None si no es válida
+    """
+    try:
+        with open(path, "rb") as f:
+            data = f.read(HEADER_SIZE)
+    except OSError:
+        return None
+    if len(data) < HEADER_SIZE:
+        return None
+    header = struct.unpack(HEADER_FORMAT, data)
+    if header[0] != COMPILED_MAGIC or header[1] != COMPILED_VERSION:
+        return None
+    return header
+
+
+def is_compiled_map_stale(compiled_path: str, tmx_path: str) -> bool:
+    """
+    Verifica si un mapa compilado ya no corresponde a su .tmx de origen
+
+    Args:
+        compiled_path: Ruta al .tmxb
+        tmx_path: Ruta al .tmx de origen
+
+    Returns:
+        True si falta el binario, su versión es otra o el .tmx cambió
+    """
+    header = read_header(compiled_path)
+    if header is None:
+        return True
+    if not os.path.exists(tmx_path):
+        # Sin origen no hay nada más nuevo: el binario es la única fuente
+        return False
+    stat = os.stat(tmx_path)
+    return header[7] != stat.st_mtime or header[8] != stat.st_size
+
+
+def compile_map(tmx_path: str, output_path: Optional[str] = None) -> str:
+    """
+    Compila un .tmx al formato binario
+
+    Args:
+        tmx_path: Ruta al archivo .tmx
+        output_path: Ruta de salida (por defecto, junto al .tmx con extensión .tmxb)
+
+    Returns:
+        Ruta del archivo generado
+    """
+    import pytmx
+    from src.map.map_manager import build_blocking_tiles
+
+    tiled_map = pytmx.TiledMap(tmx_path)
+    output_path = output_path or compiled_path_for(tmx_path)
+
+    # GID interno de pytmx -> GID de Tiled con bits de volteo
+    raw_gids = {0: 0}
+    for tiled_gid, variants in tiled_map.gidmap.items():
+        for gid, flags in variants:
+            raw = tiled_gid
+            if flags.flipped_horizontally:
+                raw |= GID_FLIP_X
+            if flags.flipped_vertically:
+                raw |= GID_FLIP_Y
+            if flags.flipped_diagonally:
+                raw |= GID_FLIP_DIAGONAL
+            raw_gids[gid] = raw
+
+    tilesets = []
+    for ts in tiled_map.tilesets:
+        if ts.source is None:
+            raise ValueError(f"Tileset sin imagen no soportado: {ts.name}")
+        columns = len(range(ts.margin, ts.width + ts.margin - ts.tilewidth + 1,
+                            ts.tilewidth + ts.spacing))
+        rows = len(range(ts.margin, ts.height + ts.margin - ts.tileheight + 1,
+                         ts.tileheight + ts.spacing))
+        tilesets.append({
+            "name": ts.name,
+            "firstgid": ts.firstgid,
+            "image": ts.source,
+            "tilewidth": ts.tilewidth,
+            "tileheight": ts.tileheight,
+            "spacing": ts.spacing,
+            "margin": ts.margin,
+            "columns": columns,
+            "tilecount": columns * rows,
+            "trans": getattr(ts, "trans", None),
+        })
+
+    layers = []
+    gid_arrays = []
+    use_gid32 = False
+    for layer in tiled_map.layers:
+        entry = {
+            "name": layer.name,
+            "visible": bool(layer.visible),
+            "properties": dict(getattr(layer, "properties", {})),
+        }
+        if isinstance(layer, pytmx.TiledTileLayer):
+            entry["kind"] = "tiles"
+            data = [raw_gids.get(gid, 0) for row in layer.data for gid in row]
+            use_gid32 = use_gid32 or any(gid > 0xFFFF for gid in data)
+            gid_arrays.append(data)
+        elif isinstance(layer, pytmx.TiledObjectGroup):
+            entry["kind"] = "objects"
+            entry["objects"] = [{
+                "id": obj.id,
+                "name": obj.name,
+                "type": obj.type,
+                "x": obj.x,
+                "y": obj.y,
+                "width": obj.width,
+                "height": obj.height,
+                "rotation": obj.rotation,
+                "properties": dict(obj.properties),
+            } for obj in layer]
+        else:
+            # Capas de imagen y grupos no se usan en el juego
+            continue
+        layers.append(entry)
+
+    manifest = json.dumps({"tilesets": tilesets, "layers": layers},
+                          ensure_ascii=False).encode("utf-8")
+    blocking = build_blocking_tiles(tiled_map)
+
+    stat = os.stat(tmx_path)
+    header = struct.pack(
+        HEADER_FORMAT, COMPILED_MAGIC, COMPILED_VERSION,
+        FLAG_GID32 if use_gid32 else 0,
+        tiled_map.width, tiled_map.height,
+        tiled_map.tilewidth, tiled_map.tileheight,
+        stat.st_mtime, stat.st_size, len(manifest)
+    )
+
+    typecode = "I" if use_gid32 else "H"
+    with open(output_path, "wb") as f:
+        f.write(header)
+        f.write(manifest)
+        f.write(b"\0" * (_align(f.tell()) - f.tell()))
+        f.write(blocking)
+        f.write(b"\0" * (_align(f.tell()) - f.tell()))
+        for data in gid_arrays:
+            packed = array(typecode, data)
+            if sys.byteorder == "big":
+                packed.byteswap()
+            f.write(packed.tobytes())
+
+    return output_path
+
+
+class CompiledObject:
+    """Objeto de una capa de objetos (mismos atributos que usa el juego de pytmx)"""
+
+    def __init__(self, data: Dict):
+        self.id = data.get("id", 0)
+        self.name = data.get("name")
+        self.type = data.get("type")
+        self.x = data.get("x", 0)
+        self.y = data.get("y", 0)
+        self.width = data.get("width", 0)
+        self.height = data.get("height", 0)
+        self.rotation = data.get("rotation", 0)
+        self.properties = data.get("properties", {})
+
+    def __repr__(self):
+        return f"<CompiledObject[{self.id}]: \"{self.name}\">"
+
+
+class CompiledObjectLayer(list):
+    """Capa de objetos de un mapa compilado (lista de CompiledObject)"""
+
+    def __init__(self, entry: Dict):
+        super().__init__(CompiledObject(obj) for obj in entry.get("objects", []))
+        self.name = entry["name"]
+        self.visible = entry.get("visible", True)
+        self.properties = entry.get("properties", {})
+
+
+class CompiledTileLayer:
+    """Capa de tiles de un mapa compilado; data[y][x] lee directo del mmap"""
+
+    def __init__(self, entry: Dict, gids, width: int, height: int):
+        self.name = entry["name"]
+        self.visible = entry.get("visible", True)
+        self.properties = entry.get("properties", {})
+        self.width = width
+        self.height = height
+        self.data = [gids[y * width:(y + 1) * width] for y in range(height)]
+
+
+class CompiledMap:
+    """
+    Mapa cargado desde un .tmxb
+
+    Expone el subconjunto de la API de pytmx.TiledMap que usa MapManager
+    (width, height, layers, visible_tile_layers, objectgroups, get_tile_image).
+    """
+
+    def __init__(self, path: str):
+        """
+        Abre un mapa compilado mapeándolo en memoria
+
+        Args:
+            path: Ruta al archivo .tmxb
+        """
+        self.filename = path
+        self._file = open(path, "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self._file.close()
+            raise
+        view = memoryview(self._mmap)
+
+        header = struct.unpack_from(HEADER_FORMAT, view, 0)
+        if header[0] != COMPILED_MAGIC or header[1] != COMPILED_VERSION:
+            self.close()
+            raise ValueError(f"Mapa compilado inválido: {path}")
+
+        (_, _, flags, self.width, self.height,
+         self.tilewidth, self.tileheight, _, _, manifest_len) = header
+
+        offset = HEADER_SIZE
+        manifest = json.loads(bytes(view[offset:offset + manifest_len]).decode("utf-8"))
+        offset = _align(offset + manifest_len)
+
+        cells = self.width * self.height
+        self.blocking_tiles = view[offset:offset + cells]
+        offset = _align(offset + cells)
+
+        typecode = "I" if flags & FLAG_GID32 else "H"
+        itemsize = struct.calcsize("<" + typecode)
+
+        self.tilesets: List[Dict] = manifest["tilesets"]
+        self._firstgids = [ts["firstgid"] for ts in self.tilesets]
+        self._tileset_images: Dict[int, pygame.Surface] = {}
+        self._raw_tileset_images: Dict[int, pygame.Surface] = {}
+        self._images: Dict[int, pygame.Surface] = {}
+
+        self.layers = []
+        for entry in manifest["layers"]:
+            if entry["kind"] == "tiles":
+                raw = view[offset:offset + cells * itemsize]
+                if sys.byteorder == "big":
+                    gids = array(typecode, raw)
+                    gids.byteswap()
+                else:
+                    gids = raw.cast(typecode)
+                offset += cells * itemsize
+                self.layers.append(CompiledTileLayer(entry, gids, self.width, self.height))
+            else:
+                self.layers.append(CompiledObjectLayer(entry))
+
+    @property
+    def visible_tile_layers(self):
+        """Índices de las capas de tiles visibles"""
+        return (i for i, layer in enumerate(self.layers)
+                if layer.visible and isinstance(layer, CompiledTileLayer))
+
+    @property
+    def objectgroups(self):
+        """Capas de objetos del mapa"""
+        return (layer for layer in self.layers if isinstance(layer, CompiledObjectLayer))
+
+    def get_tile_image(self, x: int, y: int, layer: int) -> Optional[pygame.Surface]:
+        """
+        Retorna la imagen del tile en una posición
+
+        Args:
+            x: Columna del tile
+            y: Fila del tile
+            layer: Índice de la capa
+
+        Returns:
+            Superficie del tile o None si está vacío
+        """
+        return self.get_tile_image_by_gid(self.layers[layer].data[y][x])
+
+    def get_tile_image_by_gid(self, raw_gid: int) -> Optional[pygame.Surface]:
+        """Retorna (y cachea) la imagen de un GID de Tiled"""
+        if not raw_gid:
+            return None
+        image = self._images.get(raw_gid)
+        if image is None:
+            image = self._extract_tile(raw_gid)
+            self._images[raw_gid] = image
+        return image
+
+    def _extract_tile(self, raw_gid: int) -> Optional[pygame.Surface]:
+        """Recorta un tile de su tileset y aplica los volteos"""
+        gid = raw_gid & ~GID_MASK
+        index = bisect.bisect_right(self._firstgids, gid) - 1
+        if index < 0:
+            return None
+        ts = self.tilesets[index]
+        local_id = gid - ts["firstgid"]
+        if local_id >= ts["tilecount"]:
+            return None
+
+        sheet = self._load_tileset_image(index)
+        column = local_id % ts["columns"]
+        row = local_id // ts["columns"]
+        rect = pygame.Rect(
+            ts["margin"] + column * (ts["tilewidth"] + ts["spacing"]),
+            ts["margin"] + row * (ts["tileheight"] + ts["spacing"]),
+            ts["tilewidth"], ts["tileheight"]
+        )
+        tile = sheet.subsurface(rect)
+
+        if raw_gid & GID_FLIP_DIAGONAL:
+            tile = pygame.transform.flip(pygame.transform.rotate(tile, 270), True, False)
+        if raw_gid & (GID_FLIP_X | GID_FLIP_Y):
+            tile = pygame.transform.flip(tile, bool(raw_gid & GID_FLIP_X),
+                                         bool(raw_gid & GID_FLIP_Y))
+        return tile
+
+    def preload_images(self):
+        """
+        Decodifica las imágenes de los tilesets sin convertirlas
+
+        Pensado para el hilo de precarga: la conversión al formato de la
+        pantalla se hace después, en el hilo principal, al pedir el primer tile.
+        """
+        for index, ts in enumerate(self.tilesets):
+            if index in self._tileset_images or index in self._raw_tileset_images:
+                continue
+            path = os.path.join(os.path.dirname(self.filename), ts["image"])
+            self._raw_tileset_images[index] = load_image_file(path)
+
+    def _load_tileset_image(self, index: int) -> pygame.Surface:
+        """Carga la imagen completa de un tileset (una vez por mapa)"""
+        sheet = self._tileset_images.get(index)
+        if sheet is None:
+            ts = self.tilesets[index]
+            sheet = self._raw_tileset_images.pop(index, None)
+            if sheet is None:
+                path = os.path.join(os.path.dirname(self.filename), ts["image"])
+                sheet = load_image_file(path)
+            if pygame.display.get_surface():
+                if ts.get("trans"):
+                    sheet = sheet.convert()
+                    sheet.set_colorkey(pygame.Color("#" + ts["trans"].lstrip("#")),
+                                      pygame.RLEACCEL)
+                else:
+                    sheet = sheet.convert_alpha()
+            self._tileset_images[index] = sheet
+        return sheet
+
+    def close(self):
+        """Libera el mmap y el archivo"""
+        self.layers = []
+        self.blocking_tiles = None
+        try:
+            self._mmap.close()
+        except (BufferError, AttributeError):
+            # Aún hay vistas vivas; el GC cerrará el mmap al liberarlas
+            pass
+        self._file.close()
@@ -5,8 +5,73 @@ Gestor de mapas - carga y renderiza mapas de Tiled
 import pygame
 import pytmx
 import os
-from typing import Optional, Dict
-from src.config import DATA_DIR, TILE_SIZE
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, Dict, Tuple, List
+from pytmx.util_pygame import pygame_image_loader
+from src.config import (
+    DATA_DIR, MAP_CHUNK_TILES, MAP_CHUNK_CACHE_SIZE, SPATIAL_GRID_CELL,
+    MAP_CACHE_SIZE, MAP_PRELOAD_NEIGHBORS
+)
+from src.map.spatial_hash import SpatialHash
+from src.map.compiled_map import CompiledMap, compiled_path_for, is_compiled_map_stale
+from src.utils.profiler import profiler
+
+
+class LoadedMap:
+    """Mapa ya leído junto con sus datos derivados (capas de objetos, índices, bloqueos)"""
+    
+    def __init__(self, map_id: str, tiled_map, blocking_tiles: bytearray):
+        """
+        Prepara los datos derivados de un mapa recién leído
+        
+        Args:
+            map_id: ID del mapa (ruta relativa a data/maps/)
+            tiled_map: Mapa de pytmx o CompiledMap
+            blocking_tiles: Mapa de bits de tiles bloqueantes del mapa
+        """
+        self.map_id = map_id
+        self.tiled_map = tiled_map
+        self.blocking_tiles = blocking_tiles
+        
+        # True si el mapa se leyó sin imágenes (precarga en segundo plano)
+        self.images_pending = False
+        
+        # Buscar capas de colisión y eventos
+        self.collision_layer = None
+        self.event_layer = None
+        
+        for layer in tiled_map.objectgroups:
+            if layer.name.lower() == "collision" or layer.name.lower() == "colisiones":
+                self.collision_layer = layer
+            elif layer.name.lower() == "events" or layer.name.lower() == "eventos":
+                self.event_layer = layer
+        
+        # Índices espaciales de las capas de colisión y eventos
+        self.collision_index = SpatialHash(SPATIAL_GRID_CELL)
+        self.event_index = SpatialHash(SPATIAL_GRID_CELL)
+        
+        for layer, index in ((self.collision_layer, self.collision_index),
+                             (self.event_layer, self.event_index)):
+            if not layer:
+                continue
+            for obj in layer:
+                index.insert(pygame.Rect(obj.x, obj.y, obj.width, obj.height), obj)
+    
+    def load_images(self):
+        """Carga las imágenes que se difirieron al leer el mapa en segundo plano"""
+        if not self.images_pending:
+            return
+        if isinstance(self.tiled_map, pytmx.TiledMap):
+            self.tiled_map.image_loader = pygame_image_loader
+            self.tiled_map.reload_images()
+        self.images_pending = False
+    
+    def close(self):
+        """Libera los recursos del mapa (el mmap y el archivo de un CompiledMap)"""
+        if isinstance(self.tiled_map, CompiledMap):
+            self.tiled_map.close()
 
 
 class MapManager:
@@ -18,50 +83,368 @@ class MapManager:
         self.collision_layer: Optional[pytmx.TiledObjectLayer] = None
         self.event_layer: Optional[pytmx.TiledObjectLayer] = None
         
+        # Caché LRU de chunks pre-renderizados: (grupo, chunk_x, chunk_y) -> Surface
+        self.chunk_tiles = MAP_CHUNK_TILES
+        self.max_cached_chunks = MAP_CHUNK_CACHE_SIZE
+        self._chunk_cache: "OrderedDict[Tuple[int, int, int], pygame.Surface]" = OrderedDict()
+        
+        # Orden de dibujo de las capas: grupos de capas estáticas consecutivas
+        # (en chunks) separados por las capas dinámicas (None = sin calcular)
+        self._layer_passes: Optional[List[Tuple[bool, List[int]]]] = None
+        
+        # Índices espaciales de las capas de colisión y eventos
+        self.collision_index = SpatialHash(SPATIAL_GRID_CELL)
+        self.event_index = SpatialHash(SPATIAL_GRID_CELL)
+        
+        # Mapa de bits de tiles bloqueantes (1 byte por tile, fila por fila)
+        self.blocking_tiles = bytearray()
+        
+        # Caché LRU de mapas leídos: map_id -> LoadedMap
+        self.max_cached_maps = MAP_CACHE_SIZE
+        self._map_cache: "OrderedDict[str, LoadedMap]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        
+        # Mapas que salieron de la caché o dejaron de ser el actual; se cierran
+        # en el hilo principal cuando ya no los usa nadie
+        self._retired_maps: List[LoadedMap] = []
+        self._current_loaded: Optional[LoadedMap] = None
+        
+        # Precarga de mapas vecinos en un hilo de fondo
+        self.preload_enabled = MAP_PRELOAD_NEIGHBORS
+        self._preloads: Dict[str, Future] = {}
+        self._preload_executor: Optional[ThreadPoolExecutor] = None
+        
     def load_map(self, map_path: str) -> bool:
         """
         Carga un mapa desde un archivo .tmx
         
+        Si el mapa ya está en la caché (o se está precargando) se reutiliza.
+        
         Args:
             map_path: Ruta al archivo .tmx relativa a data/maps/
             
         Returns:
             True si se cargó correctamente, False si no
         """
-        full_path = os.path.join(DATA_DIR, "maps", map_path)
-        
-        try:
-            if not os.path.exists(full_path):
-                print(f"Mapa no encontrado: {full_path}")
+        loaded = self._get_cached_map(map_path)
+        if loaded is None:
+            try:
+                loaded = self._read_tmx(map_path)
+            except Exception as e:
+                print(f"Error cargando mapa {os.path.join(DATA_DIR, 'maps', map_path)}: {e}")
+                self._clear_current_map()
                 return False
+            if loaded is None:
+                return False
+            self._cache_map(loaded)
+        
+        self._activate_map(loaded)
+        return True
+    
+    def load_compiled(self, map_path: str) -> bool:
+        """
+        Carga un mapa desde su versión compilada (.tmxb), sin parsear XML
+        
+        Si el mapa ya está en la caché (o se está precargando) se reutiliza.
+        Si el binario no existe, está desactualizado respecto al .tmx o no se
+        puede leer, se carga el .tmx con load_map.
+        
+        Args:
+            map_path: Ruta al archivo .tmx relativa a data/maps/
             
-            self.current_map = pytmx.load_pygame(full_path, pixelalpha=True)
-            self.map_name = map_path
+        Returns:
+            True si se cargó correctamente, False si no
+        """
+        loaded = self._get_cached_map(map_path)
+        if loaded is None:
+            loaded = self._read_compiled(map_path)
+            if loaded is None:
+                return self.load_map(map_path)
+            self._cache_map(loaded)
+        
+        self._activate_map(loaded)
+        return True
+    
+    def _read_tmx(self, map_path: str, background: bool = False) -> Optional[LoadedMap]:
+        """
+        Lee un mapa .tmx sin activarlo
+        
+        Args:
+            map_path: Ruta al archivo .tmx relativa a data/maps/
+            background: Si es True solo se parsea el XML; las imágenes se
+                cargan en el hilo principal al activar el mapa
             
-            # Buscar capas de colisión y eventos
-            self.collision_layer = None
-            self.event_layer = None
+        Returns:
+            LoadedMap, o None si el archivo no existe
+        """
+        full_path = os.path.join(DATA_DIR, "maps", map_path)
+        if not os.path.exists(full_path):
+            print(f"Mapa no encontrado: {full_path}")
+            return None
+        
+        if background:
+            tiled_map = pytmx.TiledMap(full_path)
+        else:
+            tiled_map = pytmx.load_pygame(full_path, pixelalpha=True)
+        
+        loaded = LoadedMap(map_path, tiled_map, build_blocking_tiles(tiled_map))
+        loaded.images_pending = background
+        return loaded
+    
+    def _read_compiled(self, map_path: str, background: bool = False) -> Optional[LoadedMap]:
+        """
+        Lee la versión compilada (.tmxb) de un mapa sin activarlo
+        
+        Args:
+            map_path: Ruta al archivo .tmx relativa a data/maps/
+            background: Si es True se decodifican también las imágenes de los
+                tilesets (la conversión queda para el hilo principal)
             
-            for layer in self.current_map.objectgroups:
-                if layer.name.lower() == "collision" or layer.name.lower() == "colisiones":
-                    self.collision_layer = layer
-                elif layer.name.lower() == "events" or layer.name.lower() == "eventos":
-                    self.event_layer = layer
+        Returns:
+            LoadedMap, o None si el binario no existe, está desactualizado o falla
+        """
+        full_path = os.path.join(DATA_DIR, "maps", map_path)
+        compiled_path = compiled_path_for(full_path)
+        
+        if is_compiled_map_stale(compiled_path, full_path):
+            return None
+        
+        try:
+            compiled_map = CompiledMap(compiled_path)
+            if background:
+                compiled_map.preload_images()
+        except Exception as e:
+            print(f"Error cargando mapa compilado {compiled_path}: {e}")
+            return None
+        
+        return LoadedMap(map_path, compiled_map, bytearray(compiled_map.blocking_tiles))
+    
+    def _activate_map(self, loaded: LoadedMap):
+        """
+        Convierte un mapa leído en el mapa actual
+        
+        Args:
+            loaded: Mapa leído (de la caché o recién cargado)
+        """
+        loaded.load_images()
+        
+        previous = self._current_loaded
+        self._current_loaded = loaded
+        if previous is not None and previous is not loaded:
+            self._retire_map(previous)
+        
+        self.current_map = loaded.tiled_map
+        self.map_name = loaded.map_id
+        self.collision_layer = loaded.collision_layer
+        self.event_layer = loaded.event_layer
+        self.collision_index = loaded.collision_index
+        self.event_index = loaded.event_index
+        self.blocking_tiles = loaded.blocking_tiles
+        self.invalidate_chunks()
+        
+        print(f"Mapa cargado: {loaded.map_id}")
+        print(f"  Dimensiones: {self.current_map.width}x{self.current_map.height} tiles")
+        print(f"  Tamaño de tile: {self.current_map.tilewidth}x{self.current_map.tileheight}")
+        self._close_retired_maps()
+    
+    def _clear_current_map(self):
+        """Deja el gestor sin mapa actual"""
+        if self._current_loaded is not None:
+            self._retire_map(self._current_loaded)
+            self._current_loaded = None
+        self.current_map = None
+        self.map_name = None
+        self.collision_layer = None
+        self.event_layer = None
+        self.collision_index = SpatialHash(SPATIAL_GRID_CELL)
+        self.event_index = SpatialHash(SPATIAL_GRID_CELL)
+        self.blocking_tiles = bytearray()
+        self.invalidate_chunks()
+        self._close_retired_maps()
+    
+    def _retire_map(self, loaded: LoadedMap):
+        """Marca un mapa para cerrarlo cuando no esté en caché ni activo"""
+        with self._cache_lock:
+            self._retired_maps.append(loaded)
+    
+    def _close_retired_maps(self):
+        """Cierra los mapas retirados que ya no están en caché ni activos (hilo principal)"""
+        with self._cache_lock:
+            cached = set(map(id, self._map_cache.values()))
+            retired, self._retired_maps = self._retired_maps, []
+        # Los que siguen en caché o activos se retiran de nuevo al expulsarlos
+        for loaded in retired:
+            if loaded is not self._current_loaded and id(loaded) not in cached:
+                loaded.close()
+    
+    def _get_cached_map(self, map_id: str) -> Optional[LoadedMap]:
+        """
+        Obtiene un mapa de la caché, esperando a su precarga si está en curso
+        
+        Args:
+            map_id: ID del mapa
             
-            print(f"Mapa cargado: {map_path}")
-            print(f"  Dimensiones: {self.current_map.width}x{self.current_map.height} tiles")
-            print(f"  Tamaño de tile: {self.current_map.tilewidth}x{self.current_map.tileheight}")
-            return True
+        Returns:
+            LoadedMap o None si no está en la caché
+        """
+        self.wait_for_preload(map_id)
+        
+        with self._cache_lock:
+            loaded = self._map_cache.get(map_id)
+            if loaded is not None:
+                self._map_cache.move_to_end(map_id)
+        return loaded
+    
+    def _cache_map(self, loaded: LoadedMap):
+        """Guarda un mapa leído en la caché, expulsando los menos usados"""
+        with self._cache_lock:
+            old = self._map_cache.get(loaded.map_id)
+            if old is not None and old is not loaded:
+                self._retired_maps.append(old)
+            self._map_cache[loaded.map_id] = loaded
+            self._map_cache.move_to_end(loaded.map_id)
+            while len(self._map_cache) > self.max_cached_maps:
+                # Puede llamarse desde el hilo de precarga: el cierre queda
+                # para el hilo principal, que quizás está por activar este mapa
+                self._retired_maps.append(self._map_cache.popitem(last=False)[1])
+    
+    def clear_map_cache(self):
+        """Descarta los mapas en caché (el mapa actual sigue activo)"""
+        with self._cache_lock:
+            self._retired_maps.extend(self._map_cache.values())
+            self._map_cache.clear()
+        self._close_retired_maps()
+    
+    def get_neighbor_map_ids(self) -> List[str]:
+        """
+        Obtiene los mapas a los que llevan los eventos map_* del mapa actual
+        
+        Returns:
+            Lista de IDs de mapa sin repetir
+        """
+        map_ids = []
+        if not self.event_layer:
+            return map_ids
+        
+        for obj in self.event_layer:
+            if obj.name and obj.name.startswith("map_"):
+                map_id = obj.name.replace("map_", "")
+                if map_id != self.map_name and map_id not in map_ids:
+                    map_ids.append(map_id)
+        return map_ids
+    
+    def preload_neighbors(self):
+        """Precarga en segundo plano los mapas vecinos del mapa actual"""
+        if not self.preload_enabled:
+            return
+        # Dejar sitio en la caché para el mapa actual
+        for map_id in self.get_neighbor_map_ids()[:max(0, self.max_cached_maps - 1)]:
+            self.preload_map(map_id)
+    
+    def preload_map(self, map_id: str) -> bool:
+        """
+        Lee un mapa en un hilo de fondo y lo deja en la caché
+        
+        Args:
+            map_id: ID del mapa (ruta relativa a data/maps/)
             
+        Returns:
+            True si se encoló la precarga, False si ya estaba en caché o en curso
+        """
+        with self._cache_lock:
+            if map_id in self._map_cache or map_id in self._preloads:
+                return False
+            if self._preload_executor is None:
+                self._preload_executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="map-preload"
+                )
+            self._preloads[map_id] = self._preload_executor.submit(self._preload_worker, map_id)
+        return True
+    
+    def wait_for_preload(self, map_id: str):
+        """
+        Espera a que termine la precarga de un mapa (si hay una en curso)
+        
+        Args:
+            map_id: ID del mapa
+        """
+        with self._cache_lock:
+            future = self._preloads.get(map_id)
+        if future is not None:
+            future.result()
+    
+    def _preload_worker(self, map_id: str):
+        """Lee un mapa en el hilo de precarga (sin tocar el mapa actual)"""
+        try:
+            loaded = self._read_compiled(map_id, background=True)
+            if loaded is None:
+                loaded = self._read_tmx(map_id, background=True)
+            if loaded is not None:
+                self._cache_map(loaded)
+                print(f"[OK] Mapa precargado: {map_id}")
         except Exception as e:
-            print(f"Error cargando mapa {full_path}: {e}")
-            self.current_map = None
+            print(f"[WARNING] No se pudo precargar el mapa {map_id}: {e}")
+        finally:
+            with self._cache_lock:
+                self._preloads.pop(map_id, None)
+    
+    def shutdown(self):
+        """Cancela las precargas pendientes, libera el hilo de fondo y vacía la caché de mapas"""
+        if self._preload_executor is not None:
+            self._preload_executor.shutdown(wait=False, cancel_futures=True)
+            self._preload_executor = None
+        with self._cache_lock:
+            self._preloads.clear()
+        self.clear_map_cache()
+    
+    def is_tile_blocked(self, tile_x: int, tile_y: int) -> bool:
+        """
+        Verifica si un tile está marcado como bloqueante
+        
+        Args:
+            tile_x: Columna del tile
+            tile_y: Fila del tile
+            
+        Returns:
+            True si el tile bloquea el paso
+        """
+        if not self.blocking_tiles or not self.current_map:
+            return False
+        if not (0 <= tile_x < self.current_map.width and 0 <= tile_y < self.current_map.height):
             return False
+        return self.blocking_tiles[tile_y * self.current_map.width + tile_x] == 1
+    
+    def _collides_with_tiles(self, rect: pygame.Rect) -> bool:
+        """Verifica si un rectángulo cubre algún tile bloqueante"""
+        if not self.blocking_tiles or rect.width <= 0 or rect.height <= 0:
+            return False
+        
+        width = self.current_map.width
+        tile_width = self.current_map.tilewidth
+        tile_height = self.current_map.tileheight
+        
+        start_x = max(0, rect.left // tile_width)
+        start_y = max(0, rect.top // tile_height)
+        end_x = min(width - 1, (rect.right - 1) // tile_width)
+        end_y = min(self.current_map.height - 1, (rect.bottom - 1) // tile_height)
+        if start_x > end_x or start_y > end_y:
+            return False
+        
+        for y in range(start_y, end_y + 1):
+            offset = y * width
+            if self.blocking_tiles.find(1, offset + start_x, offset + end_x + 1) != -1:
+                return True
+        return False
     
     def render(self, screen: pygame.Surface, camera_rect: pygame.Rect):
         """
         Renderiza el mapa visible en la pantalla
         
+        Las capas estáticas se dibujan desde chunks pre-renderizados (un blit
+        por chunk visible); las capas marcadas con la propiedad "dynamic" se
+        siguen dibujando tile a tile. Cada capa dinámica corta el grupo de
+        capas estáticas, así que todo se dibuja en el orden de Tiled.
+        
         Args:
             screen: Superficie donde renderizar
             camera_rect: Rectángulo de la cámara
@@ -69,10 +452,44 @@ class MapManager:
         if not self.current_map:
             return
         
-        # Calcular qué tiles son visibles
+        blits = 0
+        group = 0
+        for dynamic, layers in self._get_layer_passes():
+            if dynamic:
+                blits += self._render_dynamic_layer(screen, camera_rect, layers[0])
+            else:
+                blits += self._render_chunks(screen, camera_rect, group)
+                group += 1
+        profiler.count("blits", blits)
+    
+    def _render_chunks(self, screen: pygame.Surface, camera_rect: pygame.Rect, group: int) -> int:
+        """Dibuja los chunks visibles de un grupo de capas estáticas; retorna los blits"""
+        chunk_width = self.chunk_tiles * self.current_map.tilewidth
+        chunk_height = self.chunk_tiles * self.current_map.tileheight
+        
+        # Calcular qué chunks son visibles
+        chunks_x = (self.current_map.width + self.chunk_tiles - 1) // self.chunk_tiles
+        chunks_y = (self.current_map.height + self.chunk_tiles - 1) // self.chunk_tiles
+        start_cx = max(0, camera_rect.x // chunk_width)
+        start_cy = max(0, camera_rect.y // chunk_height)
+        end_cx = min(chunks_x, (camera_rect.right - 1) // chunk_width + 1)
+        end_cy = min(chunks_y, (camera_rect.bottom - 1) // chunk_height + 1)
+        
+        blits = 0
+        for cy in range(start_cy, end_cy):
+            for cx in range(start_cx, end_cx):
+                chunk = self._get_chunk(group, cx, cy)
+                if chunk:
+                    screen.blit(chunk, (cx * chunk_width - camera_rect.x,
+                                        cy * chunk_height - camera_rect.y))
+                    blits += 1
+        return blits
+    
+    def _render_dynamic_layer(self, screen: pygame.Surface, camera_rect: pygame.Rect,
+                              layer: int) -> int:
+        """Dibuja una capa dinámica tile a tile; retorna los blits"""
         tile_width = self.current_map.tilewidth
         tile_height = self.current_map.tileheight
-        
         start_x = max(0, camera_rect.x // tile_width)
         start_y = max(0, camera_rect.y // tile_height)
         end_x = min(self.current_map.width, 
@@ -80,19 +497,115 @@ class MapManager:
         end_y = min(self.current_map.height,
                    (camera_rect.y + camera_rect.height) // tile_height + 1)
         
-        # Renderizar todas las capas de tiles
-        for layer in self.current_map.visible_tile_layers:
+        blits = 0
+        for y in range(start_y, end_y):
+            for x in range(start_x, end_x):
+                tile = self.current_map.get_tile_image(x, y, layer)
+                if tile:
+                    screen_x = x * tile_width - camera_rect.x
+                    screen_y = y * tile_height - camera_rect.y
+                    screen.blit(tile, (screen_x, screen_y))
+                    blits += 1
+        return blits
+    
+    def invalidate_chunks(self):
+        """Descarta todos los chunks pre-renderizados (llamar si cambian los tiles)"""
+        self._chunk_cache.clear()
+        self._layer_passes = None
+    
+    def _is_dynamic_layer(self, layer_index: int) -> bool:
+        """Retorna True si la capa no debe pre-renderizarse en chunks"""
+        layer = self.current_map.layers[layer_index]
+        return bool(getattr(layer, "properties", {}).get("dynamic", False))
+    
+    def _get_layer_passes(self) -> List[Tuple[bool, List[int]]]:
+        """
+        Agrupa las capas de tiles visibles en el orden en que se dibujan
+        
+        Returns:
+            Lista de (es_dinámica, índices de capa): las capas estáticas
+            consecutivas forman un grupo de chunks; cada dinámica va sola
+        """
+        if self._layer_passes is None:
+            passes = []
+            for layer in self.current_map.visible_tile_layers:
+                if self._is_dynamic_layer(layer):
+                    passes.append((True, [layer]))
+                elif passes and not passes[-1][0]:
+                    passes[-1][1].append(layer)
+                else:
+                    passes.append((False, [layer]))
+            self._layer_passes = passes
+        return self._layer_passes
+    
+    def _get_chunk(self, group: int, chunk_x: int, chunk_y: int) -> Optional[pygame.Surface]:
+        """
+        Obtiene un chunk del caché, componiéndolo si todavía no existe
+        
+        Args:
+            group: Grupo de capas estáticas (ver _get_layer_passes)
+            chunk_x: Columna del chunk
+            chunk_y: Fila del chunk
+            
+        Returns:
+            Superficie con las capas estáticas del grupo en el chunk
+        """
+        key = (group, chunk_x, chunk_y)
+        chunk = self._chunk_cache.get(key)
+        if chunk is not None:
+            self._chunk_cache.move_to_end(key)
+            return chunk
+        
+        static_groups = [layers for dynamic, layers in self._get_layer_passes() if not dynamic]
+        chunk = self._build_chunk(static_groups[group], chunk_x, chunk_y)
+        self._chunk_cache[key] = chunk
+        
+        # Expulsar los chunks menos usados si se supera el límite
+        while len(self._chunk_cache) > self.max_cached_chunks:
+            self._chunk_cache.popitem(last=False)
+        
+        return chunk
+    
+    def _build_chunk(self, layers: List[int], chunk_x: int, chunk_y: int) -> pygame.Surface:
+        """
+        Compone un grupo de capas de tiles estáticas de un chunk en una superficie
+        
+        Args:
+            layers: Índices de las capas, en orden de dibujo
+            chunk_x: Columna del chunk
+            chunk_y: Fila del chunk
+            
+        Returns:
+            Superficie con alpha del tamaño del chunk
+        """
+        tile_width = self.current_map.tilewidth
+        tile_height = self.current_map.tileheight
+        
+        start_x = chunk_x * self.chunk_tiles
+        start_y = chunk_y * self.chunk_tiles
+        end_x = min(self.current_map.width, start_x + self.chunk_tiles)
+        end_y = min(self.current_map.height, start_y + self.chunk_tiles)
+        
+        chunk = pygame.Surface(((end_x - start_x) * tile_width,
+                                (end_y - start_y) * tile_height), pygame.SRCALPHA)
+        
+        for layer in layers:
             for y in range(start_y, end_y):
                 for x in range(start_x, end_x):
                     tile = self.current_map.get_tile_image(x, y, layer)
                     if tile:
-                        screen_x = x * tile_width - camera_rect.x
-                        screen_y = y * tile_height - camera_rect.y
-                        screen.blit(tile, (screen_x, screen_y))
+                        chunk.blit(tile, ((x - start_x) * tile_width,
+                                          (y - start_y) * tile_height))
+        
+        # Formato de píxeles de la pantalla para blits más rápidos
+        if pygame.display.get_surface():
+            chunk = chunk.convert_alpha()
+        
+        return chunk
     
     def check_collision(self, rect: pygame.Rect) -> bool:
         """
-        Verifica si un rectángulo colisiona con objetos de colisión
+        Verifica si un rectángulo colisiona con tiles bloqueantes u objetos de colisión
         
         Args:
             rect: Rectángulo a verificar
@@ -100,15 +613,21 @@ class MapManager:
         Returns:
             True si hay colisión, False si no
         """
-        if not self.collision_layer:
-            return False
-        
-        for obj in self.collision_layer:
-            obj_rect = pygame.Rect(obj.x, obj.y, obj.width, obj.height)
-            if rect.colliderect(obj_rect):
-                return True
+        if self._collides_with_tiles(rect):
+            return True
+        return self.collision_index.any_collision(rect)
+    
+    def query_rects(self, rects: List[pygame.Rect]) -> List[bool]:
+        """
+        Verifica colisiones para varios rectángulos en una sola llamada
         
-        return False
+        Args:
+            rects: Lista de rectángulos (por ejemplo, de varias entidades)
+            
+        Returns:
+            Lista de booleanos, True para cada rectángulo que colisiona
+        """
+        return [self.check_collision(rect) for rect in rects]
     
     def get_map_width(self) -> int:
         """Retorna el ancho del mapa en píxeles"""
@@ -133,14 +652,49 @@ class MapManager:
         Returns:
             Lista de objetos de evento en esa posición
         """
-        events = []
-        if not self.event_layer:
-            return events
+        return self.event_index.query_point(x, y)
+
+
+def build_blocking_tiles(tiled_map) -> bytearray:
+    """
+    Construye el mapa de bits de tiles bloqueantes de un mapa de Tiled
+    
+    Un tile bloquea si su tileset le asigna la propiedad "collides", o si
+    pertenece a una capa de tiles con la propiedad "collides" (útil para
+    marcar muros o zonas de agua completas).
+    
+    Args:
+        tiled_map: Mapa de pytmx
         
-        for obj in self.event_layer:
-            obj_rect = pygame.Rect(obj.x, obj.y, obj.width, obj.height)
-            if obj_rect.collidepoint(x, y):
-                events.append(obj)
+    Returns:
+        bytearray con 1 byte por tile (1 = bloquea), fila por fila
+    """
+    width = tiled_map.width
+    blocking_tiles = bytearray(width * tiled_map.height)
+    
+    blocking_gids = {
+        gid for gid, props in tiled_map.tile_properties.items()
+        if _is_true(props.get("collides"))
+    }
+    
+    for layer in tiled_map.layers:
+        if not isinstance(layer, pytmx.TiledTileLayer):
+            continue
+        whole_layer = _is_true(getattr(layer, "properties", {}).get("collides"))
+        if not whole_layer and not blocking_gids:
+            continue
         
-        return events
+        for y, row in enumerate(layer.data):
+            offset = y * width
+            for x, gid in enumerate(row):
+                if gid and (whole_layer or gid in blocking_gids):
+                    blocking_tiles[offset + x] = 1
+    
+    return blocking_tiles
+
 
+def _is_true(value) -> bool:
+    """Interpreta una propiedad de Tiled como booleano ("true", "1", True)"""
+    if isinstance(value, str):
+        return value.strip().lower() in ("true", "1", "yes")
+    return bool(value)
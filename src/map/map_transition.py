@@ -32,9 +32,12 @@ class MapTransition:
             Tupla (x, y) con la posición de spawn, o None si hay error
         """
         # Cargar el nuevo mapa
-        self.map_manager.load_map(map_id)
+        self.map_manager.load_compiled(map_id)
         self.current_map_id = map_id
         
+        # Empezar a leer los mapas vecinos mientras el jugador explora este
+        self.map_manager.preload_neighbors()
+        
         # Buscar punto de spawn
         spawn_point = self._find_spawn_point(spawn_point_id)
         
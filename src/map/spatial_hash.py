@@ -0,0 +1,134 @@
+"""
+Índice espacial de rejilla uniforme para objetos del mapa
+"""
+
+import pygame
+from typing import Dict, List, Tuple, Iterable, Any
+
+
+class SpatialHash:
+    """Agrupa rectángulos en celdas de una rejilla uniforme para consultas rápidas"""
+
+    def __init__(self, cell_size: int):
+        """
+        Inicializa el índice espacial
+
+        Args:
+            cell_size: Tamaño de cada celda de la rejilla en píxeles
+        """
+        self.cell_size = max(1, int(cell_size))
+        self._cells: Dict[Tuple[int, int], List[int]] = {}
+        self._rects: List[pygame.Rect] = []
+        self._items: List[Any] = []
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def _cell_range(self, rect: pygame.Rect) -> Tuple[int, int, int, int]:
+        """Retorna las celdas (x0, y0, x1, y1) inclusivas que toca un rectángulo"""
+        size = self.cell_size
+        return (rect.left // size, rect.top // size,
+                (rect.right - 1) // size, (rect.bottom - 1) // size)
+
+    def insert(self, rect: pygame.Rect, item: Any):
+        """
+        Agrega un objeto al índice
+
+        Args:
+            rect: Rectángulo del objeto en coordenadas del mundo
+            item: Objeto asociado (se devuelve en las consultas)
+        """
+        index = len(self._items)
+        self._rects.append(pygame.Rect(rect))
+        self._items.append(item)
+
+        x0, y0, x1, y1 = self._cell_range(rect)
+        for cy in range(y0, y1 + 1):
+            for cx in range(x0, x1 + 1):
+                self._cells.setdefault((cx, cy), []).append(index)
+
+    def clear(self):
+        """Vacía el índice"""
+        self._cells.clear()
+        self._rects.clear()
+        self._items.clear()
+
+    def _candidates(self, rect: pygame.Rect) -> Iterable[int]:
+        """Retorna los índices de los objetos en las celdas que toca el rectángulo"""
+        x0, y0, x1, y1 = self._cell_range(rect)
+        cells = self._cells
+
+        # Caso común: el rectángulo cae en una sola celda
+        if x0 == x1 and y0 == y1:
+            return cells.get((x0, y0), ())
+
+        found = set()
+        for cy in range(y0, y1 + 1):
+            for cx in range(x0, x1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    found.update(bucket)
+        return sorted(found)
+
+    def any_collision(self, rect: pygame.Rect) -> bool:
+        """
+        Verifica si el rectángulo choca con algún objeto del índice
+
+        Args:
+            rect: Rectángulo a verificar
+
+        Returns:
+            True si hay colisión
+        """
+        if rect.width <= 0 or rect.height <= 0:
+            return False
+        rects = self._rects
+        for index in self._candidates(rect):
+            if rect.colliderect(rects[index]):
+                return True
+        return False
+
+    def query_rect(self, rect: pygame.Rect) -> List[Any]:
+        """
+        Obtiene los objetos que se superponen con un rectángulo
+
+        Args:
+            rect: Rectángulo a consultar
+
+        Returns:
+            Lista de objetos (en orden de inserción)
+        """
+        if rect.width <= 0 or rect.height <= 0:
+            return []
+        rects = self._rects
+        return [self._items[index] for index in self._candidates(rect)
+                if rect.colliderect(rects[index])]
+
+    def query_point(self, x: float, y: float) -> List[Any]:
+        """
+        Obtiene los objetos que contienen un punto
+
+        Args:
+            x: Posición X
+            y: Posición Y
+
+        Returns:
+            Lista de objetos (en orden de inserción)
+        """
+        size = self.cell_size
+        bucket = self._cells.get((int(x // size), int(y // size)), ())
+        rects = self._rects
+        return [self._items[index] for index in bucket
+                if rects[index].collidepoint(x, y)]
+
+    def query_rects(self, rects: List[pygame.Rect]) -> List[List[Any]]:
+        """
+        Consulta varios rectángulos en una sola llamada
+
+        Args:
+            rects: Lista de rectángulos
+
+        Returns:
+            Lista con los objetos superpuestos a cada rectángulo
+        """
+        return [self.query_rect(rect) for rect in rects]
@@ -3,6 +3,7 @@ Generador de tiles básicos
 """
 
 import pygame
+from typing import Dict, Optional
 from src.config import TILE_SIZE
 from src.utils.sprite_generator import (
     create_grass_tile, create_dirt_tile, create_water_tile,
@@ -10,21 +11,41 @@ from src.utils.sprite_generator import (
 )
 
 
+def build_placeholder_tiles() -> Dict[str, pygame.Surface]:
+    """
+    Dibuja los tiles procedurales (no toca la pantalla, se puede ejecutar en
+    un hilo de fondo)
+    
+    Returns:
+        Diccionario nombre -> superficie
+    """
+    return {
+        "grass": create_grass_tile(),
+        "dirt": create_dirt_tile(),
+        "water": create_water_tile(),
+        "snow": create_snow_tile(),
+        "stone": create_stone_tile(),
+    }
+
+
 class TileGenerator:
     """Genera tiles básicos para mapas"""
     
-    def __init__(self, resource_manager=None, asset_lib=None):
+    def __init__(self, resource_manager=None, asset_lib=None,
+                 placeholder_tiles: Optional[Dict[str, pygame.Surface]] = None):
         """
         Inicializa el generador de tiles
         
         Args:
             resource_manager: ResourceManager para cargar imágenes
             asset_lib: RPGAssetLibrary para acceder a tilesets
+            placeholder_tiles: Tiles procedurales ya dibujados (ver
+                build_placeholder_tiles); si es None se dibujan ahora
         """
         self.resource_manager = resource_manager
         self.asset_lib = asset_lib
         self._tiles = {}
-        self._load_tiles()
+        self._load_tiles(placeholder_tiles)
     
     def _extract_tile_from_tileset(self, tileset_surface: pygame.Surface, tile_x: int, tile_y: int) -> pygame.Surface:
         """
@@ -50,68 +71,32 @@ class TileGenerator:
         return None
     
     def _load_grass_from_tileset(self) -> pygame.Surface:
-        """Intenta cargar grass tile desde tilesets reales"""
+        """Intenta cargar grass tile desde tilesets reales (del atlas si existe)"""
         if not self.resource_manager:
             return None
         
-        # PRIORIDAD 1: Intentar cargar desde base_grass.png (específico para pasto base)
-        base_grass = self.resource_manager.load_image("tilesets/base_grass.png", use_alpha=True)
-        if base_grass:
-            # Extraer el primer tile (0, 0) o buscar tiles de grass
-            tiles_x = base_grass.get_width() // TILE_SIZE
-            tiles_y = base_grass.get_height() // TILE_SIZE
-            if tiles_x > 0 and tiles_y > 0:
-                # Usar el primer tile de grass
-                tile = self._extract_tile_from_tileset(base_grass, 0, 0)
-                if tile:
-                    return tile
-        
-        # PRIORIDAD 2: Intentar desde ground_grass_details.png
-        grass_tileset = self.resource_manager.load_image("tilesets/ground_grass_details.png", use_alpha=True)
-        if grass_tileset:
-            # Extraer el primer tile (0, 0) o buscar un tile de grass
-            # Asumimos que el tileset tiene tiles de 32x32
-            tile = self._extract_tile_from_tileset(grass_tileset, 0, 0)
-            if tile:
-                return tile
-        
-        # PRIORIDAD 3: Intentar desde legacy_Tiles.png
-        legacy_tiles = self.resource_manager.load_image("tilesets/legacy_Tiles.png", use_alpha=True)
-        if legacy_tiles:
-            # Buscar tile de grass (generalmente en las primeras filas)
-            for y in range(3):
-                for x in range(5):
-                    tile = self._extract_tile_from_tileset(legacy_tiles, x, y)
-                    if tile:
-                        # Verificar si parece grass (tiene verde)
-                        # Por ahora, usar el primero que encontremos
-                        return tile
-        
-        # PRIORIDAD 4: Intentar desde walls_floor.png
-        walls_floor = self.resource_manager.load_image("tilesets/walls_floor.png", use_alpha=True)
-        if walls_floor:
-            # Buscar tile de floor/grass
-            tile = self._extract_tile_from_tileset(walls_floor, 0, 0)
+        # En orden de prioridad: base_grass.png (específico para pasto base),
+        # ground_grass_details.png, legacy_Tiles.png y walls_floor.png
+        for tileset_path in ["tilesets/base_grass.png",
+                             "tilesets/ground_grass_details.png",
+                             "tilesets/legacy_Tiles.png",
+                             "tilesets/walls_floor.png"]:
+            tile = self.resource_manager.get_tile(tileset_path, 0, 0)
             if tile:
                 return tile
         
         return None
     
-    def _load_tiles(self):
+    def _load_tiles(self, placeholder_tiles: Optional[Dict[str, pygame.Surface]] = None):
         """Carga todos los tiles básicos"""
         # Intentar cargar grass real desde tilesets
         real_grass = self._load_grass_from_tileset()
         
-        # Usar grass real si está disponible, sino usar placeholder
-        grass_tile = real_grass if real_grass else create_grass_tile()
+        self._tiles = dict(placeholder_tiles or build_placeholder_tiles())
         
-        self._tiles = {
-            "grass": grass_tile,
-            "dirt": create_dirt_tile(),
-            "water": create_water_tile(),
-            "snow": create_snow_tile(),
-            "stone": create_stone_tile(),
-        }
+        # Usar grass real si está disponible, sino usar placeholder
+        if real_grass:
+            self._tiles["grass"] = real_grass
         
         if real_grass:
             print("[OK] Grass tile cargado desde tileset")
@@ -6,8 +6,10 @@ Crea un pueblo completo con lógica visual orgánica y variada
 import pygame
 import random
 import os
+from array import array
 from typing import Dict, List, Tuple, Optional
 from src.config import TILE_SIZE, ASSETS_DIR
+from src.map.world_streamer import RegionSource, WorldStreamer
 
 
 class VillageGenerator:
@@ -21,13 +23,14 @@ class VillageGenerator:
             resource_manager: ResourceManager para cargar tilesets
         """
         self.resource_manager = resource_manager
-        self.tilesets = {}
+        self.tileset_sizes = {}  # Tamaño en píxeles de cada tileset disponible
         self.tile_cache = {}  # Cache de tiles extraídos
         self.grass_tiles = []  # Lista de tiles de grass disponibles
         self.path_tiles = []  # Lista de tiles de camino disponibles
         self.building_tiles = {}  # Diccionario de tiles de edificios por tipo
         self.tree_tiles = []  # Lista de tiles de árboles
         self.object_tiles = {}  # Diccionario de tiles de objetos por tileset
+        self._fallback_grass = None  # Tile verde si no hay tiles de grass
         
         # Cargar todos los tilesets
         self._load_tilesets()
@@ -52,18 +55,24 @@ class VillageGenerator:
         
         for tileset_file in tileset_files:
             tileset_path = f"tilesets/{tileset_file}"
+            # Si el tileset está en el atlas no hace falta decodificar el PNG
+            size = self.resource_manager.atlas.get_source_size(tileset_path)
+            if size:
+                self.tileset_sizes[tileset_file] = size
+                print(f"[OK] Tileset en atlas: {tileset_file} ({size[0]}x{size[1]})")
+                continue
             tileset = self.resource_manager.load_image(tileset_path, use_alpha=True)
             if tileset:
-                self.tilesets[tileset_file] = tileset
+                self.tileset_sizes[tileset_file] = tileset.get_size()
                 print(f"[OK] Tileset cargado: {tileset_file} ({tileset.get_width()}x{tileset.get_height()})")
     
     def _preload_tiles(self):
         """Precarga tiles válidos de cada tileset para evitar repetición"""
         # Precargar tiles de grass
-        if "base_grass.png" in self.tilesets:
-            tileset = self.tilesets["base_grass.png"]
-            tiles_x = tileset.get_width() // TILE_SIZE
-            tiles_y = tileset.get_height() // TILE_SIZE
+        if "base_grass.png" in self.tileset_sizes:
+            tileset_width, tileset_height = self.tileset_sizes["base_grass.png"]
+            tiles_x = tileset_width // TILE_SIZE
+            tiles_y = tileset_height // TILE_SIZE
             for y in range(tiles_y):
                 for x in range(tiles_x):
                     tile = self._extract_tile("base_grass.png", x, y)
@@ -71,10 +80,10 @@ class VillageGenerator:
                         self.grass_tiles.append(tile)
         
         # Agregar tiles de ground_grass_details como variación
-        if "ground_grass_details.png" in self.tilesets:
-            tileset = self.tilesets["ground_grass_details.png"]
-            tiles_x = min(tileset.get_width() // TILE_SIZE, 8)
-            tiles_y = min(tileset.get_height() // TILE_SIZE, 8)
+        if "ground_grass_details.png" in self.tileset_sizes:
+            tileset_width, tileset_height = self.tileset_sizes["ground_grass_details.png"]
+            tiles_x = min(tileset_width // TILE_SIZE, 8)
+            tiles_y = min(tileset_height // TILE_SIZE, 8)
             for y in range(tiles_y):
                 for x in range(tiles_x):
                     tile = self._extract_tile("ground_grass_details.png", x, y)
@@ -83,10 +92,10 @@ class VillageGenerator:
         
         # Precargar tiles de camino
         for tileset_name in ["walls_floor.png", "legacy_Tiles.png"]:
-            if tileset_name in self.tilesets:
-                tileset = self.tilesets[tileset_name]
-                tiles_x = min(tileset.get_width() // TILE_SIZE, 12)
-                tiles_y = min(tileset.get_height() // TILE_SIZE, 8)
+            if tileset_name in self.tileset_sizes:
+                tileset_width, tileset_height = self.tileset_sizes[tileset_name]
+                tiles_x = min(tileset_width // TILE_SIZE, 12)
+                tiles_y = min(tileset_height // TILE_SIZE, 8)
                 for y in range(tiles_y):
                     for x in range(tiles_x):
                         tile = self._extract_tile(tileset_name, x, y)
@@ -121,10 +130,10 @@ class VillageGenerator:
         
         # Precargar tiles de edificios
         for tileset_name in ["legacy_Buildings.png", "exterior.png", "house_details.png"]:
-            if tileset_name in self.tilesets:
-                tileset = self.tilesets[tileset_name]
-                tiles_x = min(tileset.get_width() // TILE_SIZE, 16)
-                tiles_y = min(tileset.get_height() // TILE_SIZE, 12)
+            if tileset_name in self.tileset_sizes:
+                tileset_width, tileset_height = self.tileset_sizes[tileset_name]
+                tiles_x = min(tileset_width // TILE_SIZE, 16)
+                tiles_y = min(tileset_height // TILE_SIZE, 12)
                 building_list = []
                 for y in range(tiles_y):
                     for x in range(tiles_x):
@@ -135,10 +144,10 @@ class VillageGenerator:
                     self.building_tiles[tileset_name] = building_list
         
         # Precargar tiles de árboles
-        if "legacy_Tree-Assets.png" in self.tilesets:
-            tileset = self.tilesets["legacy_Tree-Assets.png"]
-            tiles_x = min(tileset.get_width() // TILE_SIZE, 12)
-            tiles_y = min(tileset.get_height() // TILE_SIZE, 12)
+        if "legacy_Tree-Assets.png" in self.tileset_sizes:
+            tileset_width, tileset_height = self.tileset_sizes["legacy_Tree-Assets.png"]
+            tiles_x = min(tileset_width // TILE_SIZE, 12)
+            tiles_y = min(tileset_height // TILE_SIZE, 12)
             for y in range(tiles_y):
                 for x in range(tiles_x):
                     tile = self._extract_tile("legacy_Tree-Assets.png", x, y)
@@ -147,10 +156,10 @@ class VillageGenerator:
         
         # Precargar tiles de objetos
         for tileset_name in ["Objects.png", "Other_objects.png", "supplies_objects.png", "pedestals.png"]:
-            if tileset_name in self.tilesets:
-                tileset = self.tilesets[tileset_name]
-                tiles_x = min(tileset.get_width() // TILE_SIZE, 16)
-                tiles_y = min(tileset.get_height() // TILE_SIZE, 16)
+            if tileset_name in self.tileset_sizes:
+                tileset_width, tileset_height = self.tileset_sizes[tileset_name]
+                tiles_x = min(tileset_width // TILE_SIZE, 16)
+                tiles_y = min(tileset_height // TILE_SIZE, 16)
                 object_list = []
                 for y in range(tiles_y):
                     for x in range(tiles_x):
@@ -178,33 +187,23 @@ class VillageGenerator:
         if cache_key in self.tile_cache:
             return self.tile_cache[cache_key]
         
-        if tileset_name not in self.tilesets:
+        if tileset_name not in self.tileset_sizes:
             return None
         
-        tileset = self.tilesets[tileset_name]
-        x = tile_x * TILE_SIZE
-        y = tile_y * TILE_SIZE
-        
-        if x + TILE_SIZE <= tileset.get_width() and y + TILE_SIZE <= tileset.get_height():
-            try:
-                rect = pygame.Rect(x, y, TILE_SIZE, TILE_SIZE)
-                tile = tileset.subsurface(rect).copy()
-                tile = tile.convert_alpha()
-                self.tile_cache[cache_key] = tile
-                return tile
-            except:
-                return None
-        
-        return None
+        tile = self.resource_manager.get_tile(f"tilesets/{tileset_name}", tile_x, tile_y)
+        if tile:
+            self.tile_cache[cache_key] = tile
+        return tile
     
     def _get_random_grass_tile(self) -> pygame.Surface:
         """Obtiene un tile de grass aleatorio de los precargados"""
         if self.grass_tiles:
             return random.choice(self.grass_tiles)
-        # Fallback: tile verde simple
-        tile = pygame.Surface((TILE_SIZE, TILE_SIZE))
-        tile.fill((100, 150, 80))
-        return tile
+        # Fallback: tile verde simple (uno solo, compartido por todas las celdas)
+        if self._fallback_grass is None:
+            self._fallback_grass = pygame.Surface((TILE_SIZE, TILE_SIZE))
+            self._fallback_grass.fill((100, 150, 80))
+        return self._fallback_grass
     
     def generate_village_map(self, width: int = 80, height: int = 60) -> pygame.Surface:
         """
@@ -219,7 +218,36 @@ class VillageGenerator:
         """
         map_surface = pygame.Surface((width * TILE_SIZE, height * TILE_SIZE))
         map_surface = map_surface.convert_alpha()
+        self._draw_village(map_surface, width, height)
+        return map_surface
+    
+    def generate_village_layout(self, width: int = 80, height: int = 60) -> "VillageLayout":
+        """
+        Genera un pueblo como distribución de tiles, sin superficie del mapa completo
+        
+        Pensado para mundos grandes: el resultado se dibuja por regiones con
+        VillageMapRenderer.
+        
+        Args:
+            width: Ancho del mapa en tiles
+            height: Alto del mapa en tiles
+            
+        Returns:
+            VillageLayout con los tiles de cada celda
+        """
+        layout = VillageLayout(width, height)
+        self._draw_village(layout, width, height)
+        return layout
+    
+    def _draw_village(self, map_surface, width: int, height: int):
+        """
+        Dibuja todas las capas del pueblo
         
+        Args:
+            map_surface: Superficie o VillageLayout donde dibujar
+            width: Ancho del mapa en tiles
+            height: Alto del mapa en tiles
+        """
         # Capa 1: Base de grass variada
         print("Generando base de grass variada...")
         for y in range(height):
@@ -244,7 +272,6 @@ class VillageGenerator:
         self._draw_decorative_objects(map_surface, width, height)
         
         print(f"[OK] Pueblo generado: {width}x{height} tiles")
-        return map_surface
     
     def _draw_organic_paths(self, surface: pygame.Surface, width: int, height: int):
         """Dibuja caminos orgánicos y variados"""
@@ -429,24 +456,134 @@ class VillageGenerator:
                     occupied.add((obj_x, obj_y))
 
 
+class VillageLayout(RegionSource):
+    """
+    Tiles de cada celda de un pueblo generado
+    
+    Recibe los blits del VillageGenerator como si fuera una superficie, pero
+    solo guarda índices a una paleta de tiles (2 bytes por celda más las
+    capas superpuestas). Las regiones se componen bajo demanda.
+    """
+    
+    def __init__(self, width: int, height: int):
+        """
+        Inicializa una distribución vacía
+        
+        Args:
+            width: Ancho del mapa en tiles
+            height: Alto del mapa en tiles
+        """
+        self.width = width
+        self.height = height
+        self.tile_size = TILE_SIZE
+        
+        # Paleta de tiles (índice 0 = celda vacía)
+        self.palette: List[Optional[pygame.Surface]] = [None]
+        self._palette_ids: Dict[int, int] = {}
+        
+        # Tile base de cada celda y tiles dibujados encima (celda -> lista)
+        self.base = array("H", bytes(2 * width * height))
+        self.overlays: Dict[int, List[int]] = {}
+    
+    def _tile_id(self, tile: pygame.Surface) -> int:
+        """Retorna el índice de un tile en la paleta, agregándolo si es nuevo"""
+        tile_id = self._palette_ids.get(id(tile))
+        if tile_id is None:
+            tile_id = len(self.palette)
+            self.palette.append(tile)
+            self._palette_ids[id(tile)] = tile_id
+        return tile_id
+    
+    def blit(self, tile: pygame.Surface, dest: Tuple[int, int]):
+        """
+        Registra un tile en la celda de la posición dada (en píxeles)
+        
+        Args:
+            tile: Superficie del tile
+            dest: Posición (x, y) en píxeles, alineada a la rejilla
+        """
+        x = dest[0] // TILE_SIZE
+        y = dest[1] // TILE_SIZE
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return
+        
+        cell = y * self.width + x
+        tile_id = self._tile_id(tile)
+        if not self.base[cell]:
+            self.base[cell] = tile_id
+        else:
+            self.overlays.setdefault(cell, []).append(tile_id)
+    
+    def build_region(self, x: int, y: int, width: int,
+                     height: int) -> Tuple[pygame.Surface, Optional[bytearray]]:
+        """
+        Compone una región del pueblo
+        
+        Args:
+            x: Columna del primer tile de la región
+            y: Fila del primer tile de la región
+            width: Ancho de la región en tiles
+            height: Alto de la región en tiles
+            
+        Returns:
+            Tupla (superficie de la región, None: el pueblo no tiene bloqueos)
+        """
+        surface = pygame.Surface((width * TILE_SIZE, height * TILE_SIZE), pygame.SRCALPHA)
+        palette = self.palette
+        base = self.base
+        overlays = self.overlays
+        
+        blits = []
+        for ty in range(y, y + height):
+            row = ty * self.width
+            screen_y = (ty - y) * TILE_SIZE
+            for tx in range(x, x + width):
+                cell = row + tx
+                screen_x = (tx - x) * TILE_SIZE
+                tile_id = base[cell]
+                if tile_id:
+                    blits.append((palette[tile_id], (screen_x, screen_y)))
+                extra = overlays.get(cell)
+                if extra:
+                    for tile_id in extra:
+                        blits.append((palette[tile_id], (screen_x, screen_y)))
+        
+        surface.blits(blits, doreturn=False)
+        return surface, None
+
+
 class VillageMapRenderer:
     """Renderiza el mapa de pueblo generado"""
     
-    def __init__(self, village_surface: pygame.Surface, width: int, height: int):
+    def __init__(self, village, width: Optional[int] = None, height: Optional[int] = None):
         """
         Inicializa el renderizador
         
         Args:
-            village_surface: Superficie con el mapa generado
-            width: Ancho del mapa en tiles
-            height: Alto del mapa en tiles
+            village: VillageLayout (se dibuja por regiones, cargadas alrededor
+                de la cámara) o Superficie con el mapa completo generado
+            width: Ancho del mapa en tiles (por defecto, el del VillageLayout)
+            height: Alto del mapa en tiles (por defecto, el del VillageLayout)
         """
-        self.village_surface = village_surface
+        if isinstance(village, pygame.Surface):
+            self.village_surface = village
+            self.streamer = None
+        else:
+            self.village_surface = None
+            self.streamer = WorldStreamer(village)
+            width = village.width if width is None else width
+            height = village.height if height is None else height
+        
         self.width = width
         self.height = height
         self.map_width_px = width * TILE_SIZE
         self.map_height_px = height * TILE_SIZE
     
+    def close(self):
+        """Detiene el hilo de carga de regiones y libera las regiones cargadas"""
+        if self.streamer:
+            self.streamer.shutdown()
+    
     def render(self, screen: pygame.Surface, camera_rect: pygame.Rect):
         """
         Renderiza el mapa visible
@@ -455,6 +592,11 @@ class VillageMapRenderer:
             screen: Superficie donde renderizar
             camera_rect: Rectángulo de la cámara
         """
+        if self.streamer:
+            self.streamer.update(camera_rect)
+            self.streamer.render(screen, camera_rect)
+            return
+        
         # Calcular qué parte del mapa es visible
         start_x = max(0, camera_rect.x)
         start_y = max(0, camera_rect.y)
@@ -476,5 +618,7 @@ class VillageMapRenderer:
         Returns:
             True si hay colisión
         """
+        if self.streamer:
+            return self.streamer.check_collision(rect)
         # Por ahora, no hay colisiones (se puede agregar después)
         return False
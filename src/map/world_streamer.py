@@ -0,0 +1,285 @@
+"""
+Mundo por regiones - carga y descarga regiones alrededor de la cámara
+"""
+
+import pygame
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+from src.config import (
+    TILE_SIZE, WORLD_REGION_TILES, WORLD_LOAD_MARGIN, WORLD_MEMORY_BUDGET_MB
+)
+
+
+class RegionSource:
+    """
+    Origen de los datos de un mundo por regiones
+
+    Las subclases indican el tamaño del mundo en tiles y redefinen
+    build_region, que se llama desde el hilo de carga. La base compone
+    regiones vacías (transparentes y sin bloqueos).
+    """
+
+    width = 0
+    height = 0
+    tile_size = TILE_SIZE
+
+    def build_region(self, x: int, y: int, width: int,
+                     height: int) -> Tuple[pygame.Surface, Optional[bytearray]]:
+        """
+        Compone una región del mundo
+
+        Args:
+            x: Columna del primer tile de la región
+            y: Fila del primer tile de la región
+            width: Ancho de la región en tiles
+            height: Alto de la región en tiles
+
+        Returns:
+            Tupla (superficie de la región, bloqueos con 1 byte por tile o None)
+        """
+        surface = pygame.Surface((width * self.tile_size, height * self.tile_size), pygame.SRCALPHA)
+        return surface, None
+
+
+class WorldRegion:
+    """Región cargada: superficie compuesta y tiles bloqueantes"""
+
+    def __init__(self, tile_x: int, tile_y: int, width: int, height: int,
+                 surface: pygame.Surface, blocking: Optional[bytearray]):
+        self.tile_x = tile_x
+        self.tile_y = tile_y
+        self.width = width
+        self.height = height
+        self.surface = surface
+        self.blocking = blocking
+        self.size_bytes = (surface.get_width() * surface.get_height() * surface.get_bytesize()
+                           + (len(blocking) if blocking else 0))
+
+
+class WorldStreamer:
+    """Mantiene en memoria solo las regiones del mundo cercanas a la cámara"""
+
+    def __init__(self, source: RegionSource, region_tiles: int = WORLD_REGION_TILES,
+                 load_margin: int = WORLD_LOAD_MARGIN,
+                 memory_budget: int = WORLD_MEMORY_BUDGET_MB * 1024 * 1024):
+        """
+        Inicializa el mundo por regiones
+
+        Args:
+            source: Origen de las regiones
+            region_tiles: Tiles por lado de cada región
+            load_margin: Regiones extra que se cargan alrededor de la vista
+            memory_budget: Bytes máximos ocupados por las regiones cargadas
+        """
+        self.source = source
+        self.region_tiles = region_tiles
+        self.load_margin = load_margin
+        self.memory_budget = memory_budget
+        self.region_size = region_tiles * source.tile_size
+
+        self.regions_x = (source.width + region_tiles - 1) // region_tiles
+        self.regions_y = (source.height + region_tiles - 1) // region_tiles
+
+        # Regiones cargadas en orden LRU y cargas en curso (solo hilo principal)
+        self._regions: "OrderedDict[Tuple[int, int], WorldRegion]" = OrderedDict()
+        self._pending: Dict[Tuple[int, int], Future] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.resident_bytes = 0
+        self._budget_warned = False
+
+    @property
+    def width(self) -> int:
+        """Ancho del mundo en tiles"""
+        return self.source.width
+
+    @property
+    def height(self) -> int:
+        """Alto del mundo en tiles"""
+        return self.source.height
+
+    def _regions_in_rect(self, rect: pygame.Rect, margin: int) -> List[Tuple[int, int]]:
+        """Retorna las regiones que toca un rectángulo (más un margen en regiones)"""
+        size = self.region_size
+        start_x = max(0, rect.left // size - margin)
+        start_y = max(0, rect.top // size - margin)
+        end_x = min(self.regions_x - 1, (rect.right - 1) // size + margin)
+        end_y = min(self.regions_y - 1, (rect.bottom - 1) // size + margin)
+        return [(rx, ry) for ry in range(start_y, end_y + 1)
+                for rx in range(start_x, end_x + 1)]
+
+    def update(self, camera_rect: pygame.Rect):
+        """
+        Carga las regiones alrededor de la cámara y descarga las lejanas
+
+        Las regiones visibles que todavía no están listas se cargan en el
+        momento; las del margen se piden al hilo de carga.
+
+        Args:
+            camera_rect: Rectángulo de la cámara
+        """
+        self._collect_finished()
+
+        visible = self._regions_in_rect(camera_rect, 0)
+        wanted = self._regions_in_rect(camera_rect, self.load_margin)
+        wanted_set = set(wanted)
+
+        # Cancelar las cargas que ya no hacen falta (la cámara se alejó)
+        for key, future in list(self._pending.items()):
+            if key not in wanted_set and future.cancel():
+                del self._pending[key]
+
+        # Pedir primero las regiones más cercanas al centro de la vista
+        center_x = camera_rect.centerx // self.region_size
+        center_y = camera_rect.centery // self.region_size
+        wanted.sort(key=lambda key: abs(key[0] - center_x) + abs(key[1] - center_y))
+        for key in wanted:
+            if key not in self._regions and key not in self._pending:
+                self._request(key)
+
+        for key in visible:
+            if key not in self._regions and not self._ensure_region(key):
+                continue
+            self._regions.move_to_end(key)
+
+        self._enforce_budget(wanted_set)
+
+    def _request(self, key: Tuple[int, int]):
+        """Encola la carga de una región en el hilo de fondo"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="world-stream")
+        self._pending[key] = self._executor.submit(self._build_region, key)
+
+    def _build_region(self, key: Tuple[int, int]) -> WorldRegion:
+        """Compone una región (se ejecuta en el hilo de carga)"""
+        tile_x = key[0] * self.region_tiles
+        tile_y = key[1] * self.region_tiles
+        width = min(self.region_tiles, self.source.width - tile_x)
+        height = min(self.region_tiles, self.source.height - tile_y)
+        surface, blocking = self.source.build_region(tile_x, tile_y, width, height)
+        return WorldRegion(tile_x, tile_y, width, height, surface, blocking)
+
+    def _ensure_region(self, key: Tuple[int, int]) -> bool:
+        """
+        Garantiza que una región esté cargada, esperando o componiéndola
+
+        Args:
+            key: Región (columna, fila)
+
+        Returns:
+            True si la región quedó cargada
+        """
+        future = self._pending.pop(key, None)
+        try:
+            if future is not None and not future.cancelled():
+                region = future.result()
+            else:
+                region = self._build_region(key)
+        except Exception as e:
+            print(f"[ERROR] No se pudo cargar la región {key}: {e}")
+            return False
+        self._add_region(key, region)
+        return True
+
+    def _collect_finished(self):
+        """Incorpora las regiones que el hilo de carga ya terminó"""
+        for key, future in list(self._pending.items()):
+            if not future.done():
+                continue
+            del self._pending[key]
+            if future.cancelled():
+                continue
+            try:
+                self._add_region(key, future.result())
+            except Exception as e:
+                print(f"[ERROR] No se pudo cargar la región {key}: {e}")
+
+    def _add_region(self, key: Tuple[int, int], region: WorldRegion):
+        """Registra una región cargada"""
+        old = self._regions.pop(key, None)
+        if old is not None:
+            self.resident_bytes -= old.size_bytes
+        self._regions[key] = region
+        self.resident_bytes += region.size_bytes
+
+    def _enforce_budget(self, protected: set):
+        """Descarga las regiones menos usadas hasta respetar el presupuesto de memoria"""
+        if self.resident_bytes <= self.memory_budget:
+            return
+        for key in list(self._regions):
+            if self.resident_bytes <= self.memory_budget:
+                return
+            if key in protected:
+                continue
+            self.resident_bytes -= self._regions.pop(key).size_bytes
+
+        if self.resident_bytes > self.memory_budget and not self._budget_warned:
+            print(f"[WARNING] Las regiones cercanas ocupan {self.resident_bytes // (1024 * 1024)} MB, "
+                  f"más que el presupuesto de {self.memory_budget // (1024 * 1024)} MB")
+            self._budget_warned = True
+
+    def render(self, screen: pygame.Surface, camera_rect: pygame.Rect):
+        """
+        Dibuja las regiones visibles
+
+        Args:
+            screen: Superficie donde renderizar
+            camera_rect: Rectángulo de la cámara
+        """
+        tile_size = self.source.tile_size
+        for key in self._regions_in_rect(camera_rect, 0):
+            region = self._regions.get(key)
+            if region:
+                screen.blit(region.surface, (region.tile_x * tile_size - camera_rect.x,
+                                             region.tile_y * tile_size - camera_rect.y))
+
+    def check_collision(self, rect: pygame.Rect) -> bool:
+        """
+        Verifica si un rectángulo cubre tiles bloqueantes de regiones cargadas
+
+        Args:
+            rect: Rectángulo a verificar
+
+        Returns:
+            True si hay colisión
+        """
+        if rect.width <= 0 or rect.height <= 0:
+            return False
+
+        tile_size = self.source.tile_size
+        start_x = max(0, rect.left // tile_size)
+        start_y = max(0, rect.top // tile_size)
+        end_x = min(self.source.width - 1, (rect.right - 1) // tile_size)
+        end_y = min(self.source.height - 1, (rect.bottom - 1) // tile_size)
+
+        for key in self._regions_in_rect(rect, 0):
+            region = self._regions.get(key)
+            if not region or not region.blocking:
+                continue
+            x0 = max(start_x, region.tile_x) - region.tile_x
+            x1 = min(end_x, region.tile_x + region.width - 1) - region.tile_x
+            y0 = max(start_y, region.tile_y) - region.tile_y
+            y1 = min(end_y, region.tile_y + region.height - 1) - region.tile_y
+            for y in range(y0, y1 + 1):
+                offset = y * region.width
+                if region.blocking.find(1, offset + x0, offset + x1 + 1) != -1:
+                    return True
+        return False
+
+    def get_stats(self) -> Dict[str, int]:
+        """Retorna el estado de la memoria de regiones"""
+        return {
+            "loaded": len(self._regions),
+            "pending": len(self._pending),
+            "resident_bytes": self.resident_bytes,
+            "budget_bytes": self.memory_budget,
+        }
+
+    def shutdown(self):
+        """Cancela las cargas pendientes y libera las regiones"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        self._pending.clear()
+        self._regions.clear()
+        self.resident_bytes = 0
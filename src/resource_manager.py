@@ -4,19 +4,54 @@ Gestor de recursos - carga y caché de assets
 
 import pygame
 import os
-from typing import Dict, Optional
-from src.config import ASSETS_DIR
+from typing import Dict, Optional, Tuple
+from src.config import (
+    ASSETS_DIR, TILE_SIZE,
+    RESOURCE_IMAGE_BUDGET_MB, RESOURCE_SOUND_BUDGET_MB, RESOURCE_FONT_BUDGET_MB
+)
+from src.utils.asset_cache import AssetCache
+from src.utils.image_cache import load_image_file
+from src.utils.texture_atlas import AtlasRegistry
+
+# Tamaño estimado de una fuente sin archivo propio (pygame no expone su memoria)
+_DEFAULT_FONT_BYTES = 64 * 1024
+
+
+def _surface_bytes(surface: pygame.Surface) -> int:
+    """Bytes de píxeles de una superficie (0 si comparte la memoria de otra)"""
+    if surface.get_parent() is not None:
+        return 0  # Subsuperficie: la memoria es del padre (p. ej. una página del atlas)
+    return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+
+def _sound_bytes(sound: pygame.mixer.Sound) -> int:
+    """Bytes de muestras de un sonido según el formato del mixer"""
+    mixer_init = pygame.mixer.get_init()
+    if not mixer_init:
+        return 0
+    frequency, sample_format, channels = mixer_init
+    return int(sound.get_length() * frequency) * channels * (abs(sample_format) // 8)
 
 
 class ResourceManager:
     """Maneja la carga y caché de todos los recursos del juego"""
     
     def __init__(self):
-        self._images: Dict[str, pygame.Surface] = {}
-        self._sounds: Dict[str, pygame.mixer.Sound] = {}
-        self._fonts: Dict[str, pygame.font.Font] = {}
+        # Cachés LRU con presupuesto de memoria (ver get_stats)
+        self._images = AssetCache("images", RESOURCE_IMAGE_BUDGET_MB * 1024 * 1024,
+                                  on_evict=self._image_evicted)
+        self._sounds = AssetCache("sounds", RESOURCE_SOUND_BUDGET_MB * 1024 * 1024)
+        self._fonts = AssetCache("fonts", RESOURCE_FONT_BUDGET_MB * 1024 * 1024)
         self._music: Dict[str, str] = {}  # Paths a archivos de música
         
+        # Atlas de texturas (assets/atlases/, generado con build_atlases.py); sus
+        # páginas viven en la caché de imágenes y cuentan para su presupuesto
+        self.atlas = AtlasRegistry(page_cache=self._images)
+    
+    def _image_evicted(self, key, image: pygame.Surface):
+        """Avisa al atlas cuando una de sus páginas sale de la caché de imágenes"""
+        self.atlas.page_evicted(key)
+        
     def load_image(self, path: str, use_alpha: bool = True) -> pygame.Surface:
         """
         Carga una imagen y la guarda en caché
@@ -31,18 +66,26 @@ class ResourceManager:
         full_path = os.path.join(ASSETS_DIR, path)
         
         # Si ya está en caché, devolverla
-        if path in self._images:
-            return self._images[path]
+        image = self._images.get(path)
+        if image is not None:
+            return image
+        
+        # Servir desde el atlas si la imagen está empaquetada (la página es la
+        # que ocupa memoria en la caché; el frame lo guarda el atlas)
+        if use_alpha:
+            frame = self.atlas.get_frame(path)
+            if frame is not None:
+                return frame
         
         # Cargar imagen
         try:
-            image = pygame.image.load(full_path)
+            image = load_image_file(full_path)
             if use_alpha:
                 image = image.convert_alpha()
             else:
                 image = image.convert()
             
-            self._images[path] = image
+            self._images.put(path, image, _surface_bytes(image))
             return image
             
         except pygame.error as e:
@@ -50,6 +93,79 @@ class ResourceManager:
             # Devolver una superficie vacía como fallback
             return pygame.Surface((32, 32))
     
+    def store_image(self, path: str, image: pygame.Surface):
+        """
+        Guarda en caché una imagen ya cargada (por ejemplo, por AssetLoader)
+        
+        Args:
+            path: Ruta relativa desde assets/
+            image: Superficie ya convertida al formato de la pantalla
+        """
+        self._images.put(path, image, _surface_bytes(image))
+    
+    def pin_image(self, path: str):
+        """
+        Impide que una imagen salga de la caché (por ejemplo, el fondo del estado actual)
+        
+        Cada pin_image necesita su unpin_image. Si la imagen se sirve desde
+        el atlas, se fija la página que la contiene.
+        
+        Args:
+            path: Ruta relativa desde assets/
+        """
+        key = path
+        if path not in self._images:
+            key = self.atlas.get_page_key(path) or path
+        self._images.pin(key)
+    
+    def unpin_image(self, path: str):
+        """Permite que una imagen fijada vuelva a salir de la caché"""
+        key = path
+        if not self._images.is_pinned(path):
+            key = self.atlas.get_page_key(path) or path
+        self._images.unpin(key)
+    
+    def get_tile(self, path: str, tile_x: int, tile_y: int,
+                 tile_size: int = TILE_SIZE) -> Optional[pygame.Surface]:
+        """
+        Obtiene un tile de un tileset (del atlas si está empaquetado)
+        
+        Args:
+            path: Ruta del tileset relativa a assets/ (ej: "tilesets/base_grass.png")
+            tile_x: Columna del tile en el tileset
+            tile_y: Fila del tile en el tileset
+            tile_size: Tamaño del tile en píxeles
+            
+        Returns:
+            Superficie del tile o None si está fuera del tileset
+        """
+        if tile_size == TILE_SIZE:
+            frame = self.atlas.get_tile(path, tile_x, tile_y)
+            if frame is not None:
+                return frame
+        
+        tileset = self.load_image(path, use_alpha=True)
+        x = tile_x * tile_size
+        y = tile_y * tile_size
+        if x + tile_size <= tileset.get_width() and y + tile_size <= tileset.get_height():
+            return tileset.subsurface(pygame.Rect(x, y, tile_size, tile_size))
+        return None
+    
+    def get_image_size(self, path: str) -> Tuple[int, int]:
+        """
+        Obtiene el tamaño de una imagen sin decodificarla si está en el atlas
+        
+        Args:
+            path: Ruta relativa desde assets/
+            
+        Returns:
+            Tupla (ancho, alto)
+        """
+        size = self.atlas.get_source_size(path)
+        if size:
+            return size
+        return self.load_image(path).get_size()
+    
     def load_sound(self, path: str) -> Optional[pygame.mixer.Sound]:
         """
         Carga un sonido y lo guarda en caché
@@ -62,12 +178,13 @@ class ResourceManager:
         """
         full_path = os.path.join(ASSETS_DIR, "audio", path)
         
-        if path in self._sounds:
-            return self._sounds[path]
+        sound = self._sounds.get(path)
+        if sound is not None:
+            return sound
         
         try:
             sound = pygame.mixer.Sound(full_path)
-            self._sounds[path] = sound
+            self._sounds.put(path, sound, _sound_bytes(sound))
             return sound
         except pygame.error as e:
             print(f"Error cargando sonido {full_path}: {e}")
@@ -86,19 +203,22 @@ class ResourceManager:
         """
         key = f"{name}_{size}"
         
-        if key in self._fonts:
-            return self._fonts[key]
+        font = self._fonts.get(key)
+        if font is not None:
+            return font
         
         try:
             # Intentar cargar como archivo primero
             font_path = os.path.join(ASSETS_DIR, "ui", "fonts", name)
             if os.path.exists(font_path):
                 font = pygame.font.Font(font_path, size)
+                font_bytes = os.path.getsize(font_path)
             else:
                 # Usar fuente del sistema
                 font = pygame.font.Font(name, size)
+                font_bytes = _DEFAULT_FONT_BYTES
             
-            self._fonts[key] = font
+            self._fonts.put(key, font, font_bytes)
             return font
         except Exception as e:
             print(f"Error cargando fuente {name}: {e}")
@@ -121,12 +241,27 @@ class ResourceManager:
     
     def get_image(self, path: str) -> Optional[pygame.Surface]:
         """Obtiene una imagen del caché sin cargarla si no existe"""
-        return self._images.get(path)
+        return self._images.peek(path)
+    
+    def get_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Retorna las estadísticas de cada caché
+        
+        Returns:
+            Diccionario por categoría ("images", "sounds", "fonts") con
+            entries, pinned, hits, misses, evictions, resident_bytes y budget_bytes,
+            más "atlas" con las páginas cargadas (ya incluidas en "images")
+        """
+        stats = {cache.name: cache.get_stats()
+                 for cache in (self._images, self._sounds, self._fonts)}
+        stats["atlas"] = self.atlas.get_stats()
+        return stats
     
     def clear_cache(self):
-        """Limpia todos los cachés (útil para liberar memoria)"""
+        """Limpia todos los cachés (útil para liberar memoria; los pins se conservan)"""
         self._images.clear()
         self._sounds.clear()
         self._fonts.clear()
         self._music.clear()
+        self.atlas.clear()
 
@@ -0,0 +1,109 @@
+"""
+Entrada programada - reemplaza al teclado en las sesiones sin ventana
+
+Un guion es una lista de pasos con el tick de simulación en el que ocurren:
+
+    {"steps": [
+        {"tick": 150, "key": "return", "action": "tap"},
+        {"tick": 200, "key": "right", "action": "down"},
+        {"tick": 320, "key": "right", "action": "up"},
+        {"tick": 400, "action": "quit"}
+    ]}
+
+Acciones:
+    tap   KEYDOWN y KEYUP en el mismo tick (para menús)
+    down  Mantiene la tecla apretada (la ve get_pressed, para moverse)
+    up    Suelta la tecla
+    quit  Envía pygame.QUIT y termina la sesión
+
+Las teclas usan los nombres de pygame.key.key_code ("return", "escape",
+"up", "a"...).
+"""
+
+import json
+import pygame
+from typing import Dict, List, Set
+
+
+class PressedKeys:
+    """Estado de teclas apretadas con la misma interfaz que pygame.key.get_pressed()"""
+
+    def __init__(self, keys: Set[int]):
+        self._keys = keys
+
+    def __getitem__(self, key: int) -> bool:
+        return key in self._keys
+
+
+class ScriptedInput:
+    """Fuente de entrada que reproduce un guion de teclas por tick"""
+
+    def __init__(self, steps: List[Dict]):
+        """
+        Inicializa el guion
+
+        Args:
+            steps: Pasos con tick, key y action (ver docstring del módulo)
+        """
+        self.steps = sorted(steps, key=lambda step: step.get("tick", 0))
+        self._next_step = 0
+        self._held: Set[int] = set()
+
+    @classmethod
+    def from_file(cls, path: str) -> "ScriptedInput":
+        """
+        Carga un guion desde un archivo JSON
+
+        Args:
+            path: Ruta al archivo
+
+        Returns:
+            ScriptedInput con los pasos del archivo
+        """
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return cls(data.get("steps", []))
+
+    @property
+    def finished(self) -> bool:
+        """True si ya se reprodujeron todos los pasos"""
+        return self._next_step >= len(self.steps)
+
+    def events_until(self, tick: int) -> List[pygame.event.Event]:
+        """
+        Retorna los eventos de los pasos pendientes hasta el tick dado
+
+        Args:
+            tick: Tick de simulación actual
+
+        Returns:
+            Lista de eventos de Pygame en orden
+        """
+        events = []
+        while not self.finished and self.steps[self._next_step].get("tick", 0) <= tick:
+            step = self.steps[self._next_step]
+            self._next_step += 1
+
+            action = step.get("action", "tap")
+            if action == "quit":
+                events.append(pygame.event.Event(pygame.QUIT))
+                continue
+
+            try:
+                key = pygame.key.key_code(step["key"])
+            except (KeyError, ValueError) as e:
+                print(f"[WARNING] Paso de entrada inválido {step}: {e}")
+                continue
+
+            if action in ("tap", "down"):
+                events.append(pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, unicode="", scancode=0))
+            if action == "down":
+                self._held.add(key)
+            if action in ("tap", "up"):
+                self._held.discard(key)
+                events.append(pygame.event.Event(pygame.KEYUP, key=key, mod=0, unicode="", scancode=0))
+        return events
+
+    def get_pressed(self) -> PressedKeys:
+        """Retorna las teclas mantenidas, como pygame.key.get_pressed()"""
+        return PressedKeys(self._held)
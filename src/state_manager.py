@@ -2,7 +2,9 @@
 Gestor de estados del juego (máquina de estados)
 """
 
-from typing import Dict, Optional
+import pygame
+from typing import Dict, List, Optional
+from src.utils.profiler import profiler
 from src.config import (
     STATE_MENU, STATE_EXPLORATION, STATE_COMBAT, 
     STATE_INVENTORY, STATE_CAMP, STATE_DIALOG, STATE_PAUSE
@@ -10,12 +12,24 @@ from src.config import (
 
 
 class StateManager:
-    """Maneja los diferentes estados del juego"""
+    """
+    Maneja los diferentes estados del juego
+    
+    Los estados forman una pila: push_state() apila un estado encima del
+    actual (pausa sobre exploración, inventario sobre pausa...) y
+    pop_state() vuelve al de abajo. Solo el estado de arriba recibe
+    update, render y eventos; un estado con snapshot_below muestra lo que
+    hay debajo con una captura tomada una sola vez al apilarlo.
+    """
     
     def __init__(self):
         self._states: Dict[str, 'GameState'] = {}
-        self._current_state: Optional[str] = None
-        self._previous_state: Optional[str] = None
+        self._stack: List[str] = []
+        
+    @property
+    def _current_state(self) -> Optional[str]:
+        """Nombre del estado de arriba de la pila"""
+        return self._stack[-1] if self._stack else None
         
     def register_state(self, state_name: str, state_instance: 'GameState'):
         """
@@ -29,7 +43,7 @@ class StateManager:
         
     def change_state(self, new_state: str):
         """
-        Cambia al nuevo estado
+        Cambia al nuevo estado (sale de todos los estados de la pila)
         
         Args:
             new_state: Nombre del estado al que cambiar
@@ -38,16 +52,12 @@ class StateManager:
             print(f"Error: Estado '{new_state}' no registrado")
             return
         
-        # Salir del estado actual
-        if self._current_state and self._current_state in self._states:
-            self._states[self._current_state].exit()
-        
-        # Guardar estado anterior
-        self._previous_state = self._current_state
+        # Salir de los estados apilados, del de arriba al de abajo
+        while self._stack:
+            self._exit_state(self._stack.pop())
         
-        # Cambiar al nuevo estado
-        self._current_state = new_state
-        self._states[self._current_state].enter()
+        self._stack.append(new_state)
+        self._states[new_state].enter()
         
     def push_state(self, new_state: str):
         """
@@ -59,32 +69,56 @@ class StateManager:
         if new_state not in self._states:
             print(f"Error: Estado '{new_state}' no registrado")
             return
+        if new_state in self._stack:
+            print(f"Error: Estado '{new_state}' ya está en la pila")
+            return
         
+        state = self._states[new_state]
         if self._current_state:
+            # Capturar lo que se ve ahora, antes de pausar el estado de abajo
+            if state.snapshot_below:
+                state.snapshot = self._capture_snapshot()
             self._states[self._current_state].pause()
         
-        self._previous_state = self._current_state
-        self._current_state = new_state
-        self._states[self._current_state].enter()
+        self._stack.append(new_state)
+        state.enter()
     
     def pop_state(self):
         """Vuelve al estado anterior (desapila)"""
-        if not self._previous_state:
+        if len(self._stack) < 2:
             return
         
-        if self._current_state and self._current_state in self._states:
-            self._states[self._current_state].exit()
-        
-        self._current_state = self._previous_state
-        self._previous_state = None
-        
-        if self._current_state in self._states:
-            self._states[self._current_state].resume()
+        self._exit_state(self._stack.pop())
+        self._states[self._current_state].resume()
+    
+    def _exit_state(self, state_name: str):
+        """Sale de un estado y libera su captura del estado de abajo"""
+        state = self._states[state_name]
+        state.exit()
+        state.snapshot = None
+        state.release_pinned_images()
+    
+    def _capture_snapshot(self) -> Optional[pygame.Surface]:
+        """Dibuja el estado actual en una superficie aparte"""
+        display = pygame.display.get_surface()
+        if display is None:
+            return None
+        snapshot = pygame.Surface(display.get_size()).convert()
+        self.render(snapshot)
+        return snapshot
+    
+    def get_state(self, state_name: str) -> Optional['GameState']:
+        """Retorna la instancia de un estado registrado (o None)"""
+        return self._states.get(state_name)
     
     def get_current_state(self) -> Optional[str]:
         """Retorna el nombre del estado actual"""
         return self._current_state
     
+    def get_stack(self) -> List[str]:
+        """Retorna los nombres de los estados apilados, del de abajo al de arriba"""
+        return list(self._stack)
+    
     def update(self, dt: float):
         """
         Actualiza el estado actual
@@ -92,8 +126,9 @@ class StateManager:
         Args:
             dt: Delta time (tiempo transcurrido desde el último frame)
         """
-        if self._current_state and self._current_state in self._states:
-            self._states[self._current_state].update(dt)
+        if self._current_state:
+            with profiler.scope(f"{self._current_state}.update"):
+                self._states[self._current_state].update(dt)
     
     def render(self, screen):
         """
@@ -102,15 +137,98 @@ class StateManager:
         Args:
             screen: Superficie de Pygame donde renderizar
         """
-        if self._current_state and self._current_state in self._states:
-            self._states[self._current_state].render(screen)
+        if self._current_state:
+            with profiler.scope(f"{self._current_state}.render"):
+                self._states[self._current_state].render(screen)
 
 
 class GameState:
     """Clase base para todos los estados del juego"""
     
+    # Si es True, el estado avisa con mark_dirty() qué zonas cambiaron y el juego
+    # solo redibuja y envía esas zonas a la pantalla; los frames sin cambios se saltan
+    uses_dirty_rects = False
+    
+    # Si es True, al apilar el estado se captura una vez lo que muestra el estado
+    # de abajo y queda en self.snapshot (disponible desde enter() hasta exit())
+    snapshot_below = False
+    
     def __init__(self, state_manager: StateManager):
         self.state_manager = state_manager
+        self.snapshot: Optional[pygame.Surface] = None
+        self._dirty_rects: List[pygame.Rect] = []
+        self._full_redraw = True
+        self._pinned_images: List[str] = []  # Imágenes fijadas con load_pinned_image
+    
+    def load_pinned_image(self, path: str, use_alpha: bool = False,
+                          fit_screen: bool = True) -> Optional[pygame.Surface]:
+        """
+        Carga una imagen y la fija en la caché mientras el estado esté activo
+        
+        El StateManager la libera al salir del estado (después de exit()),
+        así que no hace falta emparejar pin_image/unpin_image a mano.
+        
+        Args:
+            path: Ruta relativa desde assets/
+            use_alpha: Si True, convert_alpha; si no, convert
+            fit_screen: Si True, la escala al tamaño de la pantalla
+            
+        Returns:
+            Superficie (escalada si hizo falta) o None si no se pudo cargar
+        """
+        game = getattr(self, "game", None)
+        if not game or not game.resource_manager:
+            return None
+        
+        image = game.resource_manager.load_image(path, use_alpha=use_alpha)
+        game.resource_manager.pin_image(path)
+        self._pinned_images.append(path)
+        if image and fit_screen:
+            from src.config import SCREEN_WIDTH, SCREEN_HEIGHT
+            width, height = image.get_size()
+            if width != SCREEN_WIDTH or height != SCREEN_HEIGHT:
+                image = pygame.transform.scale(image, (SCREEN_WIDTH, SCREEN_HEIGHT))
+            print(f"[OK] Imagen de fondo cargada: {path} ({width}x{height})")
+        return image
+    
+    def release_pinned_images(self):
+        """Libera las imágenes fijadas con load_pinned_image (lo llama el StateManager)"""
+        game = getattr(self, "game", None)
+        if game and game.resource_manager:
+            for path in self._pinned_images:
+                game.resource_manager.unpin_image(path)
+        self._pinned_images = []
+    
+    def mark_dirty(self, rect: Optional[pygame.Rect] = None):
+        """
+        Marca una zona de la pantalla para redibujar en el próximo frame
+        
+        Args:
+            rect: Zona que cambió (None = toda la pantalla)
+        """
+        if rect is None:
+            self._full_redraw = True
+        else:
+            self._dirty_rects.append(pygame.Rect(rect))
+    
+    def consume_dirty_rects(self, screen_rect: pygame.Rect) -> List[pygame.Rect]:
+        """
+        Retorna las zonas marcadas desde el último frame y las olvida
+        
+        Args:
+            screen_rect: Rectángulo de la pantalla completa
+            
+        Returns:
+            Lista de zonas a redibujar (vacía si no cambió nada)
+        """
+        if self._full_redraw:
+            rects = [pygame.Rect(screen_rect)]
+        else:
+            rects = [rect.clip(screen_rect) for rect in self._dirty_rects]
+            rects = [rect for rect in rects if rect.width and rect.height]
+        self._dirty_rects = []
+        self._full_redraw = False
+        return rects
         
     def enter(self):
         """Se llama cuando se entra al estado"""
@@ -6,12 +6,14 @@ import pygame
 from src.state_manager import GameState
 from src.config import (
     SCREEN_WIDTH, SCREEN_HEIGHT, COLOR_WHITE, COLOR_BLACK,
-    COLOR_RED, COLOR_GREEN, COLOR_BLUE, STATE_EXPLORATION
+    COLOR_RED, COLOR_GREEN, COLOR_BLUE, STATE_EXPLORATION, TIMELINE_PREVIEW_TURNS
 )
 from src.combat.combat_manager import CombatManager, CombatAction
 from src.combat.enemy import Enemy
 from src.combat.ability import Ability
 from src.combat.status_effect import StatusManager
+from src.combat.combat_snapshot import CombatSnapshot
+from src.combat.enemy_ai import create_ai
 
 
 class CombatState(GameState):
@@ -37,6 +39,9 @@ class CombatState(GameState):
         self.available_actions = ["Ataque", "Habilidad", "Defender", "Item", "Huir"]
         self.current_abilities = []
         
+        # Decisión de la IA enemiga en curso (ver src/combat/enemy_ai.py)
+        self._enemy_decision = None
+        
         # Partículas para efectos de combate
         from src.utils.particles import ParticleSystem
         self.particles = ParticleSystem()
@@ -74,6 +79,13 @@ class CombatState(GameState):
         self.selected_action = 0
         self.action_menu_open = False
         self.target_selection = False
+        self._enemy_decision = None
+    
+    def exit(self):
+        """Detiene la búsqueda de la IA si quedó una en curso"""
+        if self._enemy_decision is not None:
+            self._enemy_decision.cancel()
+            self._enemy_decision = None
     
     def handle_event(self, event):
         """Maneja eventos de entrada"""
@@ -82,8 +94,7 @@ class CombatState(GameState):
             
             # Solo permitir input si es el turno del jugador
             if current_actor not in self.combat_manager.party:
-                # Turno del enemigo - ejecutar automáticamente
-                self._execute_enemy_turn()
+                # Turno del enemigo - lo juega la IA desde update()
                 return True
             
             if self.target_selection:
@@ -153,11 +164,10 @@ class CombatState(GameState):
         self.combat_manager.queue_action(current_actor, action)
         
         # Efecto visual de ataque
-        self.particles.add_explosion(
+        self.particles.burst(
+            "attack",
             target.rect.centerx if hasattr(target, 'rect') else SCREEN_WIDTH - 100,
-            target.rect.centery if hasattr(target, 'rect') else SCREEN_HEIGHT // 2,
-            (255, 100, 0),
-            15
+            target.rect.centery if hasattr(target, 'rect') else SCREEN_HEIGHT // 2
         )
         
         self.target_selection = False
@@ -165,8 +175,10 @@ class CombatState(GameState):
         
         # Ejecutar turno
         results = self.combat_manager.execute_turn()
-        
-        # Efectos visuales según resultados
+        self._show_results(results)
+    
+    def _show_results(self, results):
+        """Efectos visuales según los resultados de un turno"""
         if results.get("action_results"):
             for result in results["action_results"]:
                 if result.get("damage", 0) > 0:
@@ -190,22 +202,50 @@ class CombatState(GameState):
         self.action_menu_open = False
         self.combat_manager.execute_turn()
     
-    def _execute_enemy_turn(self):
-        """Ejecuta el turno de un enemigo (AI básica)"""
-        current_actor = self.combat_manager.get_current_actor()
+    def _update_enemy_turn(self):
+        """Juega el turno enemigo cuando la IA tiene lista su decisión"""
+        combat = self.combat_manager
+        current_actor = combat.get_current_actor()
+        if not combat.combat_active or current_actor not in combat.enemies:
+            return
+        
+        # Los enemigos caídos pierden el turno
+        if current_actor.stats.get("HP", 0) <= 0:
+            combat.queue_action(current_actor, CombatAction(current_actor, "skip"))
+            combat.execute_turn()
+            return
+        
+        if self._enemy_decision is None:
+            ai = create_ai(current_actor.ai_type)
+            self._enemy_decision = ai.decide(CombatSnapshot.from_combat(combat), current_actor.ai_budget_ms)
+        if not self._enemy_decision.ready:
+            return
+        
+        choice = self._enemy_decision.finish()
+        self._enemy_decision = None
+        self._execute_enemy_turn(current_actor, choice)
+    
+    def _execute_enemy_turn(self, actor, choice):
+        """
+        Ejecuta la acción que eligió la IA
+        
+        Args:
+            actor: Enemigo que tiene el turno
+            choice: ActionChoice de la IA (None = pasar el turno)
+        """
+        combatants = self.combat_manager.party + self.combat_manager.enemies
+        if choice is None:
+            action = CombatAction(actor, "skip")
+        else:
+            targets = [combatants[i] for i in choice.targets]
+            ability = next((a for a in actor.abilities if a.id == choice.ability_id), None)
+            if ability is not None:
+                action = CombatAction(actor, "ability", ability=ability, targets=targets)
+            else:
+                action = CombatAction(actor, "attack", targets=targets)
         
-        if current_actor in self.combat_manager.enemies:
-            # AI simple: atacar al primer aliado vivo
-            target = None
-            for party_member in self.combat_manager.party:
-                if party_member.stats.get("HP", 0) > 0:
-                    target = party_member
-                    break
-            
-            if target:
-                action = CombatAction(current_actor, "attack", target=target)
-                self.combat_manager.queue_action(current_actor, action)
-                self.combat_manager.execute_turn()
+        self.combat_manager.queue_action(actor, action)
+        self._show_results(self.combat_manager.execute_turn())
     
     def _try_escape(self):
         """Intenta huir del combate"""
@@ -219,6 +259,9 @@ class CombatState(GameState):
         # Actualizar partículas
         self.particles.update(dt)
         
+        # Turno enemigo (la IA puede estar pensando en su hilo)
+        self._update_enemy_turn()
+        
         # Verificar si el combate terminó
         if not self.combat_manager.combat_active:
             if self.combat_manager.victory:
@@ -279,6 +322,32 @@ class CombatState(GameState):
                 highlight_y = SCREEN_HEIGHT // 2 - 100 + idx * 120
                 highlight_rect = pygame.Rect(highlight_x - 10, highlight_y - 10, 180, 100)
                 pygame.draw.rect(screen, (255, 255, 0), highlight_rect, 3)
+        
+        self._render_turn_preview(screen)
+    
+    def _render_turn_preview(self, screen):
+        """Renderiza los próximos turnos de la línea de tiempo de iniciativa"""
+        upcoming = self.combat_manager.preview_turns(TIMELINE_PREVIEW_TURNS)
+        if not upcoming:
+            return
+        
+        x = 10
+        y = 70
+        label = self.small_font.render("Próximos turnos:", True, (200, 200, 200))
+        screen.blit(label, (x, y))
+        x += label.get_width() + 10
+        
+        for i, combatant in enumerate(upcoming):
+            name = combatant.nombre if hasattr(combatant, 'nombre') else "Jugador"
+            if i == 0:
+                color = (255, 255, 0)
+            elif combatant in self.combat_manager.party:
+                color = COLOR_GREEN
+            else:
+                color = COLOR_RED
+            name_text = self.small_font.render(name, True, color)
+            screen.blit(name_text, (x, y))
+            x += name_text.get_width() + 15
     
     def _render_character(self, screen, character, x, y, is_ally=True):
         """Renderiza un personaje en combate"""
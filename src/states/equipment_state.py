@@ -8,11 +8,19 @@ from src.config import (
     SCREEN_WIDTH, SCREEN_HEIGHT, COLOR_WHITE, COLOR_BLACK
 )
 from src.items.equipment import Equipment
+from src.utils.text_cache import render_text
+from src.utils.fire_text import render_fire_text
 
 
 class EquipmentState(GameState):
     """Estado del equipamiento"""
     
+    uses_dirty_rects = True
+    
+    # Panel principal
+    PANEL_WIDTH = 700
+    PANEL_HEIGHT = 500
+    
     def __init__(self, state_manager):
         super().__init__(state_manager)
         self.game = None
@@ -40,16 +48,8 @@ class EquipmentState(GameState):
                 self.player = exploration.player
                 self.equipment = self.player.equipment
         
-        # Cargar fondo de menú secundario
-        if self.game and self.game.resource_manager:
-            self.background = self.game.resource_manager.load_image("ui/secondary_menu_bg.png", use_alpha=False)
-            if self.background:
-                from src.config import SCREEN_WIDTH, SCREEN_HEIGHT
-                bg_width = self.background.get_width()
-                bg_height = self.background.get_height()
-                if bg_width != SCREEN_WIDTH or bg_height != SCREEN_HEIGHT:
-                    self.background = pygame.transform.scale(self.background, (SCREEN_WIDTH, SCREEN_HEIGHT))
-                print(f"[OK] Fondo de menú secundario cargado: {bg_width}x{bg_height}")
+        # Cargar fondo de menú secundario (fijado en la caché hasta salir del estado)
+        self.background = self.load_pinned_image("ui/secondary_menu_bg.png")
         
         # Fuentes
         from src.utils.font_helper import get_normal_font, get_epic_font, get_small_font
@@ -67,18 +67,32 @@ class EquipmentState(GameState):
                 self.state_manager.pop_state()
                 return True
             elif event.key == pygame.K_UP:
-                self.selected_slot = (self.selected_slot - 1) % len(self.slot_names)
+                self._select_slot((self.selected_slot - 1) % len(self.slot_names))
                 return True
             elif event.key == pygame.K_DOWN:
-                self.selected_slot = (self.selected_slot + 1) % len(self.slot_names)
+                self._select_slot((self.selected_slot + 1) % len(self.slot_names))
                 return True
             elif event.key == pygame.K_x:
                 # Desequipar item seleccionado
                 self._unequip_selected_slot()
+                self.mark_dirty()
                 return True
         
         return False
     
+    def _slot_rect(self, index: int) -> pygame.Rect:
+        """Rectángulo en pantalla de un slot de equipamiento"""
+        panel_x = (SCREEN_WIDTH - self.PANEL_WIDTH) // 2
+        panel_y = (SCREEN_HEIGHT - self.PANEL_HEIGHT) // 2
+        return pygame.Rect(panel_x + 20, panel_y + 80 + index * 80, self.PANEL_WIDTH - 40, 70)
+    
+    def _select_slot(self, index: int):
+        """Cambia el slot seleccionado y marca para redibujar solo los dos slots afectados"""
+        # Margen para los bonos de stats, que sobresalen por debajo del slot
+        self.mark_dirty(self._slot_rect(self.selected_slot).inflate(4, 20))
+        self.selected_slot = index
+        self.mark_dirty(self._slot_rect(self.selected_slot).inflate(4, 20))
+    
     def _unequip_selected_slot(self):
         """Desequipa el item del slot seleccionado"""
         if not self.player or not self.equipment:
@@ -114,8 +128,8 @@ class EquipmentState(GameState):
             screen.blit(overlay, (0, 0))
         
         # Panel principal
-        panel_width = 700
-        panel_height = 500
+        panel_width = self.PANEL_WIDTH
+        panel_height = self.PANEL_HEIGHT
         panel_x = (SCREEN_WIDTH - panel_width) // 2
         panel_y = (SCREEN_HEIGHT - panel_height) // 2
         
@@ -126,7 +140,7 @@ class EquipmentState(GameState):
         screen.blit(panel, (panel_x, panel_y))
         
         # Título con efecto de fuego
-        title_surface = self._render_fire_text(self.title_font, "EQUIPAMIENTO")
+        title_surface = render_fire_text(self.title_font, "EQUIPAMIENTO")
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, panel_y + 30))
         screen.blit(title_surface, title_rect)
         
@@ -137,7 +151,7 @@ class EquipmentState(GameState):
             
             # Color de fondo (más oscuro para mejor legibilidad)
             bg_color = (60, 40, 20, 220) if is_selected else (40, 25, 10, 180)
-            slot_rect = pygame.Rect(panel_x + 20, y_offset + i * 80, panel_width - 40, 70)
+            slot_rect = self._slot_rect(i)
             slot_surface = pygame.Surface((panel_width - 40, 70), pygame.SRCALPHA)
             slot_surface.fill(bg_color)
             screen.blit(slot_surface, slot_rect)
@@ -148,13 +162,13 @@ class EquipmentState(GameState):
             
             # Label del slot (con mejor contraste)
             text_color = (255, 200, 150) if is_selected else (220, 180, 120)
-            label_text = self.font.render(slot_label + ":", True, text_color)
+            label_text = render_text(self.font, slot_label + ":", text_color)
             screen.blit(label_text, (panel_x + 30, y_offset + i * 80 + 10))
             
             # Item equipado
             item = self.equipment.get_equipped_item(slot_name)
             if item:
-                item_text = self.font.render(item.nombre, True, (200, 255, 200))
+                item_text = render_text(self.font, item.nombre, (200, 255, 200))
                 screen.blit(item_text, (panel_x + 30, y_offset + i * 80 + 35))
                 
                 # Bonos de stats
@@ -165,60 +179,25 @@ class EquipmentState(GameState):
                         bonuses.append(f"{stat}: {sign}{bonus}")
                 
                 if bonuses:
-                    bonus_text = self.small_font.render(", ".join(bonuses), True, (255, 220, 150))
+                    bonus_text = render_text(self.small_font, ", ".join(bonuses), (255, 220, 150))
                     screen.blit(bonus_text, (panel_x + 30, y_offset + i * 80 + 55))
             else:
-                empty_text = self.small_font.render("Vacío", True, (150, 130, 100))
+                empty_text = render_text(self.small_font, "Vacío", (150, 130, 100))
                 screen.blit(empty_text, (panel_x + 30, y_offset + i * 80 + 35))
         
         # Stats del personaje (con mejor contraste)
         stats_x = panel_x + panel_width - 250
         stats_y = panel_y + 80
-        stats_title = self.font.render("Stats Totales:", True, (255, 200, 150))
+        stats_title = render_text(self.font, "Stats Totales:", (255, 200, 150))
         screen.blit(stats_title, (stats_x, stats_y))
         
         stats_y += 30
         for stat_name, stat_value in self.player.stats.items():
-            stat_text = self.small_font.render(f"{stat_name}: {stat_value}", True, (220, 200, 180))
+            stat_text = render_text(self.small_font, f"{stat_name}: {stat_value}", (220, 200, 180))
             screen.blit(stat_text, (stats_x, stats_y))
             stats_y += 20
         
         # Instrucciones (con mejor contraste)
         instructions_y = panel_y + panel_height - 40
-        inst_text = self.small_font.render("X: Desequipar | ESC: Cerrar", True, (220, 200, 180))
+        inst_text = render_text(self.small_font, "X: Desequipar | ESC: Cerrar", (220, 200, 180))
         screen.blit(inst_text, (panel_x + 20, instructions_y))
-    
-    def _render_fire_text(self, font, text, intensity=1.0):
-        """Renderiza texto con efecto de fuego oscuro (mismo que otros menús)"""
-        # Colores de fuego oscuro
-        fire_colors = [
-            (255, 150, 50),   # Naranja dorado
-            (255, 120, 30),   # Naranja oscuro
-            (220, 80, 20),    # Naranja rojizo oscuro
-            (180, 50, 10),    # Rojo naranja oscuro
-            (150, 40, 5),     # Rojo oscuro
-            (120, 30, 0),     # Rojo muy oscuro
-            (80, 20, 0),      # Rojo casi negro
-        ]
-        
-        fire_colors = [tuple(int(c * intensity) for c in color) for color in fire_colors]
-        base_text = font.render(text, True, fire_colors[-1])
-        text_surface = pygame.Surface(base_text.get_size(), pygame.SRCALPHA)
-        
-        num_layers = len(fire_colors)
-        for i, color in enumerate(fire_colors):
-            offset_x = int((num_layers - i) * 0.5)
-            offset_y = int((num_layers - i) * 0.3)
-            layer_text = font.render(text, True, color)
-            alpha = int(255 * (1.0 - i * 0.15))
-            if alpha > 0:
-                layer_text.set_alpha(alpha)
-                text_surface.blit(layer_text, (offset_x, offset_y))
-        
-        center_text = font.render(text, True, fire_colors[0])
-        center_rect = center_text.get_rect(center=(text_surface.get_width() // 2, 
-                                                    text_surface.get_height() // 2))
-        text_surface.blit(center_text, center_rect)
-        
-        return text_surface
-
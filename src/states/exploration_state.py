@@ -15,6 +15,8 @@ from src.map.map_manager import MapManager
 from src.map.map_transition import MapTransition
 from src.map.tile_generator import initialize_tile_generator, TileGenerator
 from src.camera import Camera
+from src.utils.text_cache import render_text
+from src.utils.profiler import profiler
 
 
 class ExplorationState(GameState):
@@ -37,6 +39,10 @@ class ExplorationState(GameState):
         # Input
         self.keys_pressed = {}
         
+        # Posiciones al empezar el último tick (jugador x, y, cámara x, y) para
+        # interpolar el render entre ticks; None tras un salto (no interpolar)
+        self._prev_positions = None
+        
         # Partículas
         from src.utils.particles import ParticleSystem
         self.particles = ParticleSystem()
@@ -51,23 +57,29 @@ class ExplorationState(GameState):
             asset_lib = self.game.asset_lib
         
         # Inicializar tile_generator con resource_manager para usar tilesets reales
+        # (el de la pantalla de carga si ya está listo)
+        if self.tile_generator is None and self.game:
+            self.tile_generator = getattr(self.game, "tile_generator", None)
         if self.tile_generator is None:
             self.tile_generator = TileGenerator(resource_manager, asset_lib)
         
         # Intentar cargar mapa map_01.tmx primero
         map_loaded = False
         map_file = "map_01.tmx"
-        if self.map_manager.load_map(map_file):
+        if self.map_manager.load_compiled(map_file):
             map_loaded = True
             print(f"[OK] Mapa {map_file} cargado")
         else:
             # Intentar con diferentes nombres
             for alt_name in ["map_01.tmx", "map01.tmx", "Map_01.tmx"]:
-                if self.map_manager.load_map(alt_name):
+                if self.map_manager.load_compiled(alt_name):
                     map_loaded = True
                     print(f"[OK] Mapa {alt_name} cargado")
                     break
         
+        # El mapa nuevo reemplaza al pueblo generado que hubiera
+        self.set_village_renderer(None)
+        
         # Si no hay .tmx, crear mapa simple (base_grass + house)
         if not map_loaded and resource_manager:
             # Crear mapa simple: base_grass con una casa en la esquina superior izquierda
@@ -75,6 +87,8 @@ class ExplorationState(GameState):
         else:
             self.map_background = None
             self.simple_map_data = None
+            # Leer en segundo plano los mapas a los que llevan sus salidas
+            self.map_manager.preload_neighbors()
         
         # Crear jugador (posición inicial para top-down)
         # Colocar en el centro del mapa
@@ -133,16 +147,20 @@ class ExplorationState(GameState):
         
         self.camera = Camera(map_width_tiles, map_height_tiles)
         self.camera.update(self.player)
+        self._prev_positions = None
         
         print("Estado de exploración iniciado (vista top-down)")
     
     def update(self, dt):
         """Actualiza la lógica de exploración (top-down)"""
+        if self.camera:
+            self._prev_positions = (self.player.x, self.player.y, self.camera.rect.x, self.camera.rect.y)
+        
         # Manejar input de movimiento en 4 direcciones
         dx = 0
         dy = 0
         
-        keys = pygame.key.get_pressed()
+        keys = self.game.get_pressed_keys() if self.game else pygame.key.get_pressed()
         
         if keys[pygame.K_LEFT] or keys[pygame.K_a]:
             dx = -1
@@ -234,37 +252,40 @@ class ExplorationState(GameState):
     
     def render(self, screen):
         """Renderiza el estado de exploración (top-down)"""
+        view, player_pos = self._get_render_view()
+        
         # Limpiar pantalla con color de fondo
         screen.fill((100, 150, 100))  # Verde pasto
         
         # Prioridad: Renderizar mapa de Tiled (map_01.tmx) si existe
-        if self.camera and self.map_manager.current_map:
-            self.map_manager.render(screen, self.camera.rect)
-        elif self.simple_map_data and self.camera:
-            # Renderizar mapa simple (base_grass + house)
-            self._render_simple_map(screen)
-        elif self.map_background and self.camera:
-            # Renderizar mapa PNG directamente
-            # Calcular qué parte del mapa es visible
-            start_x = max(0, self.camera.rect.x)
-            start_y = max(0, self.camera.rect.y)
-            end_x = min(self.map_background_size[0], self.camera.rect.x + self.camera.rect.width)
-            end_y = min(self.map_background_size[1], self.camera.rect.y + self.camera.rect.height)
-            
-            # Dibujar la porción visible del mapa PNG
-            screen.blit(self.map_background, 
-                       (start_x - self.camera.rect.x, start_y - self.camera.rect.y),
-                       (start_x, start_y, end_x - start_x, end_y - start_y))
-        elif self.village_renderer and self.camera:
-            # Fallback: renderizar pueblo generado
-            self.village_renderer.render(screen, self.camera.rect)
-        else:
-            # Fallback: renderizar fondo (tiles de césped)
-            self._render_background(screen)
+        with profiler.scope("map"):
+            if self.camera and self.map_manager.current_map:
+                self.map_manager.render(screen, view)
+            elif self.simple_map_data and self.camera:
+                # Renderizar mapa simple (base_grass + house)
+                self._render_simple_map(screen, view)
+            elif self.map_background and self.camera:
+                # Renderizar mapa PNG directamente
+                # Calcular qué parte del mapa es visible
+                start_x = max(0, view.x)
+                start_y = max(0, view.y)
+                end_x = min(self.map_background_size[0], view.x + view.width)
+                end_y = min(self.map_background_size[1], view.y + view.height)
+                
+                # Dibujar la porción visible del mapa PNG
+                screen.blit(self.map_background, 
+                           (start_x - view.x, start_y - view.y),
+                           (start_x, start_y, end_x - start_x, end_y - start_y))
+            elif self.village_renderer and self.camera:
+                # Fallback: renderizar pueblo generado
+                self.village_renderer.render(screen, view)
+            else:
+                # Fallback: renderizar fondo (tiles de césped)
+                self._render_background(screen, view)
         
         # Renderizar jugador
         if self.player and self.camera:
-            screen_x, screen_y = self.camera.apply(self.player)
+            screen_x, screen_y = player_pos
             
             # Renderizar sprite del jugador (asegurar que existe y tiene tamaño válido)
             if self.player.image:
@@ -293,36 +314,63 @@ class ExplorationState(GameState):
             
             # Efecto de pasos (partículas ocasionales)
             if self.player.moving and random.random() < 0.1:
-                self.particles.add_magic_sparkles(
+                self.particles.burst(
+                    "footsteps",
                     self.player.rect.centerx,
-                    self.player.rect.centery,
-                    (200, 200, 200),
-                    2
+                    self.player.rect.centery
                 )
         
         # Renderizar partículas
-        if self.camera:
-            camera_offset = (self.camera.rect.x, self.camera.rect.y)
-            self.particles.render(screen, camera_offset)
+        with profiler.scope("particles"):
+            if self.camera:
+                camera_offset = (view.x, view.y)
+                self.particles.render(screen, camera_offset)
         
         # Renderizar HUD básico
-        from src.utils.font_helper import get_normal_font, get_small_font
-        font = get_normal_font(24)
-        small_font = get_small_font(18)
-        
-        # Información básica
-        info_text = font.render("ESC: Pausa | I: Inventario", True, (255, 255, 255))
-        screen.blit(info_text, (10, 10))
-        
-        # Stats del jugador (si existe)
-        if self.player:
-            hp_text = small_font.render(f"HP: {self.player.stats.get('HP', 0)}/{self.player.max_hp}", True, (255, 100, 100))
-            mp_text = small_font.render(f"MP: {self.player.stats.get('MP', 0)}/{self.player.max_mp}", True, (100, 100, 255))
-            screen.blit(hp_text, (10, 35))
-            screen.blit(mp_text, (10, 55))
+        with profiler.scope("hud"):
+            from src.utils.font_helper import get_normal_font, get_small_font
+            font = get_normal_font(24)
+            small_font = get_small_font(18)
+            
+            # Información básica
+            info_text = render_text(font, "ESC: Pausa | I: Inventario", (255, 255, 255))
+            screen.blit(info_text, (10, 10))
             
-            level_text = small_font.render(f"Nivel: {self.player.level}", True, (255, 255, 255))
-            screen.blit(level_text, (10, 75))
+            # Stats del jugador (si existe)
+            if self.player:
+                hp_text = render_text(small_font, f"HP: {self.player.stats.get('HP', 0)}/{self.player.max_hp}", (255, 100, 100))
+                mp_text = render_text(small_font, f"MP: {self.player.stats.get('MP', 0)}/{self.player.max_mp}", (100, 100, 255))
+                screen.blit(hp_text, (10, 35))
+                screen.blit(mp_text, (10, 55))
+                
+                level_text = render_text(small_font, f"Nivel: {self.player.level}", (255, 255, 255))
+                screen.blit(level_text, (10, 75))
+    
+    def _get_render_view(self):
+        """
+        Calcula la vista de la cámara y la posición del jugador para este frame
+        
+        Interpola entre el tick anterior y el actual según game.interpolation,
+        así el movimiento se ve suave aunque la lógica corra a paso fijo.
+        
+        Returns:
+            Tupla (rectángulo de la vista, (x, y) del jugador en pantalla)
+        """
+        if not self.camera or not self.player:
+            return (self.camera.rect if self.camera else None), (0, 0)
+        
+        player_x = self.player.rect.x
+        player_y = self.player.rect.y
+        view = self.camera.rect
+        alpha = self.game.interpolation if self.game else 1.0
+        if self._prev_positions is not None and alpha < 1.0:
+            prev_x, prev_y, prev_view_x, prev_view_y = self._prev_positions
+            player_x = int(prev_x + (self.player.x - prev_x) * alpha)
+            player_y = int(prev_y + (self.player.y - prev_y) * alpha)
+            view = view.copy()
+            view.x = round(prev_view_x + (self.camera.rect.x - prev_view_x) * alpha)
+            view.y = round(prev_view_y + (self.camera.rect.y - prev_view_y) * alpha)
+        return view, (player_x - view.x, player_y - view.y)
     
     def _create_simple_map(self, resource_manager):
         """Crea un mapa simple: base_grass con una casa en la esquina superior izquierda"""
@@ -345,31 +393,27 @@ class ExplorationState(GameState):
         
         # Intentar cargar house tile desde legacy_Buildings
         try:
-            house_tileset = resource_manager.load_image("tilesets/legacy_Buildings.png", use_alpha=True)
-            if house_tileset and self.tile_generator:
-                # Extraer un tile de casa (probablemente en las primeras filas/columnas)
-                # Intentar diferentes posiciones hasta encontrar un tile válido
-                for y in range(3):
-                    for x in range(5):
-                        house_tile = self.tile_generator._extract_tile_from_tileset(house_tileset, x, y)
-                        if house_tile:
-                            self.house_tile = house_tile
-                            print(f"[OK] Casa cargada desde legacy_Buildings.png (tile {x},{y})")
-                            break
-                    if self.house_tile:
+            # Extraer un tile de casa (probablemente en las primeras filas/columnas)
+            # Intentar diferentes posiciones hasta encontrar un tile válido
+            for y in range(3):
+                for x in range(5):
+                    house_tile = resource_manager.get_tile("tilesets/legacy_Buildings.png", x, y)
+                    if house_tile:
+                        self.house_tile = house_tile
+                        print(f"[OK] Casa cargada desde legacy_Buildings.png (tile {x},{y})")
                         break
+                if self.house_tile:
+                    break
         except Exception as e:
             print(f"[WARNING] Error cargando casa desde legacy_Buildings: {e}")
         
         # Si no se encontró casa, intentar desde house_details
         if not self.house_tile:
             try:
-                house_details = resource_manager.load_image("tilesets/house_details.png", use_alpha=True)
-                if house_details and self.tile_generator:
-                    house_tile = self.tile_generator._extract_tile_from_tileset(house_details, 0, 0)
-                    if house_tile:
-                        self.house_tile = house_tile
-                        print("[OK] Casa cargada desde house_details.png")
+                house_tile = resource_manager.get_tile("tilesets/house_details.png", 0, 0)
+                if house_tile:
+                    self.house_tile = house_tile
+                    print("[OK] Casa cargada desde house_details.png")
             except Exception as e:
                 print(f"[WARNING] Error cargando casa desde house_details: {e}")
         
@@ -383,7 +427,7 @@ class ExplorationState(GameState):
         
         print(f"[OK] Mapa simple creado: {map_width}x{map_height} tiles (base_grass + house)")
     
-    def _render_simple_map(self, screen):
+    def _render_simple_map(self, screen, view: pygame.Rect):
         """Renderiza el mapa simple (base_grass + house)"""
         if not self.simple_map_data:
             return
@@ -394,10 +438,10 @@ class ExplorationState(GameState):
         house_pos = self.simple_map_data['house_pos']
         
         # Calcular qué tiles son visibles
-        start_tile_x = max(0, self.camera.rect.x // TILE_SIZE)
-        start_tile_y = max(0, self.camera.rect.y // TILE_SIZE)
-        end_tile_x = min(map_width, (self.camera.rect.x + self.camera.rect.width) // TILE_SIZE + 1)
-        end_tile_y = min(map_height, (self.camera.rect.y + self.camera.rect.height) // TILE_SIZE + 1)
+        start_tile_x = max(0, view.x // TILE_SIZE)
+        start_tile_y = max(0, view.y // TILE_SIZE)
+        end_tile_x = min(map_width, (view.x + view.width) // TILE_SIZE + 1)
+        end_tile_y = min(map_height, (view.y + view.height) // TILE_SIZE + 1)
         
         # Renderizar grass tiles
         for y in range(start_tile_y, end_tile_y):
@@ -406,8 +450,8 @@ class ExplorationState(GameState):
                 tile_world_y = y * TILE_SIZE
                 
                 # Convertir coordenadas del mundo a pantalla
-                tile_screen_x = tile_world_x - self.camera.rect.x
-                tile_screen_y = tile_world_y - self.camera.rect.y
+                tile_screen_x = tile_world_x - view.x
+                tile_screen_y = tile_world_y - view.y
                 
                 # Renderizar grass
                 screen.blit(grass_tile, (tile_screen_x, tile_screen_y))
@@ -419,11 +463,11 @@ class ExplorationState(GameState):
             self.house_tile):
             house_world_x = house_x * TILE_SIZE
             house_world_y = house_y * TILE_SIZE
-            house_screen_x = house_world_x - self.camera.rect.x
-            house_screen_y = house_world_y - self.camera.rect.y
+            house_screen_x = house_world_x - view.x
+            house_screen_y = house_world_y - view.y
             screen.blit(self.house_tile, (house_screen_x, house_screen_y))
     
-    def _render_background(self, screen):
+    def _render_background(self, screen, view: pygame.Rect):
         """Renderiza el fondo para top-down (tiles de césped)"""
         # SCREEN_WIDTH, SCREEN_HEIGHT, TILE_SIZE ya están importados arriba
         
@@ -444,8 +488,8 @@ class ExplorationState(GameState):
         grass_tile = self.tile_generator.get_tile("grass")
         
         # Calcular qué tiles están visibles
-        start_tile_x = self.camera.rect.x // TILE_SIZE
-        start_tile_y = self.camera.rect.y // TILE_SIZE
+        start_tile_x = view.x // TILE_SIZE
+        start_tile_y = view.y // TILE_SIZE
         tiles_x = (SCREEN_WIDTH // TILE_SIZE) + 2
         tiles_y = (SCREEN_HEIGHT // TILE_SIZE) + 2
         
@@ -453,12 +497,23 @@ class ExplorationState(GameState):
             for x in range(tiles_x):
                 tile_world_x = (start_tile_x + x) * TILE_SIZE
                 tile_world_y = (start_tile_y + y) * TILE_SIZE
-                tile_screen_x = tile_world_x - self.camera.rect.x
-                tile_screen_y = tile_world_y - self.camera.rect.y
+                tile_screen_x = tile_world_x - view.x
+                tile_screen_y = tile_world_y - view.y
                 
                 if -TILE_SIZE < tile_screen_x < SCREEN_WIDTH and -TILE_SIZE < tile_screen_y < SCREEN_HEIGHT:
                     screen.blit(grass_tile, (tile_screen_x, tile_screen_y))
     
+    def set_village_renderer(self, renderer):
+        """
+        Reemplaza el renderizador del pueblo generado, cerrando el anterior
+        
+        Args:
+            renderer: VillageMapRenderer nuevo o None
+        """
+        if self.village_renderer is not None and self.village_renderer is not renderer:
+            self.village_renderer.close()
+        self.village_renderer = renderer
+    
     def _change_map(self, map_id: str, spawn_point: str = "default"):
         """
         Cambia de mapa
@@ -469,6 +524,7 @@ class ExplorationState(GameState):
         """
         spawn_pos = self.map_transition.change_map(map_id, spawn_point)
         if spawn_pos:
+            self.set_village_renderer(None)
             self.player.x = spawn_pos[0]
             self.player.y = spawn_pos[1]
             self.player.rect.x = int(spawn_pos[0])
@@ -479,4 +535,5 @@ class ExplorationState(GameState):
             map_height_tiles = self.map_manager.get_map_height() // TILE_SIZE if self.map_manager.get_map_height() > 0 else 50
             self.camera = Camera(map_width_tiles, map_height_tiles)
             self.camera.update(self.player)
+            self._prev_positions = None
 
@@ -9,11 +9,15 @@ from src.config import (
     STATE_EXPLORATION
 )
 from src.items.item import Item
+from src.utils.text_cache import render_text
+from src.utils.fire_text import render_fire_text
 
 
 class InventoryState(GameState):
     """Estado del inventario"""
     
+    uses_dirty_rects = True
+    
     def __init__(self, state_manager):
         super().__init__(state_manager)
         self.game = None
@@ -46,16 +50,8 @@ class InventoryState(GameState):
                 self.player = exploration.player
                 self.inventory = self.player.inventory
         
-        # Cargar fondo de menú secundario
-        if self.game and self.game.resource_manager:
-            self.background = self.game.resource_manager.load_image("ui/secondary_menu_bg.png", use_alpha=False)
-            if self.background:
-                from src.config import SCREEN_WIDTH, SCREEN_HEIGHT
-                bg_width = self.background.get_width()
-                bg_height = self.background.get_height()
-                if bg_width != SCREEN_WIDTH or bg_height != SCREEN_HEIGHT:
-                    self.background = pygame.transform.scale(self.background, (SCREEN_WIDTH, SCREEN_HEIGHT))
-                print(f"[OK] Fondo de menú secundario cargado: {bg_width}x{bg_height}")
+        # Cargar fondo de menú secundario (fijado en la caché hasta salir del estado)
+        self.background = self.load_pinned_image("ui/secondary_menu_bg.png")
         
         # Fuentes
         from src.utils.font_helper import get_normal_font, get_epic_font, get_small_font
@@ -69,6 +65,8 @@ class InventoryState(GameState):
     def handle_event(self, event):
         """Maneja eventos de entrada"""
         if event.type == pygame.KEYDOWN:
+            # Casi todas las teclas cambian la lista, el filtro o la descripción: redibujar todo
+            self.mark_dirty()
             if event.key == pygame.K_ESCAPE or event.key == pygame.K_i:
                 # Cerrar inventario
                 self.state_manager.pop_state()
@@ -209,12 +207,12 @@ class InventoryState(GameState):
         screen.blit(panel, (panel_x, panel_y))
         
         # Título con efecto de fuego
-        title_surface = self._render_fire_text(self.title_font, "INVENTARIO")
+        title_surface = render_fire_text(self.title_font, "INVENTARIO")
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, panel_y + 30))
         screen.blit(title_surface, title_rect)
         
         # Filtro actual (con mejor contraste)
-        filter_text = self.font.render(f"Filtro: {self.current_filter} (← →)", True, (255, 200, 150))
+        filter_text = render_text(self.font, f"Filtro: {self.current_filter} (← →)", (255, 200, 150))
         screen.blit(filter_text, (panel_x + 20, panel_y + 70))
         
         # Lista de items
@@ -249,11 +247,11 @@ class InventoryState(GameState):
                     item_name += f" x{slot.quantity}"
                 # Texto con color más claro para mejor legibilidad
                 text_color = (255, 200, 150) if is_selected else (220, 180, 120)
-                name_text = self.font.render(item_name, True, text_color)
+                name_text = render_text(self.font, item_name, text_color)
                 screen.blit(name_text, (panel_x + 30, y_offset + (i - start_index) * 45 + 8))
                 
                 # Descripción (pequeña, con mejor contraste)
-                desc_text = self.small_font.render(slot.item.descripcion[:50], True, (180, 160, 140))
+                desc_text = render_text(self.small_font, slot.item.descripcion[:50], (180, 160, 140))
                 screen.blit(desc_text, (panel_x + 30, y_offset + (i - start_index) * 45 + 25))
         
         # Instrucciones (con mejor contraste)
@@ -262,41 +260,6 @@ class InventoryState(GameState):
             "ENTER: Usar | E: Equipar | X: Tirar | ESC: Cerrar"
         ]
         for instruction in instructions:
-            inst_text = self.small_font.render(instruction, True, (220, 200, 180))
+            inst_text = render_text(self.small_font, instruction, (220, 200, 180))
             screen.blit(inst_text, (panel_x + 20, instructions_y))
             instructions_y += 20
-    
-    def _render_fire_text(self, font, text, intensity=1.0):
-        """Renderiza texto con efecto de fuego oscuro (mismo que otros menús)"""
-        # Colores de fuego oscuro
-        fire_colors = [
-            (255, 150, 50),   # Naranja dorado
-            (255, 120, 30),   # Naranja oscuro
-            (220, 80, 20),    # Naranja rojizo oscuro
-            (180, 50, 10),    # Rojo naranja oscuro
-            (150, 40, 5),     # Rojo oscuro
-            (120, 30, 0),     # Rojo muy oscuro
-            (80, 20, 0),      # Rojo casi negro
-        ]
-        
-        fire_colors = [tuple(int(c * intensity) for c in color) for color in fire_colors]
-        base_text = font.render(text, True, fire_colors[-1])
-        text_surface = pygame.Surface(base_text.get_size(), pygame.SRCALPHA)
-        
-        num_layers = len(fire_colors)
-        for i, color in enumerate(fire_colors):
-            offset_x = int((num_layers - i) * 0.5)
-            offset_y = int((num_layers - i) * 0.3)
-            layer_text = font.render(text, True, color)
-            alpha = int(255 * (1.0 - i * 0.15))
-            if alpha > 0:
-                layer_text.set_alpha(alpha)
-                text_surface.blit(layer_text, (offset_x, offset_y))
-        
-        center_text = font.render(text, True, fire_colors[0])
-        center_rect = center_text.get_rect(center=(text_surface.get_width() // 2, 
-                                                    text_surface.get_height() // 2))
-        text_surface.blit(center_text, center_rect)
-        
-        return text_surface
-
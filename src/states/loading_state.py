@@ -5,7 +5,23 @@ Estado de carga - Pantalla de loading estilo EA Games
 import pygame
 import math
 from src.state_manager import GameState
-from src.config import SCREEN_WIDTH, SCREEN_HEIGHT, STATE_MENU
+from src.config import SCREEN_WIDTH, SCREEN_HEIGHT, STATE_MENU, STATE_EXPLORATION
+from src.map.tile_generator import TileGenerator, build_placeholder_tiles
+
+
+# Assets que el menú necesita apenas aparece: (ruta, use_alpha)
+REQUIRED_IMAGES = [("ui/main_menu_bg.png", False)]
+REQUIRED_DATA = ["characters/character_base.json", "items/items_base.json"]
+
+# Assets que se siguen cargando en segundo plano mientras se muestra el menú
+BACKGROUND_IMAGES = [
+    ("ui/secondary_menu_bg.png", False),
+    ("sprites/player.png", True),
+    ("tilesets/base_grass.png", True),
+    ("tilesets/legacy_Buildings.png", True),
+]
+BACKGROUND_DATA = ["enemies/enemies_base.json"]
+FIRST_MAP = "map_01.tmx"
 
 
 class LoadingState(GameState):
@@ -21,8 +37,9 @@ class LoadingState(GameState):
         self.dot_timer = 0.0
         self.fade_alpha = 255
         self.loading_complete = False
-        self.min_loading_time = 2.5  # Tiempo mínimo de carga (segundos)
-        self.loading_start_time = 0.0
+        self.min_loading_time = 1.0  # Tiempo mínimo (lo que dura la entrada del logo)
+        self.target_progress = 0.0  # Progreso real de la cola de carga
+        self.elapsed = 0.0
         self.game = None
         self.font = None
         self.epic_font = None
@@ -58,16 +75,63 @@ class LoadingState(GameState):
         else:
             print(f"[WARNING] game o resource_manager no disponible")
         
+        self._queue_assets()
+        
         # Inicializar variables de animación
         self.logo_scale = 0.0
         self.logo_alpha = 0
         self.progress = 0.0
+        self.target_progress = 0.0
         self.loading_dots = 0
         self.dot_timer = 0.0
         self.fade_alpha = 255
         self.loading_complete = False
-        self.loading_start_time = pygame.time.get_ticks() / 1000.0
-        print(f"[DEBUG] LoadingState inicializado. Tiempo inicio: {self.loading_start_time}")
+        self.elapsed = 0.0  # Tiempo simulado en la pantalla (sigue al paso fijo, no al reloj)
+        print("[DEBUG] LoadingState inicializado")
+    
+    def _queue_assets(self):
+        """Encola en el AssetLoader lo que se carga durante esta pantalla"""
+        loader = getattr(self.game, "asset_loader", None) if self.game else None
+        if loader is None:
+            return
+        
+        for path, use_alpha in REQUIRED_IMAGES:
+            loader.queue_image(path, use_alpha=use_alpha, required=True)
+        for path in REQUIRED_DATA:
+            loader.queue_data(path, required=True)
+        
+        for path, use_alpha in BACKGROUND_IMAGES:
+            loader.queue_image(path, use_alpha=use_alpha)
+        for path in BACKGROUND_DATA:
+            loader.queue_data(path)
+        
+        # Lista de fuentes del sistema (solo se usa si falta la fuente del juego)
+        loader.queue_call("fonts", pygame.font.get_fonts)
+        
+        # Registro de assets disponibles (escaneo de directorios)
+        asset_lib = getattr(self.game, "asset_lib", None)
+        if asset_lib is not None:
+            loader.queue_call("asset_library", asset_lib.scan_registry,
+                              asset_lib.set_registry, required=True)
+        
+        # Tiles procedurales; el TileGenerator se arma en el hilo principal
+        game = self.game
+        
+        def finish_tiles(tiles):
+            game.tile_generator = TileGenerator(game.resource_manager, asset_lib, tiles)
+        
+        loader.queue_call("tiles", build_placeholder_tiles, finish_tiles)
+        
+        # Primer mapa: se parsea en la caché del MapManager de exploración
+        exploration = self.state_manager.get_state(STATE_EXPLORATION)
+        if exploration is not None and hasattr(exploration, "map_manager"):
+            map_manager = exploration.map_manager
+            
+            def read_map():
+                map_manager.preload_map(FIRST_MAP)
+                map_manager.wait_for_preload(FIRST_MAP)
+            
+            loader.queue_call(f"map:{FIRST_MAP}", read_map)
     
     def _init_sparks(self):
         """Inicializa las chispitas del fondo"""
@@ -103,8 +167,8 @@ class LoadingState(GameState):
         if dt <= 0:
             dt = 0.016  # ~60 FPS
         
-        current_time = pygame.time.get_ticks() / 1000.0
-        elapsed = current_time - self.loading_start_time
+        self.elapsed += dt
+        elapsed = self.elapsed
         
         # Animación de entrada del logo (escala y fade in)
         if elapsed < 1.0:
@@ -120,19 +184,20 @@ class LoadingState(GameState):
             self.logo_scale = 1.0
             self.logo_alpha = 255
         
-        # Progreso de carga (simulado) - Asegurar que siempre avance
-        if elapsed < self.min_loading_time:
-            # Progreso suave hasta el tiempo mínimo
-            self.progress = min(0.95, elapsed / self.min_loading_time)
+        # Progreso real de los assets obligatorios (sin loader, se completa con el tiempo)
+        loader = getattr(self.game, "asset_loader", None) if self.game else None
+        if loader is not None:
+            self.target_progress = loader.get_progress(required_only=True)
+            ready = loader.is_ready()
         else:
-            # Completar carga - asegurar que llegue al 100%
-            remaining = 1.0 - self.progress
-            if remaining > 0:
-                # Avanzar más rápido al final
-                self.progress = min(1.0, self.progress + dt * 2.0)
-            else:
-                self.progress = 1.0
-            
+            self.target_progress = min(1.0, elapsed / self.min_loading_time)
+            ready = True
+        
+        # La barra avanza suave hacia el progreso real
+        self.progress = min(self.target_progress, self.progress + dt * 2.0)
+        
+        # Pasar al menú cuando terminó la entrada del logo y los assets obligatorios
+        if elapsed >= self.min_loading_time and ready:
             # Cuando llegue al 100%, iniciar fade out
             if self.progress >= 1.0 and not self.loading_complete:
                 self.loading_complete = True
@@ -141,7 +206,7 @@ class LoadingState(GameState):
             # Fade out después de completar
             if self.loading_complete:
                 # Pequeño delay antes del fade out
-                if elapsed > self.min_loading_time + 0.5:
+                if elapsed > self.min_loading_time + 0.2:
                     self.fade_alpha = max(0, self.fade_alpha - int(255 * dt * 2))
                     
                     # Cambiar al menú cuando el fade out termine
@@ -5,6 +5,7 @@ Estado del menú principal
 import pygame
 from src.state_manager import GameState
 from src.config import SCREEN_WIDTH, SCREEN_HEIGHT, COLOR_WHITE, STATE_EXPLORATION
+from src.utils.fire_text import render_fire_text, render_fire_text_animated
 
 
 class MenuState(GameState):
@@ -29,6 +30,7 @@ class MenuState(GameState):
         # Cargar imagen de fondo
         if self.game and self.game.resource_manager:
             self.background = self.game.resource_manager.load_image("ui/main_menu_bg.png", use_alpha=False)
+            self.game.resource_manager.pin_image("ui/main_menu_bg.png")
             # Escalar la imagen al tamaño de la pantalla si es necesario
             if self.background:
                 from src.config import SCREEN_WIDTH, SCREEN_HEIGHT
@@ -41,6 +43,11 @@ class MenuState(GameState):
             else:
                 print("[ADVERTENCIA] No se pudo cargar el fondo del menú")
         
+    def exit(self):
+        """Libera el fondo fijado en la caché"""
+        if self.game and self.game.resource_manager:
+            self.game.resource_manager.unpin_image("ui/main_menu_bg.png")
+    
     def update(self, dt):
         """Actualiza la lógica del menú"""
         pass
@@ -85,7 +92,7 @@ class MenuState(GameState):
         
         # Título con efecto de fuego (gradiente de colores cálidos)
         title_text = "El Gremio del Sol Naciente"
-        title_surface = self._render_fire_text(self.title_font, title_text)
+        title_surface = render_fire_text(self.title_font, title_text)
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 150))
         screen.blit(title_surface, title_rect)
         
@@ -98,11 +105,11 @@ class MenuState(GameState):
             # Color según selección
             if i == self.selected_option:
                 # Opción seleccionada: efecto de fuego más intenso
-                text_surface = self._render_fire_text(self.font, option, intensity=1.0)
+                text_surface = render_fire_text_animated(self.font, option, pygame.time.get_ticks() / 1000.0)
                 bg_color = (100, 50, 0, 200)  # Fondo naranja oscuro semi-transparente
             else:
                 # Opción no seleccionada: fuego más suave
-                text_surface = self._render_fire_text(self.font, option, intensity=0.6)
+                text_surface = render_fire_text(self.font, option, intensity=0.6)
                 bg_color = (50, 25, 0, 120)  # Fondo marrón oscuro semi-transparente
             
             # Fondo del botón (rectángulo semi-transparente)
@@ -131,59 +138,3 @@ class MenuState(GameState):
                 # Flecha con color de fuego
                 fire_color = (255, 200, 0) if i == self.selected_option else (200, 100, 0)
                 pygame.draw.polygon(screen, fire_color, arrow_points)
-    
-    def _render_fire_text(self, font, text, intensity=1.0):
-        """
-        Renderiza texto con efecto de fuego (gradiente de colores cálidos oscuros)
-        
-        Args:
-            font: Fuente de pygame
-            text: Texto a renderizar
-            intensity: Intensidad del efecto (0.0 a 1.0)
-            
-        Returns:
-            Superficie con el texto renderizado con efecto de fuego
-        """
-        # Colores de fuego oscuro (de más claro a más oscuro)
-        fire_colors = [
-            (255, 150, 50),   # Naranja dorado (centro - más oscuro)
-            (255, 120, 30),   # Naranja oscuro
-            (220, 80, 20),    # Naranja rojizo oscuro
-            (180, 50, 10),    # Rojo naranja oscuro
-            (150, 40, 5),     # Rojo oscuro
-            (120, 30, 0),     # Rojo muy oscuro
-            (80, 20, 0),      # Rojo casi negro (bordes)
-        ]
-        
-        # Ajustar intensidad
-        fire_colors = [tuple(int(c * intensity) for c in color) for color in fire_colors]
-        
-        # Crear superficie base con el texto en el color más oscuro (para sombra)
-        base_text = font.render(text, True, fire_colors[-1])
-        text_surface = pygame.Surface(base_text.get_size(), pygame.SRCALPHA)
-        
-        # Renderizar múltiples capas del texto con diferentes colores y offsets
-        # para crear efecto de gradiente/fuego
-        num_layers = len(fire_colors)
-        for i, color in enumerate(fire_colors):
-            # Offset para crear efecto de profundidad
-            offset_x = int((num_layers - i) * 0.5)
-            offset_y = int((num_layers - i) * 0.3)
-            
-            # Renderizar texto con este color
-            layer_text = font.render(text, True, color)
-            
-            # Aplicar alpha según la capa (más transparente en los bordes)
-            alpha = int(255 * (1.0 - i * 0.15))
-            if alpha > 0:
-                layer_text.set_alpha(alpha)
-                text_surface.blit(layer_text, (offset_x, offset_y))
-        
-        # Capa final con el color más brillante en el centro
-        center_text = font.render(text, True, fire_colors[0])
-        center_rect = center_text.get_rect(center=(text_surface.get_width() // 2, 
-                                                    text_surface.get_height() // 2))
-        text_surface.blit(center_text, center_rect)
-        
-        return text_surface
-
@@ -5,11 +5,15 @@ Estado de pausa
 import pygame
 from src.state_manager import GameState
 from src.config import SCREEN_WIDTH, SCREEN_HEIGHT, COLOR_WHITE, STATE_MENU, STATE_INVENTORY
+from src.utils.fire_text import render_fire_text, render_fire_text_animated
 
 
 class PauseState(GameState):
     """Menú de pausa"""
     
+    # Muestra el mundo congelado detrás del menú
+    snapshot_below = True
+    
     def __init__(self, state_manager):
         super().__init__(state_manager)
         self.font = None
@@ -26,16 +30,15 @@ class PauseState(GameState):
         self.title_font = get_epic_font(48, bold=True)
         self.selected_option = 0
         
-        # Cargar fondo de menú secundario
-        if self.game and self.game.resource_manager:
-            self.background = self.game.resource_manager.load_image("ui/secondary_menu_bg.png", use_alpha=False)
-            if self.background:
-                from src.config import SCREEN_WIDTH, SCREEN_HEIGHT
-                bg_width = self.background.get_width()
-                bg_height = self.background.get_height()
-                if bg_width != SCREEN_WIDTH or bg_height != SCREEN_HEIGHT:
-                    self.background = pygame.transform.scale(self.background, (SCREEN_WIDTH, SCREEN_HEIGHT))
-                print(f"[OK] Fondo de menú secundario cargado: {bg_width}x{bg_height}")
+        # Oscurecer la captura del mundo una sola vez (se dibuja tal cual cada frame)
+        if self.snapshot:
+            self.snapshot.fill((90, 90, 90), special_flags=pygame.BLEND_MULT)
+        
+        # Sin captura (pausa sin estado debajo), usar el fondo de menú secundario
+        # (fijado en la caché hasta salir del estado)
+        self.background = None
+        if self.snapshot is None:
+            self.background = self.load_pinned_image("ui/secondary_menu_bg.png")
     
     def handle_event(self, event):
         """Maneja eventos de entrada"""
@@ -83,8 +86,10 @@ class PauseState(GameState):
     
     def render(self, screen):
         """Renderiza el menú de pausa con efecto de fuego"""
-        # Fondo del menú secundario
-        if self.background:
+        # Mundo congelado de fondo o, si no hay, el fondo del menú secundario
+        if self.snapshot:
+            screen.blit(self.snapshot, (0, 0))
+        elif self.background:
             screen.blit(self.background, (0, 0))
         else:
             # Fallback: fondo semi-transparente
@@ -104,7 +109,7 @@ class PauseState(GameState):
         
         # Título con efecto de fuego oscuro
         title_text = "PAUSA"
-        title_surface = self._render_fire_text(self.title_font, title_text)
+        title_surface = render_fire_text(self.title_font, title_text)
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 200))
         screen.blit(title_surface, title_rect)
         
@@ -117,11 +122,11 @@ class PauseState(GameState):
             # Color según selección
             if i == self.selected_option:
                 # Opción seleccionada: fuego más intenso
-                text_surface = self._render_fire_text(self.font, option, intensity=1.0)
+                text_surface = render_fire_text_animated(self.font, option, pygame.time.get_ticks() / 1000.0)
                 bg_color = (100, 50, 0, 220)  # Fondo naranja oscuro más opaco
             else:
                 # Opción no seleccionada: fuego más suave
-                text_surface = self._render_fire_text(self.font, option, intensity=0.7)
+                text_surface = render_fire_text(self.font, option, intensity=0.7)
                 bg_color = (50, 25, 0, 150)  # Fondo marrón oscuro más opaco
             
             # Fondo del botón (más opaco para mejor legibilidad)
@@ -154,59 +159,3 @@ class PauseState(GameState):
                 ]
                 fire_color = (255, 150, 50)  # Color de fuego oscuro
                 pygame.draw.polygon(screen, fire_color, arrow_points)
-    
-    def _render_fire_text(self, font, text, intensity=1.0):
-        """
-        Renderiza texto con efecto de fuego oscuro (mismo que el menú principal)
-        
-        Args:
-            font: Fuente de pygame
-            text: Texto a renderizar
-            intensity: Intensidad del efecto (0.0 a 1.0)
-            
-        Returns:
-            Superficie con el texto renderizado con efecto de fuego
-        """
-        # Colores de fuego oscuro (de más claro a más oscuro)
-        fire_colors = [
-            (255, 150, 50),   # Naranja dorado (centro - más oscuro)
-            (255, 120, 30),   # Naranja oscuro
-            (220, 80, 20),    # Naranja rojizo oscuro
-            (180, 50, 10),    # Rojo naranja oscuro
-            (150, 40, 5),     # Rojo oscuro
-            (120, 30, 0),     # Rojo muy oscuro
-            (80, 20, 0),      # Rojo casi negro (bordes)
-        ]
-        
-        # Ajustar intensidad
-        fire_colors = [tuple(int(c * intensity) for c in color) for color in fire_colors]
-        
-        # Crear superficie base con el texto en el color más oscuro (para sombra)
-        base_text = font.render(text, True, fire_colors[-1])
-        text_surface = pygame.Surface(base_text.get_size(), pygame.SRCALPHA)
-        
-        # Renderizar múltiples capas del texto con diferentes colores y offsets
-        # para crear efecto de gradiente/fuego
-        num_layers = len(fire_colors)
-        for i, color in enumerate(fire_colors):
-            # Offset para crear efecto de profundidad
-            offset_x = int((num_layers - i) * 0.5)
-            offset_y = int((num_layers - i) * 0.3)
-            
-            # Renderizar texto con este color
-            layer_text = font.render(text, True, color)
-            
-            # Aplicar alpha según la capa (más transparente en los bordes)
-            alpha = int(255 * (1.0 - i * 0.15))
-            if alpha > 0:
-                layer_text.set_alpha(alpha)
-                text_surface.blit(layer_text, (offset_x, offset_y))
-        
-        # Capa final con el color más brillante en el centro
-        center_text = font.render(text, True, fire_colors[0])
-        center_rect = center_text.get_rect(center=(text_surface.get_width() // 2, 
-                                                    text_surface.get_height() // 2))
-        text_surface.blit(center_text, center_rect)
-        
-        return text_surface
-
@@ -9,11 +9,19 @@ from src.config import (
 )
 from src.save.save_manager import SaveManager
 from src.save.game_state_serializer import serialize_game_state, deserialize_game_state
+from src.utils.text_cache import render_text
+from src.utils.fire_text import render_fire_text
 
 
 class SaveLoadState(GameState):
     """Estado de guardado/carga"""
     
+    uses_dirty_rects = True
+    
+    # Panel principal
+    PANEL_WIDTH = 600
+    PANEL_HEIGHT = 500
+    
     def __init__(self, state_manager):
         super().__init__(state_manager)
         self.game = None
@@ -33,16 +41,8 @@ class SaveLoadState(GameState):
     
     def enter(self):
         """Inicializa el estado de guardado/carga"""
-        # Cargar fondo de menú secundario
-        if self.game and self.game.resource_manager:
-            self.background = self.game.resource_manager.load_image("ui/secondary_menu_bg.png", use_alpha=False)
-            if self.background:
-                from src.config import SCREEN_WIDTH, SCREEN_HEIGHT
-                bg_width = self.background.get_width()
-                bg_height = self.background.get_height()
-                if bg_width != SCREEN_WIDTH or bg_height != SCREEN_HEIGHT:
-                    self.background = pygame.transform.scale(self.background, (SCREEN_WIDTH, SCREEN_HEIGHT))
-                print(f"[OK] Fondo de menú secundario cargado: {bg_width}x{bg_height}")
+        # Cargar fondo de menú secundario (fijado en la caché hasta salir del estado)
+        self.background = self.load_pinned_image("ui/secondary_menu_bg.png")
         
         # Fuentes
         from src.utils.font_helper import get_normal_font, get_epic_font, get_small_font
@@ -67,6 +67,20 @@ class SaveLoadState(GameState):
                 self.save_info.append(info)
             else:
                 self.save_info.append({"slot": slot, "save_time": None})
+        self.mark_dirty()
+    
+    def _slot_rect(self, index: int) -> pygame.Rect:
+        """Rectángulo en pantalla de un slot de la lista"""
+        panel_x = (SCREEN_WIDTH - self.PANEL_WIDTH) // 2
+        panel_y = (SCREEN_HEIGHT - self.PANEL_HEIGHT) // 2
+        return pygame.Rect(panel_x + 20, panel_y + 80 + index * 40, self.PANEL_WIDTH - 40, 35)
+    
+    def _select_slot(self, index: int):
+        """Cambia el slot seleccionado y marca para redibujar solo los dos slots afectados"""
+        # Margen para el texto que sobresale del slot
+        self.mark_dirty(self._slot_rect(self.selected_slot).inflate(4, 4))
+        self.selected_slot = index
+        self.mark_dirty(self._slot_rect(self.selected_slot).inflate(4, 4))
     
     def handle_event(self, event):
         """Maneja eventos de entrada"""
@@ -76,10 +90,10 @@ class SaveLoadState(GameState):
                 self.state_manager.pop_state()
                 return True
             elif event.key == pygame.K_UP:
-                self.selected_slot = (self.selected_slot - 1) % self.max_slots
+                self._select_slot((self.selected_slot - 1) % self.max_slots)
                 return True
             elif event.key == pygame.K_DOWN:
-                self.selected_slot = (self.selected_slot + 1) % self.max_slots
+                self._select_slot((self.selected_slot + 1) % self.max_slots)
                 return True
             elif event.key == pygame.K_RETURN or event.key == pygame.K_SPACE:
                 # Guardar o cargar
@@ -199,8 +213,8 @@ class SaveLoadState(GameState):
             screen.blit(overlay, (0, 0))
         
         # Panel principal
-        panel_width = 600
-        panel_height = 500
+        panel_width = self.PANEL_WIDTH
+        panel_height = self.PANEL_HEIGHT
         panel_x = (SCREEN_WIDTH - panel_width) // 2
         panel_y = (SCREEN_HEIGHT - panel_height) // 2
         
@@ -212,7 +226,7 @@ class SaveLoadState(GameState):
         
         # Título con efecto de fuego
         title_text = "GUARDAR" if self.is_save_mode else "CARGAR"
-        title_surface = self._render_fire_text(self.title_font, title_text)
+        title_surface = render_fire_text(self.title_font, title_text)
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, panel_y + 30))
         screen.blit(title_surface, title_rect)
         
@@ -224,7 +238,7 @@ class SaveLoadState(GameState):
             
             # Color de fondo (más oscuro para mejor legibilidad)
             bg_color = (60, 40, 20, 220) if is_selected else (40, 25, 10, 180)
-            slot_rect = pygame.Rect(panel_x + 20, y_offset + i * 40, panel_width - 40, 35)
+            slot_rect = self._slot_rect(i)
             slot_surface = pygame.Surface((panel_width - 40, 35), pygame.SRCALPHA)
             slot_surface.fill(bg_color)
             screen.blit(slot_surface, slot_rect)
@@ -255,48 +269,13 @@ class SaveLoadState(GameState):
             
             # Texto con mejor contraste
             text_color = (255, 200, 150) if is_selected else (220, 180, 120)
-            text_surface = self.font.render(slot_text, True, text_color)
+            text_surface = render_text(self.font, slot_text, text_color)
             screen.blit(text_surface, (panel_x + 30, y_offset + i * 40 + 8))
         
         # Instrucciones (con mejor contraste)
         instructions_y = panel_y + panel_height - 50
         if self.is_save_mode:
-            inst_text = self.small_font.render("ENTER: Guardar | ESC: Cancelar", True, (220, 200, 180))
+            inst_text = render_text(self.small_font, "ENTER: Guardar | ESC: Cancelar", (220, 200, 180))
         else:
-            inst_text = self.small_font.render("ENTER: Cargar | DEL: Eliminar | ESC: Cancelar", True, (220, 200, 180))
+            inst_text = render_text(self.small_font, "ENTER: Cargar | DEL: Eliminar | ESC: Cancelar", (220, 200, 180))
         screen.blit(inst_text, (panel_x + 20, instructions_y))
-    
-    def _render_fire_text(self, font, text, intensity=1.0):
-        """Renderiza texto con efecto de fuego oscuro (mismo que otros menús)"""
-        # Colores de fuego oscuro
-        fire_colors = [
-            (255, 150, 50),   # Naranja dorado
-            (255, 120, 30),   # Naranja oscuro
-            (220, 80, 20),    # Naranja rojizo oscuro
-            (180, 50, 10),    # Rojo naranja oscuro
-            (150, 40, 5),     # Rojo oscuro
-            (120, 30, 0),     # Rojo muy oscuro
-            (80, 20, 0),      # Rojo casi negro
-        ]
-        
-        fire_colors = [tuple(int(c * intensity) for c in color) for color in fire_colors]
-        base_text = font.render(text, True, fire_colors[-1])
-        text_surface = pygame.Surface(base_text.get_size(), pygame.SRCALPHA)
-        
-        num_layers = len(fire_colors)
-        for i, color in enumerate(fire_colors):
-            offset_x = int((num_layers - i) * 0.5)
-            offset_y = int((num_layers - i) * 0.3)
-            layer_text = font.render(text, True, color)
-            alpha = int(255 * (1.0 - i * 0.15))
-            if alpha > 0:
-                layer_text.set_alpha(alpha)
-                text_surface.blit(layer_text, (offset_x, offset_y))
-        
-        center_text = font.render(text, True, fire_colors[0])
-        center_rect = center_text.get_rect(center=(text_surface.get_width() // 2, 
-                                                    text_surface.get_height() // 2))
-        text_surface.blit(center_text, center_rect)
-        
-        return text_surface
-
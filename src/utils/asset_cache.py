@@ -0,0 +1,148 @@
+"""
+Caché LRU con presupuesto de memoria en bytes
+"""
+
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+
+class AssetCache:
+    """
+    Guarda assets en orden de uso y descarta los menos usados al pasar el presupuesto
+
+    Los assets fijados (pin) no se descartan nunca. Se puede fijar una clave
+    antes de cargarla: el pin se aplica cuando el asset entra en la caché.
+    """
+
+    def __init__(self, name: str, budget_bytes: int,
+                 on_evict: Optional[Callable[[Hashable, Any], None]] = None):
+        """
+        Inicializa la caché
+
+        Args:
+            name: Nombre de la categoría (para estadísticas y mensajes)
+            budget_bytes: Bytes máximos de los assets no fijados más los fijados
+            on_evict: Función opcional que recibe (clave, asset) de cada
+                asset descartado por el presupuesto
+        """
+        self.name = name
+        self.budget_bytes = budget_bytes
+        self.on_evict = on_evict
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._sizes: Dict[Hashable, int] = {}
+        self._pins: Dict[Hashable, int] = {}
+
+        self.resident_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Obtiene un asset y lo marca como usado (cuenta acierto o fallo)
+
+        Args:
+            key: Clave del asset
+
+        Returns:
+            El asset o None si no está en la caché
+        """
+        value = self._entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return value
+
+    def keys(self) -> List[Hashable]:
+        """Retorna las claves en caché, de la menos a la más usada"""
+        return list(self._entries)
+
+    def peek(self, key: Hashable) -> Optional[Any]:
+        """Obtiene un asset sin marcarlo como usado ni contar estadísticas"""
+        return self._entries.get(key)
+
+    def put(self, key: Hashable, value: Any, size: int):
+        """
+        Guarda un asset y descarta los menos usados si se pasa del presupuesto
+
+        Args:
+            key: Clave del asset
+            value: Asset
+            size: Bytes que ocupa
+        """
+        self.discard(key)
+        self._entries[key] = value
+        self._sizes[key] = size
+        self.resident_bytes += size
+        self._evict(keep=key)
+
+    def discard(self, key: Hashable):
+        """Quita un asset de la caché (los pins se conservan)"""
+        if key in self._entries:
+            del self._entries[key]
+            self.resident_bytes -= self._sizes.pop(key)
+
+    def pin(self, key: Hashable):
+        """
+        Impide que un asset se descarte hasta el unpin correspondiente
+
+        Los pins se cuentan: cada pin necesita su unpin.
+
+        Args:
+            key: Clave del asset (puede no estar cargado todavía)
+        """
+        self._pins[key] = self._pins.get(key, 0) + 1
+
+    def unpin(self, key: Hashable):
+        """Libera un pin; el asset vuelve a poder descartarse"""
+        count = self._pins.get(key, 0) - 1
+        if count > 0:
+            self._pins[key] = count
+        else:
+            self._pins.pop(key, None)
+            self._evict()
+
+    def is_pinned(self, key: Hashable) -> bool:
+        """Retorna True si el asset está fijado"""
+        return key in self._pins
+
+    def _evict(self, keep: Optional[Hashable] = None):
+        """Descarta assets no fijados, del menos usado al más usado, hasta respetar el presupuesto"""
+        if self.resident_bytes <= self.budget_bytes:
+            return
+        for key in list(self._entries):
+            if self.resident_bytes <= self.budget_bytes:
+                return
+            if key == keep or key in self._pins:
+                continue
+            value = self._entries[key]
+            self.discard(key)
+            self.evictions += 1
+            if self.on_evict is not None:
+                self.on_evict(key, value)
+
+    def clear(self):
+        """Vacía la caché (los pins se conservan)"""
+        self._entries.clear()
+        self._sizes.clear()
+        self.resident_bytes = 0
+
+    def get_stats(self) -> Dict[str, int]:
+        """Retorna aciertos, fallos, descartes y memoria ocupada"""
+        return {
+            "entries": len(self._entries),
+            "pinned": sum(1 for key in self._pins if key in self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "resident_bytes": self.resident_bytes,
+            "budget_bytes": self.budget_bytes,
+        }
@@ -0,0 +1,46 @@
+"""
+Carga y caché de archivos de datos JSON (data/)
+"""
+
+import json
+import os
+import threading
+from typing import Any, Dict
+from src.config import DATA_DIR
+
+
+_cache: Dict[str, Any] = {}
+_lock = threading.Lock()
+
+
+def load_data(path: str) -> Any:
+    """
+    Carga un archivo JSON de data/ (una sola vez por proceso)
+
+    Se puede llamar desde cualquier hilo. El resultado es compartido:
+    no modificarlo, copiar lo que haga falta.
+
+    Args:
+        path: Ruta relativa a data/ (ej: "enemies/enemies_base.json")
+
+    Returns:
+        Contenido del JSON
+
+    Raises:
+        OSError, ValueError: Si el archivo no existe o no es JSON válido
+    """
+    with _lock:
+        if path in _cache:
+            return _cache[path]
+
+    with open(os.path.join(DATA_DIR, path), 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    with _lock:
+        return _cache.setdefault(path, data)
+
+
+def clear_data_cache():
+    """Descarta los datos en caché (por ejemplo, tras editar los JSON)"""
+    with _lock:
+        _cache.clear()
@@ -0,0 +1,155 @@
+"""
+Texto con efecto de fuego para títulos y opciones de menú
+
+El efecto compone el texto varias veces en capas de colores cálidos, así
+que es caro: el resultado se guarda en una caché LRU por (fuente, texto,
+intensidad). La variante animada precalcula unos pocos frames con un
+parpadeo suave y solo elige cuál mostrar según el tiempo.
+
+Las superficies devueltas son compartidas: no dibujar sobre ellas.
+"""
+
+import math
+import pygame
+from typing import Dict, List
+from src.config import FIRE_TEXT_CACHE_BUDGET_MB, FIRE_TEXT_FRAMES, FIRE_TEXT_FPS
+from src.utils.asset_cache import AssetCache
+
+# Colores de fuego oscuro (de más claro a más oscuro)
+FIRE_COLORS = [
+    (255, 150, 50),   # Naranja dorado (centro - más oscuro)
+    (255, 120, 30),   # Naranja oscuro
+    (220, 80, 20),    # Naranja rojizo oscuro
+    (180, 50, 10),    # Rojo naranja oscuro
+    (150, 40, 5),     # Rojo oscuro
+    (120, 30, 0),     # Rojo muy oscuro
+    (80, 20, 0),      # Rojo casi negro (bordes)
+]
+
+# Variación de intensidad del parpadeo en la variante animada
+FLICKER_AMOUNT = 0.15
+
+_cache = AssetCache("fire_text", FIRE_TEXT_CACHE_BUDGET_MB * 1024 * 1024)
+
+
+def _surface_bytes(surface: pygame.Surface) -> int:
+    return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+
+def compose_fire_text(font: pygame.font.Font, text: str, intensity: float = 1.0) -> pygame.Surface:
+    """
+    Compone el texto con efecto de fuego (sin caché)
+
+    Args:
+        font: Fuente de pygame
+        text: Texto a renderizar
+        intensity: Intensidad del efecto (0.0 a 1.0)
+
+    Returns:
+        Superficie nueva con el texto renderizado con efecto de fuego
+    """
+    # Ajustar intensidad
+    fire_colors = [tuple(int(c * intensity) for c in color) for color in FIRE_COLORS]
+
+    # Crear superficie base con el texto en el color más oscuro (para sombra)
+    base_text = font.render(text, True, fire_colors[-1])
+    text_surface = pygame.Surface(base_text.get_size(), pygame.SRCALPHA)
+
+    # Renderizar múltiples capas del texto con diferentes colores y offsets
+    # para crear efecto de gradiente/fuego
+    num_layers = len(fire_colors)
+    for i, color in enumerate(fire_colors):
+        # Offset para crear efecto de profundidad
+        offset_x = int((num_layers - i) * 0.5)
+        offset_y = int((num_layers - i) * 0.3)
+
+        # Renderizar texto con este color
+        layer_text = font.render(text, True, color)
+
+        # Aplicar alpha según la capa (más transparente en los bordes)
+        alpha = int(255 * (1.0 - i * 0.15))
+        if alpha > 0:
+            layer_text.set_alpha(alpha)
+            text_surface.blit(layer_text, (offset_x, offset_y))
+
+    # Capa final con el color más brillante en el centro
+    center_text = font.render(text, True, fire_colors[0])
+    center_rect = center_text.get_rect(center=(text_surface.get_width() // 2,
+                                                text_surface.get_height() // 2))
+    text_surface.blit(center_text, center_rect)
+
+    return text_surface
+
+
+def render_fire_text(font: pygame.font.Font, text: str, intensity: float = 1.0) -> pygame.Surface:
+    """
+    Obtiene el texto con efecto de fuego (se compone una sola vez)
+
+    Args:
+        font: Fuente de pygame
+        text: Texto a renderizar
+        intensity: Intensidad del efecto (0.0 a 1.0)
+
+    Returns:
+        Superficie compartida con el texto renderizado con efecto de fuego
+    """
+    key = (font, text, round(intensity, 3))
+    surface = _cache.get(key)
+    if surface is None:
+        surface = compose_fire_text(font, text, intensity)
+        _cache.put(key, surface, _surface_bytes(surface))
+    return surface
+
+
+def get_fire_text_frames(font: pygame.font.Font, text: str,
+                         intensity: float = 1.0) -> List[pygame.Surface]:
+    """
+    Obtiene los frames precalculados del texto de fuego animado
+
+    Args:
+        font: Fuente de pygame
+        text: Texto a renderizar
+        intensity: Intensidad media del efecto
+
+    Returns:
+        Lista de FIRE_TEXT_FRAMES superficies compartidas
+    """
+    key = (font, text, round(intensity, 3), "animated")
+    frames = _cache.get(key)
+    if frames is None:
+        frames = []
+        for index in range(FIRE_TEXT_FRAMES):
+            # Parpadeo suave: la intensidad oscila alrededor de la pedida
+            phase = 2 * math.pi * index / FIRE_TEXT_FRAMES
+            frame_intensity = intensity * (1.0 - FLICKER_AMOUNT * (0.5 + 0.5 * math.sin(phase)))
+            frames.append(compose_fire_text(font, text, frame_intensity))
+        _cache.put(key, frames, sum(_surface_bytes(frame) for frame in frames))
+    return frames
+
+
+def render_fire_text_animated(font: pygame.font.Font, text: str, time: float,
+                              intensity: float = 1.0) -> pygame.Surface:
+    """
+    Obtiene el frame actual del texto de fuego animado
+
+    Args:
+        font: Fuente de pygame
+        text: Texto a renderizar
+        time: Tiempo en segundos (por ejemplo pygame.time.get_ticks() / 1000)
+        intensity: Intensidad media del efecto
+
+    Returns:
+        Superficie compartida del frame que corresponde a ese tiempo
+    """
+    frames = get_fire_text_frames(font, text, intensity)
+    return frames[int(time * FIRE_TEXT_FPS) % len(frames)]
+
+
+def clear_fire_text_cache():
+    """Descarta los textos de fuego en caché"""
+    _cache.clear()
+
+
+def get_fire_text_stats() -> Dict[str, int]:
+    """Retorna aciertos, fallos, descartes y memoria ocupada de la caché"""
+    return _cache.get_stats()
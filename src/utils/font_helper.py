@@ -1,45 +1,48 @@
 """
 Helper para cargar fuentes góticas/medievales épicas
+
+Las fuentes se guardan en un registro por (fuente, tamaño, negrita): el
+archivo de la fuente se busca una sola vez por proceso y cada tamaño se
+crea una sola vez. Las fuentes son compartidas, no modificarlas
+(set_bold, set_italic...) después de obtenerlas.
 """
 
 import pygame
 import os
+from typing import Dict, Optional, Tuple
 from src.config import ASSETS_DIR, EPIC_FONTS, SYSTEM_EPIC_FONTS
 
+# Tipos de origen de una fuente
+FACE_FILE = "file"
+FACE_SYSTEM = "system"
+FACE_DEFAULT = "default"
 
-def get_epic_font(size: int, bold: bool = False) -> pygame.font.Font:
+_fonts: Dict[Tuple[str, str, int, bool], pygame.font.Font] = {}
+_epic_face: Optional[Tuple[str, str]] = None
+
+
+def _resolve_epic_face() -> Tuple[str, str]:
     """
-    Obtiene la fuente BLKCHCRY para el juego
-    
-    Args:
-        size: Tamaño de la fuente
-        bold: Si True, intenta usar una fuente en negrita
-        
+    Busca la fuente BLKCHCRY (una sola vez)
+
     Returns:
-        Font de Pygame con la fuente BLKCHCRY
+        Tupla (tipo, nombre): ruta del archivo, nombre de la fuente del sistema
+        o cadena vacía para la fuente por defecto
     """
+    global _epic_face
+    if _epic_face is not None:
+        return _epic_face
+
     from src.config import MAIN_FONT
-    
+
     # Primero intentar cargar BLKCHCRY desde archivo personalizado
     # Buscar directamente en la carpeta de fuentes
     fonts_dir = os.path.join(ASSETS_DIR, "ui", "fonts")
-    
+
     # Lista de nombres posibles para el archivo
     possible_names = ["BLKCHCRY.TTF", "blkchcry.ttf", "BLKCHCRY.ttf", "Blkchcry.ttf"]
-    
-    for font_name in possible_names:
-        font_path = os.path.join(fonts_dir, font_name)
-        if os.path.exists(font_path):
-            try:
-                font = pygame.font.Font(font_path, size)
-                if bold:
-                    font.set_bold(True)
-                print(f"[OK] Fuente BLKCHCRY cargada desde archivo: {font_path}")
-                return font
-            except Exception as e:
-                print(f"[ERROR] Error cargando fuente {font_path}: {e}")
-                continue
-    
+    candidates = [os.path.join(fonts_dir, font_name) for font_name in possible_names]
+
     # También intentar desde EPIC_FONTS (por si acaso)
     for font_path in EPIC_FONTS:
         # Remover "assets/" del inicio si existe
@@ -47,52 +50,97 @@ def get_epic_font(size: int, bold: bool = False) -> pygame.font.Font:
             relative_path = font_path[7:]  # Remover "assets/"
         else:
             relative_path = font_path
-        
-        full_path = os.path.join(ASSETS_DIR, relative_path)
-        
-        if os.path.exists(full_path):
+        candidates.append(os.path.join(ASSETS_DIR, relative_path))
+
+    for font_path in candidates:
+        if os.path.exists(font_path):
             try:
-                font = pygame.font.Font(full_path, size)
-                if bold:
-                    font.set_bold(True)
-                print(f"[OK] Fuente BLKCHCRY cargada desde archivo: {full_path}")
-                return font
+                pygame.font.Font(font_path, 12)
+                print(f"[OK] Fuente BLKCHCRY cargada desde archivo: {font_path}")
+                _epic_face = (FACE_FILE, font_path)
+                return _epic_face
             except Exception as e:
-                print(f"[ERROR] Error cargando fuente {full_path}: {e}")
+                print(f"[ERROR] Error cargando fuente {font_path}: {e}")
                 continue
-    
+
     # Intentar cargar BLKCHCRY como fuente del sistema
     try:
-        font = pygame.font.SysFont(MAIN_FONT, size, bold=bold)
+        font = pygame.font.SysFont(MAIN_FONT, 12)
         # Verificar que la fuente se cargó correctamente
-        test_surface = font.render("Test", True, (255, 255, 255))
-        if test_surface:
+        if font.render("Test", True, (255, 255, 255)):
             print(f"[OK] Fuente BLKCHCRY cargada desde sistema")
-            return font
+            _epic_face = (FACE_SYSTEM, MAIN_FONT)
+            return _epic_face
     except Exception as e:
         print(f"[ERROR] Error cargando fuente BLKCHCRY del sistema: {e}")
-    
+
     # Si BLKCHCRY no está disponible, intentar otras fuentes del sistema
     for font_name in SYSTEM_EPIC_FONTS:
         if font_name == MAIN_FONT:
             continue  # Ya intentamos BLKCHCRY
         try:
-            font = pygame.font.SysFont(font_name, size, bold=bold)
-            test_surface = font.render("Test", True, (255, 255, 255))
-            if test_surface:
+            font = pygame.font.SysFont(font_name, 12)
+            if font.render("Test", True, (255, 255, 255)):
                 print(f"Usando fuente alternativa: {font_name}")
-                return font
+                _epic_face = (FACE_SYSTEM, font_name)
+                return _epic_face
         except Exception:
             continue
-    
-    # Último recurso: usar fuente por defecto pero en negrita si se solicita
+
+    # Último recurso: usar fuente por defecto
     print("ADVERTENCIA: No se encontró BLKCHCRY, usando fuente por defecto")
-    font = pygame.font.Font(None, size)
-    if bold:
-        font.set_bold(True)
+    _epic_face = (FACE_DEFAULT, "")
+    return _epic_face
+
+
+def get_font(kind: str, name: str, size: int, bold: bool = False) -> pygame.font.Font:
+    """
+    Obtiene una fuente del registro (la crea la primera vez)
+
+    Args:
+        kind: FACE_FILE, FACE_SYSTEM o FACE_DEFAULT
+        name: Ruta del archivo o nombre de la fuente del sistema
+        size: Tamaño de la fuente
+        bold: Si True, negrita
+
+    Returns:
+        Font de Pygame compartida
+    """
+    key = (kind, name, size, bold)
+    font = _fonts.get(key)
+    if font is not None:
+        return font
+
+    if kind == FACE_FILE:
+        font = pygame.font.Font(name, size)
+        if bold:
+            font.set_bold(True)
+    elif kind == FACE_SYSTEM:
+        font = pygame.font.SysFont(name, size, bold=bold)
+    else:
+        font = pygame.font.Font(None, size)
+        if bold:
+            font.set_bold(True)
+
+    _fonts[key] = font
     return font
 
 
+def get_epic_font(size: int, bold: bool = False) -> pygame.font.Font:
+    """
+    Obtiene la fuente BLKCHCRY para el juego
+
+    Args:
+        size: Tamaño de la fuente
+        bold: Si True, intenta usar una fuente en negrita
+
+    Returns:
+        Font de Pygame con la fuente BLKCHCRY
+    """
+    kind, name = _resolve_epic_face()
+    return get_font(kind, name, size, bold)
+
+
 def get_title_font(size: int = 72) -> pygame.font.Font:
     """Obtiene una fuente épica para títulos"""
     return get_epic_font(size, bold=True)
@@ -106,4 +154,3 @@ def get_normal_font(size: int = 24) -> pygame.font.Font:
 def get_small_font(size: int = 18) -> pygame.font.Font:
     """Obtiene una fuente épica para texto pequeño"""
     return get_epic_font(size, bold=False)
-
@@ -0,0 +1,146 @@
+"""
+Caché en disco de imágenes decodificadas
+
+La primera vez que se carga un PNG grande se guardan sus píxeles crudos
+(RGBA si la imagen tiene alpha por píxel, RGB si no) y su colorkey en
+IMAGE_CACHE_DIR. Las siguientes ejecuciones mapean ese archivo en
+memoria y crean la superficie con pygame.image.frombuffer, sin volver a
+descomprimir el PNG. La superficie resultante tiene el mismo alpha y el
+mismo colorkey que la de pygame.image.load, así que convert() y
+convert_alpha() dan lo mismo con la caché fría o caliente. Las imágenes
+con paleta no se guardan (su formato no se puede reproducir).
+
+Cada archivo de caché lleva una cabecera con el mtime y el tamaño del PNG
+de origen; si el PNG cambia, la entrada se descarta y se vuelve a generar.
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+import threading
+import pygame
+from src.config import IMAGE_CACHE_ENABLED, IMAGE_CACHE_DIR, IMAGE_CACHE_MIN_FILE_BYTES
+
+CACHE_MAGIC = b"GSNI"
+CACHE_VERSION = 2
+
+# magic, versión, mtime_ns del origen, tamaño del origen, ancho, alto,
+# flags (_FLAG_*) y colorkey (RGBA empaquetado)
+_HEADER = struct.Struct("<4sIqqIIII")
+_FLAG_ALPHA = 1  # Píxeles RGBA con alpha por píxel (si no, RGB)
+_FLAG_COLORKEY = 2  # La imagen tiene colorkey
+
+_write_lock = threading.Lock()
+_write_disabled = False
+
+
+def _cache_path(full_path: str) -> str:
+    """Ruta del archivo de caché de una imagen"""
+    key = hashlib.sha1(os.path.abspath(full_path).encode("utf-8")).hexdigest()
+    return os.path.join(IMAGE_CACHE_DIR, key + ".rgba")
+
+
+def load_image_file(full_path: str) -> pygame.Surface:
+    """
+    Carga una imagen usando la caché de píxeles decodificados si es posible
+
+    La superficie devuelta está sin convertir (igual que pygame.image.load),
+    así que se puede llamar desde hilos de fondo.
+
+    Args:
+        full_path: Ruta completa al archivo de imagen
+
+    Returns:
+        Superficie de Pygame
+
+    Raises:
+        FileNotFoundError, pygame.error: Igual que pygame.image.load
+    """
+    if not IMAGE_CACHE_ENABLED:
+        return pygame.image.load(full_path)
+
+    stat = os.stat(full_path)
+    if stat.st_size < IMAGE_CACHE_MIN_FILE_BYTES:
+        return pygame.image.load(full_path)
+
+    cache_path = _cache_path(full_path)
+    image = _read_cached(cache_path, stat)
+    if image is not None:
+        return image
+
+    image = pygame.image.load(full_path)
+    if image.get_bitsize() > 8:
+        _write_cached(cache_path, stat, image)
+    return image
+
+
+def _read_cached(cache_path: str, stat: os.stat_result):
+    """Mapea una entrada de la caché; retorna None si no existe o está desactualizada"""
+    try:
+        with open(cache_path, "rb") as f:
+            # ACCESS_COPY: la superficie se puede modificar sin tocar el archivo
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+    except (OSError, ValueError):
+        return None
+
+    if len(data) < _HEADER.size:
+        data.close()
+        return None
+    magic, version, mtime_ns, size, width, height, flags, colorkey = _HEADER.unpack_from(data, 0)
+    mode = "RGBA" if flags & _FLAG_ALPHA else "RGB"
+    if (magic != CACHE_MAGIC or version != CACHE_VERSION
+            or mtime_ns != stat.st_mtime_ns or size != stat.st_size
+            or len(data) != _HEADER.size + width * height * len(mode)):
+        data.close()
+        return None
+
+    # La superficie mantiene viva la vista (y con ella el mmap)
+    pixels = memoryview(data)[_HEADER.size:]
+    image = pygame.image.frombuffer(pixels, (width, height), mode)
+    if flags & _FLAG_COLORKEY:
+        image.set_colorkey(pygame.Color(colorkey))
+    return image
+
+
+def _write_cached(cache_path: str, stat: os.stat_result, image: pygame.Surface):
+    """Guarda los píxeles de una imagen en la caché (escritura atómica)"""
+    global _write_disabled
+    if _write_disabled:
+        return
+
+    width, height = image.get_size()
+    flags = _FLAG_ALPHA if image.get_flags() & pygame.SRCALPHA else 0
+    colorkey = image.get_colorkey()
+    if colorkey is not None:
+        flags |= _FLAG_COLORKEY
+    header = _HEADER.pack(CACHE_MAGIC, CACHE_VERSION, stat.st_mtime_ns, stat.st_size,
+                          width, height, flags, int(pygame.Color(colorkey or 0)))
+    temp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(IMAGE_CACHE_DIR, exist_ok=True)
+        with open(temp_path, "wb") as f:
+            f.write(header)
+            f.write(pygame.image.tobytes(image, "RGBA" if flags & _FLAG_ALPHA else "RGB"))
+        os.replace(temp_path, cache_path)
+    except OSError as e:
+        with _write_lock:
+            if not _write_disabled:
+                _write_disabled = True
+                print(f"[WARNING] No se pudo escribir la caché de imágenes ({e}), se desactiva")
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+
+
+def clear_image_cache():
+    """Borra todas las entradas de la caché en disco"""
+    if not os.path.isdir(IMAGE_CACHE_DIR):
+        return
+    for name in os.listdir(IMAGE_CACHE_DIR):
+        if name.endswith(".rgba"):
+            try:
+                os.remove(os.path.join(IMAGE_CACHE_DIR, name))
+            except OSError:
+                pass
@@ -1,154 +1,469 @@
 """
 Sistema de partículas para efectos visuales
+
+Las partículas se guardan como estructura de arrays (NumPy) en un pool de
+tamaño fijo: posiciones, velocidades, vidas, colores y tamaños viven en
+arrays preasignados y se actualizan todas juntas con operaciones
+vectorizadas. Las partículas nuevas reutilizan los huecos de las que ya
+murieron; si el pool está lleno, reemplazan a las vivas siguiendo un
+cursor circular.
+
+Para dibujar, cada partícula usa un sprite en caché por (tamaño, color,
+tramo de alpha) y todo se envía en una sola llamada a Surface.fblits.
+
+Los efectos se definen en data/effects/particles_base.json. Campos de
+cada emisor:
+
+    id           Nombre del efecto
+    color        Color RGB
+    count        Partículas por ráfaga (burst)
+    rate         Partículas por segundo de un emisor continuo (start_emitter)
+    spread       Desvío máximo [x, y] de la posición de salida
+    angle        Rango de dirección en grados (0 = derecha, 90 = abajo)
+    speed        Rango de velocidad (con angle)
+    velocity_x   Rango de velocidad horizontal (en lugar de angle/speed)
+    velocity_y   Rango de velocidad vertical
+    lifetime     Rango de vida en segundos
+    size         Rango de radio en píxeles (enteros, inclusive)
+    alpha_curve  Opacidad según la edad: [[edad 0..1, opacidad 0..1], ...]
+                 (por defecto se apaga en línea recta)
+    size_curve   Multiplicador del radio según la edad, mismo formato
 """
 
+import math
+import numpy as np
 import pygame
-import random
-from typing import List, Tuple
-from src.config import TILE_SIZE
+from typing import Dict, List, Optional, Tuple
+from src.config import PARTICLE_CAPACITY, PARTICLE_ALPHA_BUCKETS
+from src.utils.data_loader import load_data
+from src.utils.profiler import profiler
+
+# Gravedad suave aplicada a todas las partículas (píxeles/s²)
+GRAVITY = 50.0
+
+# Radio máximo de una partícula en píxeles
+MAX_SIZE = 64
+
+PRESETS_FILE = "effects/particles_base.json"
+
+_presets: Optional[Dict[str, "EmitterPreset"]] = None
+
+
+def _as_range(value, default):
+    """Convierte un número o un par [min, max] en un rango"""
+    if value is None:
+        return default
+    if isinstance(value, (int, float)):
+        return (value, value)
+    return (value[0], value[1])
+
+
+def _as_curve(points) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """Convierte una lista de puntos [edad, valor] en arrays para np.interp"""
+    if not points:
+        return None
+    points = sorted(points)
+    return (np.array([p[0] for p in points], dtype=np.float32),
+            np.array([p[1] for p in points], dtype=np.float32))
 
 
-class Particle:
-    """Representa una partícula individual"""
-    
-    def __init__(self, x: float, y: float, vx: float, vy: float, 
-                 color: Tuple[int, int, int], lifetime: float, size: int = 2):
+class EmitterPreset:
+    """Definición de un efecto de partículas (ver data/effects/particles_base.json)"""
+
+    def __init__(self, data: Dict):
         """
-        Inicializa una partícula
-        
+        Crea la definición desde un diccionario del JSON
+
         Args:
-            x, y: Posición inicial
-            vx, vy: Velocidad
-            color: Color RGB
-            lifetime: Tiempo de vida en segundos
-            size: Tamaño en píxeles
+            data: Datos del emisor
+        """
+        self.id = data.get("id", "")
+        self.color = tuple(data.get("color", (255, 255, 255)))
+        self.count = data.get("count", 10)
+        self.rate = data.get("rate", 0)
+        self.spread = _as_range(data.get("spread"), (0, 0))
+        self.angle = _as_range(data.get("angle"), (0, 360))
+        self.speed = _as_range(data.get("speed"), (0, 0))
+        self.velocity_x = _as_range(data.get("velocity_x"), None)
+        self.velocity_y = _as_range(data.get("velocity_y"), None)
+        self.lifetime = _as_range(data.get("lifetime"), (0.5, 0.5))
+        self.size = _as_range(data.get("size"), (2, 2))
+        self.alpha_curve = _as_curve(data.get("alpha_curve"))
+        self.size_curve = _as_curve(data.get("size_curve"))
+
+
+def get_emitter_preset(preset_id: str) -> Optional[EmitterPreset]:
+    """
+    Obtiene la definición de un efecto (el JSON se lee una sola vez)
+
+    Args:
+        preset_id: ID del emisor en data/effects/particles_base.json
+
+    Returns:
+        EmitterPreset o None si no existe
+    """
+    global _presets
+    if _presets is None:
+        _presets = {}
+        try:
+            for data in load_data(PRESETS_FILE).get("emitters", []):
+                preset = EmitterPreset(data)
+                _presets[preset.id] = preset
+        except Exception as e:
+            print(f"[ERROR] No se pudieron cargar los efectos de partículas: {e}")
+
+    preset = _presets.get(preset_id)
+    if preset is None:
+        print(f"[WARNING] Efecto de partículas no encontrado: {preset_id}")
+    return preset
+
+
+class ParticleEmitter:
+    """Emisor continuo: genera partículas de un efecto a ritmo constante"""
+
+    def __init__(self, system: "ParticleSystem", preset: EmitterPreset, x: float, y: float,
+                 duration: Optional[float] = None):
         """
+        Inicializa el emisor
+
+        Args:
+            system: Sistema de partículas donde se emiten
+            preset: Definición del efecto (usa su campo rate)
+            x, y: Posición del emisor
+            duration: Segundos que dura (None = hasta stop())
+        """
+        self.system = system
+        self.preset = preset
         self.x = x
         self.y = y
-        self.vx = vx
-        self.vy = vy
-        self.color = color
-        self.lifetime = lifetime
-        self.max_lifetime = lifetime
-        self.size = size
-        self.alpha = 255
-    
-    def update(self, dt: float) -> bool:
-        """
-        Actualiza la partícula
-        
-        Args:
-            dt: Delta time
-            
-        Returns:
-            True si la partícula sigue viva, False si debe ser removida
-        """
-        self.x += self.vx * dt
-        self.y += self.vy * dt
-        self.lifetime -= dt
-        
-        # Fade out
-        self.alpha = int(255 * (self.lifetime / self.max_lifetime))
-        
-        # Gravedad (para algunas partículas)
-        self.vy += 50 * dt  # Gravedad suave
-        
-        return self.lifetime > 0
-    
-    def render(self, screen: pygame.Surface, camera_offset: Tuple[int, int] = (0, 0)):
-        """Renderiza la partícula"""
-        screen_x = int(self.x - camera_offset[0])
-        screen_y = int(self.y - camera_offset[1])
-        
-        if 0 <= screen_x < screen.get_width() and 0 <= screen_y < screen.get_height():
-            color_with_alpha = (*self.color, self.alpha)
-            # Crear superficie con alpha
-            particle_surf = pygame.Surface((self.size * 2, self.size * 2), pygame.SRCALPHA)
-            pygame.draw.circle(particle_surf, color_with_alpha, (self.size, self.size), self.size)
-            screen.blit(particle_surf, (screen_x - self.size, screen_y - self.size))
+        self.duration = duration
+        self.elapsed = 0.0
+        self.active = True
+        self._pending = 0.0  # Fracción de partícula acumulada entre frames
+
+    def move_to(self, x: float, y: float):
+        """Mueve el emisor"""
+        self.x = x
+        self.y = y
+
+    def stop(self):
+        """Detiene el emisor (las partículas ya emitidas terminan su vida)"""
+        self.active = False
+
+    def update(self, dt: float):
+        """Emite las partículas que tocan en este frame"""
+        if not self.active:
+            return
+        self.elapsed += dt
+        if self.duration is not None and self.elapsed >= self.duration:
+            self.active = False
+            return
+        self._pending += self.preset.rate * dt
+        count = int(self._pending)
+        if count > 0:
+            self._pending -= count
+            self.system.spawn(self.preset, self.x, self.y, count)
 
 
 class ParticleSystem:
     """Sistema de partículas"""
-    
-    def __init__(self):
-        """Inicializa el sistema de partículas"""
-        self.particles: List[Particle] = []
-    
-    def add_explosion(self, x: float, y: float, color: Tuple[int, int, int] = (255, 200, 0), 
-                     count: int = 20):
+
+    def __init__(self, capacity: int = PARTICLE_CAPACITY):
+        """
+        Inicializa el sistema de partículas
+
+        Args:
+            capacity: Máximo de partículas vivas a la vez
+        """
+        self.capacity = capacity
+        self.x = np.zeros(capacity, dtype=np.float32)
+        self.y = np.zeros(capacity, dtype=np.float32)
+        self.vx = np.zeros(capacity, dtype=np.float32)
+        self.vy = np.zeros(capacity, dtype=np.float32)
+        self.lifetime = np.zeros(capacity, dtype=np.float32)
+        self.max_lifetime = np.ones(capacity, dtype=np.float32)
+        self.color = np.zeros(capacity, dtype=np.int32)  # Índice en self._palette
+        self.size = np.zeros(capacity, dtype=np.int32)
+        self.curve = np.zeros(capacity, dtype=np.int32)  # Índice en self._curves (0 = fade lineal)
+        self.alive = np.zeros(capacity, dtype=bool)
+
+        self._head = 0  # Cursor circular para reemplazar partículas vivas con el pool lleno
+        self._used = 0  # Huecos escritos alguna vez (el resto nunca tuvo partículas)
+
+        self._palette: List[Tuple[int, int, int]] = []
+        self._color_ids: Dict[Tuple[int, int, int], int] = {}
+        self._curves: List[Tuple] = [(None, None)]
+        self._curve_ids: Dict[str, int] = {}
+        self._sprites: Dict[int, pygame.Surface] = {}
+        self._emitters: List[ParticleEmitter] = []
+        self._rng = np.random.default_rng()
+
+    def __len__(self) -> int:
+        """Cantidad de partículas vivas"""
+        return int(np.count_nonzero(self.alive[:self._used]))
+
+    def _color_id(self, color: Tuple[int, int, int]) -> int:
+        """Retorna el índice de un color en la paleta (lo agrega si es nuevo)"""
+        color = tuple(color)
+        color_id = self._color_ids.get(color)
+        if color_id is None:
+            color_id = len(self._palette)
+            self._palette.append(color)
+            self._color_ids[color] = color_id
+        return color_id
+
+    def _curve_id(self, preset: Optional[EmitterPreset]) -> int:
+        """Retorna el índice de las curvas de vida de un efecto (0 = fade lineal)"""
+        if preset is None or (preset.alpha_curve is None and preset.size_curve is None):
+            return 0
+        curve_id = self._curve_ids.get(preset.id)
+        if curve_id is None:
+            curve_id = len(self._curves)
+            self._curves.append((preset.alpha_curve, preset.size_curve))
+            self._curve_ids[preset.id] = curve_id
+        return curve_id
+
+    def _take_slots(self, count: int) -> np.ndarray:
+        """
+        Reserva huecos distintos del pool: primero los de partículas muertas,
+        luego los nunca usados y, con el pool lleno, los de partículas vivas
+
+        Args:
+            count: Huecos pedidos (como mucho capacity)
+
+        Returns:
+            Índices de los huecos, sin repetir
+        """
+        count = min(count, self.capacity)
+        used = self._used
+        slots = np.flatnonzero(~self.alive[:used])[:count]
+        missing = count - len(slots)
+        if missing > 0:
+            fresh = np.arange(used, min(self.capacity, used + missing))
+            self._used = used + len(fresh)
+            slots = np.concatenate((slots, fresh))
+            missing -= len(fresh)
+        if missing > 0:
+            # Pool lleno: reemplazar partículas vivas siguiendo el cursor circular
+            # (los huecos muertos ya están en slots, así que no se repiten)
+            order = (self._head + np.arange(self.capacity)) % self.capacity
+            replaced = order[self.alive[order]][:missing]
+            self._head = (int(replaced[-1]) + 1) % self.capacity
+            slots = np.concatenate((slots, replaced))
+        return slots
+
+    def emit(self, x, y, vx, vy, color: Tuple[int, int, int], lifetime, size,
+             preset: Optional[EmitterPreset] = None):
+        """
+        Agrega partículas al pool (todos los argumentos numéricos aceptan arrays)
+
+        Args:
+            x, y: Posiciones iniciales
+            vx, vy: Velocidades
+            color: Color RGB común a todas
+            lifetime: Tiempos de vida en segundos
+            size: Radios en píxeles
+            preset: Efecto del que salen (para sus curvas de vida)
+        """
+        x = np.atleast_1d(np.asarray(x, dtype=np.float32))
+        count = len(x)
+        if count == 0:
+            return
+
+        def column(values, dtype):
+            return np.broadcast_to(np.asarray(values, dtype=dtype), (count,))
+
+        y = column(y, np.float32)
+        vx = column(vx, np.float32)
+        vy = column(vy, np.float32)
+        lifetime = column(lifetime, np.float32)
+        size = np.clip(column(size, np.int32), 1, MAX_SIZE - 1)
+
+        if count > self.capacity:
+            # Solo entran las últimas
+            x, y, vx, vy = x[-self.capacity:], y[-self.capacity:], vx[-self.capacity:], vy[-self.capacity:]
+            lifetime, size = lifetime[-self.capacity:], size[-self.capacity:]
+            count = self.capacity
+
+        slots = self._take_slots(count)
+        self.x[slots] = x
+        self.y[slots] = y
+        self.vx[slots] = vx
+        self.vy[slots] = vy
+        self.lifetime[slots] = lifetime
+        self.max_lifetime[slots] = lifetime
+        self.color[slots] = self._color_id(color)
+        self.size[slots] = size
+        self.curve[slots] = self._curve_id(preset)
+        self.alive[slots] = True
+
+    def spawn(self, preset: EmitterPreset, x: float, y: float, count: int,
+              color: Optional[Tuple[int, int, int]] = None):
+        """
+        Emite partículas de un efecto
+
+        Args:
+            preset: Definición del efecto
+            x, y: Posición de salida
+            count: Cantidad de partículas
+            color: Color RGB (por defecto el del efecto)
+        """
+        if count <= 0:
+            return
+        rng = self._rng
+        xs = x + rng.uniform(-preset.spread[0], preset.spread[0], count)
+        ys = y + rng.uniform(-preset.spread[1], preset.spread[1], count)
+        if preset.velocity_x is not None or preset.velocity_y is not None:
+            vx = rng.uniform(*(preset.velocity_x or (0, 0)), count)
+            vy = rng.uniform(*(preset.velocity_y or (0, 0)), count)
+        else:
+            angle = np.radians(rng.uniform(*preset.angle, count))
+            speed = rng.uniform(*preset.speed, count)
+            vx = speed * np.cos(angle)
+            vy = speed * np.sin(angle)
+        self.emit(xs, ys, vx, vy, color or preset.color,
+                  rng.uniform(*preset.lifetime, count),
+                  rng.integers(int(preset.size[0]), int(preset.size[1]) + 1, count),
+                  preset)
+
+    def burst(self, preset_id: str, x: float, y: float,
+              color: Optional[Tuple[int, int, int]] = None, count: Optional[int] = None):
+        """
+        Emite una ráfaga de un efecto de data/effects/
+
+        Args:
+            preset_id: ID del efecto
+            x, y: Posición de salida
+            color: Color RGB (por defecto el del efecto)
+            count: Cantidad de partículas (por defecto la del efecto)
+        """
+        preset = get_emitter_preset(preset_id)
+        if preset is not None:
+            self.spawn(preset, x, y, preset.count if count is None else count, color)
+
+    def start_emitter(self, preset_id: str, x: float, y: float,
+                      duration: Optional[float] = None) -> Optional[ParticleEmitter]:
+        """
+        Inicia un emisor continuo de un efecto (usa su campo rate)
+
+        Args:
+            preset_id: ID del efecto
+            x, y: Posición del emisor
+            duration: Segundos que dura (None = hasta emitter.stop())
+
+        Returns:
+            ParticleEmitter o None si el efecto no existe
+        """
+        preset = get_emitter_preset(preset_id)
+        if preset is None:
+            return None
+        emitter = ParticleEmitter(self, preset, x, y, duration)
+        self._emitters.append(emitter)
+        return emitter
+
+    def add_explosion(self, x: float, y: float, color: Optional[Tuple[int, int, int]] = None,
+                      count: Optional[int] = None):
         """Agrega una explosión de partículas"""
-        for _ in range(count):
-            angle = random.uniform(0, 6.28)  # 0 a 2π
-            speed = random.uniform(50, 150)
-            vx = speed * pygame.math.Vector2(1, 0).rotate_rad(angle).x
-            vy = speed * pygame.math.Vector2(1, 0).rotate_rad(angle).y
-            
-            particle = Particle(
-                x, y, vx, vy,
-                color,
-                random.uniform(0.3, 0.8),
-                random.randint(2, 4)
-            )
-            self.particles.append(particle)
-    
-    def add_heal_effect(self, x: float, y: float, count: int = 10):
+        self.burst("explosion", x, y, color, count)
+
+    def add_heal_effect(self, x: float, y: float, count: Optional[int] = None):
         """Agrega efecto de curación (partículas verdes que suben)"""
-        for _ in range(count):
-            vx = random.uniform(-20, 20)
-            vy = random.uniform(-80, -40)  # Hacia arriba
-            particle = Particle(
-                x + random.uniform(-10, 10),
-                y + random.uniform(-10, 10),
-                vx, vy,
-                (100, 255, 100),
-                random.uniform(0.5, 1.0),
-                3
-            )
-            self.particles.append(particle)
-    
-    def add_damage_effect(self, x: float, y: float, count: int = 8):
+        self.burst("heal", x, y, count=count)
+
+    def add_damage_effect(self, x: float, y: float, count: Optional[int] = None):
         """Agrega efecto de daño (partículas rojas)"""
-        for _ in range(count):
-            vx = random.uniform(-30, 30)
-            vy = random.uniform(-50, -20)
-            particle = Particle(
-                x + random.uniform(-5, 5),
-                y + random.uniform(-5, 5),
-                vx, vy,
-                (255, 50, 50),
-                random.uniform(0.3, 0.6),
-                2
-            )
-            self.particles.append(particle)
-    
-    def add_magic_sparkles(self, x: float, y: float, color: Tuple[int, int, int] = (100, 150, 255),
-                          count: int = 15):
+        self.burst("damage", x, y, count=count)
+
+    def add_magic_sparkles(self, x: float, y: float, color: Optional[Tuple[int, int, int]] = None,
+                           count: Optional[int] = None):
         """Agrega chispas mágicas"""
-        for _ in range(count):
-            angle = random.uniform(0, 6.28)
-            speed = random.uniform(20, 60)
-            vx = speed * pygame.math.Vector2(1, 0).rotate_rad(angle).x
-            vy = speed * pygame.math.Vector2(1, 0).rotate_rad(angle).y
-            
-            particle = Particle(
-                x, y, vx, vy,
-                color,
-                random.uniform(0.4, 0.8),
-                2
-            )
-            self.particles.append(particle)
-    
+        self.burst("magic_sparkles", x, y, color, count)
+
     def update(self, dt: float):
-        """Actualiza todas las partículas"""
-        self.particles = [p for p in self.particles if p.update(dt)]
-    
+        """Actualiza todas las partículas y los emisores continuos"""
+        if self._emitters:
+            for emitter in self._emitters:
+                emitter.update(dt)
+            self._emitters = [emitter for emitter in self._emitters if emitter.active]
+
+        n = self._used
+        if n == 0:
+            return
+        vy = self.vy[:n]
+        self.x[:n] += self.vx[:n] * dt
+        self.y[:n] += vy * dt
+        self.lifetime[:n] -= dt
+        vy += GRAVITY * dt  # Gravedad suave
+        alive = self.alive[:n]
+        alive &= self.lifetime[:n] > 0
+
+        # Sin partículas vivas, el pool vuelve a empezar (los frames siguientes no cuestan nada)
+        if not alive.any():
+            self._head = 0
+            self._used = 0
+
+    def _get_sprite(self, key: int) -> pygame.Surface:
+        """Sprite en caché de una combinación (tamaño, color, tramo de alpha)"""
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            rest, bucket = divmod(key, PARTICLE_ALPHA_BUCKETS)
+            color_id, size = divmod(rest, MAX_SIZE)
+            # Alpha del tope del tramo (el mismo que tendría la partícula al entrar en él)
+            alpha = min(255, math.ceil((bucket + 1) * 256 / PARTICLE_ALPHA_BUCKETS) - 1)
+            sprite = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, (*self._palette[color_id], alpha), (size, size), size)
+            self._sprites[key] = sprite
+        return sprite
+
     def render(self, screen: pygame.Surface, camera_offset: Tuple[int, int] = (0, 0)):
         """Renderiza todas las partículas"""
-        for particle in self.particles:
-            particle.render(screen, camera_offset)
-    
-    def clear(self):
-        """Limpia todas las partículas"""
-        self.particles.clear()
+        n = self._used
+        if n == 0:
+            return
+        index = np.flatnonzero(self.alive[:n])
+        if len(index) == 0:
+            return
 
+        screen_x = (self.x[index] - camera_offset[0]).astype(np.int32)
+        screen_y = (self.y[index] - camera_offset[1]).astype(np.int32)
+        visible = ((screen_x >= 0) & (screen_x < screen.get_width())
+                   & (screen_y >= 0) & (screen_y < screen.get_height()))
+        if not visible.any():
+            return
+        index = index[visible]
+        screen_x = screen_x[visible]
+        screen_y = screen_y[visible]
+
+        # Fade out según la vida restante (o las curvas del efecto), agrupado en tramos de alpha
+        opacity = self.lifetime[index] / self.max_lifetime[index]
+        size = self.size[index]
+        if len(self._curves) > 1:
+            curve = self.curve[index]
+            age = 1.0 - opacity
+            scaled_size = size.astype(np.float32)
+            for curve_id in np.unique(curve).tolist():
+                alpha_curve, size_curve = self._curves[curve_id]
+                mask = curve == curve_id
+                if alpha_curve is not None:
+                    opacity[mask] = np.interp(age[mask], *alpha_curve)
+                if size_curve is not None:
+                    scaled_size[mask] *= np.interp(age[mask], *size_curve)
+            size = np.clip(np.rint(scaled_size).astype(np.int32), 1, MAX_SIZE - 1)
+
+        alpha = (255 * opacity).astype(np.int32)
+        bucket = np.clip(alpha, 0, 255) * PARTICLE_ALPHA_BUCKETS // 256
+        keys = (self.color[index] * MAX_SIZE + size) * PARTICLE_ALPHA_BUCKETS + bucket
+
+        # Un sprite por combinación distinta, luego un solo fblits
+        unique_keys, inverse = np.unique(keys, return_inverse=True)
+        sprites = [self._get_sprite(int(key)) for key in unique_keys]
+        positions = zip((screen_x - size).tolist(), (screen_y - size).tolist())
+        screen.fblits(zip([sprites[i] for i in inverse.tolist()], positions))
+        profiler.count("blits", len(index))
+
+    def clear(self):
+        """Limpia todas las partículas y detiene los emisores"""
+        self.alive[:] = False
+        self._head = 0
+        self._used = 0
+        self._emitters.clear()
@@ -0,0 +1,257 @@
+"""
+Perfilador de tiempos por frame
+
+Cada fase del frame se mide con un scope con nombre:
+
+    with profiler.scope("render"):
+        ...
+
+Los tiempos de cada scope se suman dentro del frame y, al cerrar el frame,
+se guardan en un buffer circular de los últimos PROFILER_HISTORY_FRAMES
+frames, de donde salen los percentiles. Los contadores (por ejemplo
+"blits") funcionan igual.
+
+El overlay (F3) muestra FPS, percentiles del tiempo de frame, ms por scope,
+contadores y aciertos de las cachés. Al salir se puede volcar el historial
+a CSV (un frame por fila) y JSON (resumen).
+"""
+
+import csv
+import json
+import os
+import time
+import numpy as np
+import pygame
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+from src.config import (
+    PROFILER_ENABLED, PROFILER_HISTORY_FRAMES, PROFILER_OVERLAY_REFRESH, PROFILER_DUMP_DIR
+)
+
+FRAME_SCOPE = "frame"
+
+
+class Profiler:
+    """Mide scopes y contadores por frame en buffers circulares"""
+
+    def __init__(self, history: int = PROFILER_HISTORY_FRAMES, enabled: bool = PROFILER_ENABLED):
+        """
+        Inicializa el perfilador
+
+        Args:
+            history: Frames que se guardan para los percentiles
+            enabled: Si False, scope() y count() no hacen nada
+        """
+        self.enabled = enabled
+        self.history = history
+        self.overlay_visible = False
+
+        self._series: Dict[str, np.ndarray] = {}  # Nombre -> ms (o cuenta) por frame
+        self._counters = set()  # Nombres que son contadores y no tiempos
+        self._frame_values: Dict[str, float] = {}
+        self._frame_start: Optional[float] = None
+        self._frames = 0  # Frames cerrados en total (el buffer guarda los últimos)
+
+        self._overlay: Optional[pygame.Surface] = None
+        self._overlay_time = 0.0
+
+    @contextmanager
+    def scope(self, name: str) -> Iterator[None]:
+        """
+        Mide el bloque y suma su tiempo al scope del frame actual
+
+        Args:
+            name: Nombre del scope
+        """
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = (time.perf_counter() - start) * 1000.0
+            self._frame_values[name] = self._frame_values.get(name, 0.0) + elapsed
+
+    def count(self, name: str, amount: int = 1):
+        """
+        Suma a un contador del frame actual
+
+        Args:
+            name: Nombre del contador
+            amount: Cantidad a sumar
+        """
+        if self.enabled:
+            self._counters.add(name)
+            self._frame_values[name] = self._frame_values.get(name, 0.0) + amount
+
+    def begin_frame(self):
+        """Marca el inicio de un frame"""
+        if self.enabled:
+            self._frame_start = time.perf_counter()
+            self._frame_values = {}
+
+    def end_frame(self):
+        """Cierra el frame y guarda sus valores en el historial"""
+        if not self.enabled or self._frame_start is None:
+            return
+        self._frame_values[FRAME_SCOPE] = (time.perf_counter() - self._frame_start) * 1000.0
+        self._frame_start = None
+
+        slot = self._frames % self.history
+        for name, value in self._frame_values.items():
+            series = self._series.get(name)
+            if series is None:
+                # Scope nuevo: los frames anteriores valen 0
+                series = np.zeros(self.history, dtype=np.float64)
+                self._series[name] = series
+            series[slot] = value
+        # Scopes que no aparecieron en este frame
+        for name, series in self._series.items():
+            if name not in self._frame_values:
+                series[slot] = 0.0
+        self._frames += 1
+
+    def _values(self, name: str) -> np.ndarray:
+        """Valores guardados de un scope, del más viejo al más nuevo"""
+        series = self._series.get(name)
+        if series is None:
+            return np.zeros(0)
+        if self._frames < self.history:
+            return series[:self._frames]
+        slot = self._frames % self.history
+        return np.concatenate((series[slot:], series[:slot]))
+
+    def names(self) -> List[str]:
+        """Nombres de los scopes y contadores medidos (sin el frame completo)"""
+        return sorted(name for name in self._series if name != FRAME_SCOPE)
+
+    def percentiles(self, name: str = FRAME_SCOPE, points=(50, 95, 99)) -> List[float]:
+        """
+        Percentiles de un scope en el historial
+
+        Args:
+            name: Nombre del scope (por defecto el frame completo)
+            points: Percentiles a calcular
+
+        Returns:
+            Lista de valores en ms (ceros si no hay datos)
+        """
+        values = self._values(name)
+        if len(values) == 0:
+            return [0.0 for _ in points]
+        return [float(value) for value in np.percentile(values, points)]
+
+    def mean(self, name: str) -> float:
+        """Promedio de un scope en el historial"""
+        values = self._values(name)
+        return float(values.mean()) if len(values) else 0.0
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """
+        Resumen del historial por scope
+
+        Returns:
+            Diccionario nombre -> {mean, p50, p95, p99, max}
+        """
+        result = {}
+        for name in [FRAME_SCOPE] + self.names():
+            values = self._values(name)
+            p50, p95, p99 = self.percentiles(name)
+            result[name] = {
+                "mean": self.mean(name),
+                "p50": p50,
+                "p95": p95,
+                "p99": p99,
+                "max": float(values.max()) if len(values) else 0.0,
+            }
+        return result
+
+    def toggle_overlay(self):
+        """Muestra u oculta el overlay"""
+        self.overlay_visible = not self.overlay_visible
+        self._overlay = None
+
+    def render_overlay(self, screen: pygame.Surface, fps: float,
+                       cache_stats: Optional[Dict[str, Dict]] = None):
+        """
+        Dibuja el overlay de rendimiento (se regenera unas veces por segundo)
+
+        Args:
+            screen: Superficie donde dibujar
+            fps: Frames por segundo reales (por ejemplo clock.get_fps())
+            cache_stats: Estadísticas por caché (con hits y misses)
+        """
+        if not self.overlay_visible or not self.enabled:
+            return
+        now = time.perf_counter()
+        if self._overlay is None or now - self._overlay_time >= 1.0 / PROFILER_OVERLAY_REFRESH:
+            self._overlay = self._build_overlay(fps, cache_stats or {})
+            self._overlay_time = now
+        screen.blit(self._overlay, (screen.get_width() - self._overlay.get_width() - 10, 10))
+
+    def _build_overlay(self, fps: float, cache_stats: Dict[str, Dict]) -> pygame.Surface:
+        """Arma la superficie del overlay con los valores actuales"""
+        from src.utils.font_helper import get_font, FACE_DEFAULT
+
+        p50, p95, p99 = self.percentiles()
+        lines = [
+            f"FPS: {fps:.0f}",
+            f"Frame p50/p95/p99: {p50:.1f} / {p95:.1f} / {p99:.1f} ms",
+        ]
+        for name in self.names():
+            if name in self._counters:
+                lines.append(f"{name}: {self.mean(name):.0f}")
+            else:
+                lines.append(f"{name}: {self.mean(name):.2f} ms")
+        for name, stats in cache_stats.items():
+            lookups = stats.get("hits", 0) + stats.get("misses", 0)
+            if lookups:
+                lines.append(f"Caché {name}: {100.0 * stats['hits'] / lookups:.0f}% aciertos")
+
+        # Fuente por defecto: el overlay no depende de la fuente del juego
+        font = get_font(FACE_DEFAULT, "", 18)
+        rendered = [font.render(line, True, (230, 230, 230)) for line in lines]
+        width = max(surface.get_width() for surface in rendered) + 12
+        height = sum(surface.get_height() for surface in rendered) + 12
+        overlay = pygame.Surface((width, height), pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, 170))
+        y = 6
+        for surface in rendered:
+            overlay.blit(surface, (6, y))
+            y += surface.get_height()
+        return overlay
+
+    def dump(self, directory: str = PROFILER_DUMP_DIR) -> Optional[str]:
+        """
+        Vuelca el historial a CSV (un frame por fila) y el resumen a JSON
+
+        Args:
+            directory: Carpeta de salida
+
+        Returns:
+            Ruta base de los archivos (sin extensión) o None si no hay datos
+        """
+        if self._frames == 0:
+            return None
+        base = os.path.join(directory, time.strftime("profile_%Y%m%d_%H%M%S"))
+        columns = [FRAME_SCOPE] + self.names()
+        series = [self._values(name) for name in columns]
+        try:
+            os.makedirs(directory, exist_ok=True)
+            with open(base + ".csv", 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                writer.writerow(columns)
+                for row in zip(*series):
+                    writer.writerow([f"{value:.3f}" for value in row])
+            with open(base + ".json", 'w', encoding='utf-8') as f:
+                json.dump({"frames": self._frames, "scopes": self.summary()}, f, indent=2)
+        except OSError as e:
+            print(f"[ERROR] No se pudo guardar el perfil: {e}")
+            return None
+        print(f"[OK] Perfil guardado en {base}.csv / .json")
+        return base
+
+
+# Perfilador compartido por todo el juego
+profiler = Profiler()
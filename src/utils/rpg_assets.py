@@ -15,12 +15,15 @@ class RPGAssetLibrary:
     Biblioteca principal para gestionar todos los assets RPG pixel art
     """
     
-    def __init__(self, resource_manager=None):
+    def __init__(self, resource_manager=None, scan: bool = True):
         """
         Inicializa la biblioteca de assets
         
         Args:
             resource_manager: ResourceManager del juego (opcional)
+            scan: Si True, escanea los directorios de assets en el momento; si
+                False, el registro queda vacío hasta set_registry() (por
+                ejemplo, con scan_registry() ejecutado en el AssetLoader)
         """
         self.resource_manager = resource_manager
         self.base_path = ASSETS_DIR
@@ -35,6 +38,25 @@ class RPGAssetLibrary:
         
         # Registro de assets disponibles
         self._asset_registry = {
+            'items': {},
+            'characters': {},
+            'enemies': {},
+            'tilesets': [],
+            'animations': [],
+            'ui': []
+        }
+        if scan:
+            self.set_registry(self.scan_registry())
+    
+    def scan_registry(self) -> Dict:
+        """
+        Escanea los directorios de assets (no toca la pantalla, se puede
+        ejecutar en un hilo de fondo)
+        
+        Returns:
+            Registro de assets disponibles por categoría
+        """
+        return {
             'items': self._scan_items(),
             'characters': self._scan_characters(),
             'enemies': self._scan_enemies(),
@@ -42,6 +64,15 @@ class RPGAssetLibrary:
             'animations': self._scan_animations(),
             'ui': self._scan_ui()
         }
+    
+    def set_registry(self, registry: Dict):
+        """
+        Reemplaza el registro de assets disponibles
+        
+        Args:
+            registry: Resultado de scan_registry()
+        """
+        self._asset_registry = registry
         
         print(f"[OK] RPG Asset Library initialized")
         print(f"  - Items: {len(self._asset_registry['items'])}")
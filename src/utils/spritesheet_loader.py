@@ -7,6 +7,7 @@ import os
 from typing import List, Tuple
 from src.config import ASSETS_DIR, TILE_SIZE
 from src.entities.animation import Animation, Direction
+from src.utils.image_cache import load_image_file
 
 
 class SpriteSheetLoader:
@@ -24,7 +25,7 @@ class SpriteSheetLoader:
         full_path = os.path.join(ASSETS_DIR, image_path)
         
         try:
-            self.image = pygame.image.load(full_path).convert_alpha()
+            self.image = load_image_file(full_path).convert_alpha()
             
             # Si no se especifica tamaño, detectar automáticamente
             # Asumimos que es un grid 4x4 (16 sprites)
@@ -0,0 +1,89 @@
+"""
+Caché de textos renderizados
+
+Los textos del HUD y de los menús se renderizan una sola vez por
+combinación (fuente, texto, color, antialias); mientras no cambien, cada
+frame reutiliza la misma superficie. Un valor que cambia (por ejemplo el HP)
+genera una superficie nueva solo cuando cambia, y las viejas salen por LRU.
+
+Las superficies devueltas son compartidas: no dibujar sobre ellas (copiar
+antes con .copy() si hace falta modificarlas).
+"""
+
+import pygame
+from typing import Dict, Optional
+from src.config import TEXT_CACHE_BUDGET_MB
+from src.utils.asset_cache import AssetCache
+
+
+class TextCache:
+    """Caché LRU de superficies de texto con presupuesto en bytes"""
+
+    def __init__(self, budget_bytes: int = TEXT_CACHE_BUDGET_MB * 1024 * 1024):
+        """
+        Inicializa la caché
+
+        Args:
+            budget_bytes: Bytes máximos ocupados por las superficies en caché
+        """
+        self._cache = AssetCache("text", budget_bytes)
+
+    def render(self, font: pygame.font.Font, text: str, color,
+               antialias: bool = True) -> pygame.Surface:
+        """
+        Obtiene el texto renderizado (lo renderiza la primera vez)
+
+        Args:
+            font: Fuente (normalmente del registro de font_helper)
+            text: Texto a renderizar
+            color: Color del texto
+            antialias: Si True, con antialiasing
+
+        Returns:
+            Superficie compartida con el texto
+        """
+        key = (font, text, tuple(color), antialias)
+        surface = self._cache.get(key)
+        if surface is None:
+            surface = font.render(text, antialias, color)
+            self._cache.put(key, surface,
+                            surface.get_width() * surface.get_height() * surface.get_bytesize())
+        return surface
+
+    def invalidate(self, font: Optional[pygame.font.Font] = None):
+        """
+        Descarta textos en caché
+
+        Args:
+            font: Si se indica, solo los textos de esa fuente; si no, todos
+        """
+        if font is None:
+            self._cache.clear()
+            return
+        for key in [key for key in self._cache.keys() if key[0] is font]:
+            self._cache.discard(key)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Retorna aciertos, fallos, descartes y memoria ocupada"""
+        return self._cache.get_stats()
+
+
+# Caché compartida por todos los estados
+text_cache = TextCache()
+
+
+def render_text(font: pygame.font.Font, text: str, color,
+                antialias: bool = True) -> pygame.Surface:
+    """
+    Renderiza un texto usando la caché compartida
+
+    Args:
+        font: Fuente
+        text: Texto a renderizar
+        color: Color del texto
+        antialias: Si True, con antialiasing
+
+    Returns:
+        Superficie compartida con el texto
+    """
+    return text_cache.render(font, text, color, antialias)
@@ -0,0 +1,390 @@
+"""
+Atlas de texturas - empaquetado en tiempo de build y registro en tiempo de ejecución
+
+build_atlases junta los tiles de los tilesets y los sprites sueltos en unas
+pocas páginas PNG grandes y escribe un manifiesto JSON con el rectángulo de
+cada frame:
+
+    {
+        "version": 1,
+        "pages": [{"image": "atlas_0.png", "width": 2048, "height": 1536}],
+        "sources": {"tilesets/base_grass.png": {"mtime": ..., "size": ...,
+                                                "width": ..., "height": ...}},
+        "frames": {"tilesets/base_grass.png#3,1": [página, x, y, ancho, alto],
+                   "sprites/player.png": [página, x, y, ancho, alto]}
+    }
+
+Los frames de tiles se nombran "<tileset>#<columna>,<fila>" y los sprites
+enteros por su ruta relativa a assets/. Los frames con píxeles idénticos
+comparten rectángulo.
+"""
+
+import glob
+import json
+import os
+from typing import Dict, Hashable, List, Optional, Tuple
+
+import pygame
+
+from src.config import (
+    ASSETS_DIR, ATLAS_DIR, ATLAS_PAGE_SIZE, ATLAS_TILESETS, ATLAS_SPRITE_DIRS, TILE_SIZE
+)
+from src.utils.image_cache import load_image_file
+
+ATLAS_MANIFEST = "atlas.json"
+ATLAS_VERSION = 1
+
+
+def tile_frame_name(path: str, tile_x: int, tile_y: int) -> str:
+    """Retorna el nombre del frame de un tile dentro de un tileset"""
+    return f"{_normalize(path)}#{tile_x},{tile_y}"
+
+
+def _normalize(path: str) -> str:
+    """Normaliza una ruta relativa a assets/ (separador '/')"""
+    return path.replace("\\", "/")
+
+
+def _source_info(path: str, image: pygame.Surface) -> Dict:
+    """Datos de un archivo origen para detectar si el atlas quedó desactualizado"""
+    stat = os.stat(os.path.join(ASSETS_DIR, path))
+    return {"mtime": stat.st_mtime, "size": stat.st_size,
+            "width": image.get_width(), "height": image.get_height()}
+
+
+def pack_rects(sizes: List[Tuple[int, int]], page_size: int) -> List[Optional[Tuple[int, int, int]]]:
+    """
+    Empaqueta rectángulos en páginas por estantes (de mayor a menor altura)
+
+    Args:
+        sizes: Lista de (ancho, alto)
+        page_size: Lado máximo de cada página
+
+    Returns:
+        Lista paralela con (página, x, y), o None si el rectángulo no cabe en una página
+    """
+    placements: List[Optional[Tuple[int, int, int]]] = [None] * len(sizes)
+    order = sorted(range(len(sizes)), key=lambda i: (-sizes[i][1], -sizes[i][0]))
+
+    page = -1
+    cursor_x = shelf_y = shelf_height = 0
+    for index in order:
+        width, height = sizes[index]
+        if width > page_size or height > page_size:
+            continue
+
+        if page < 0:
+            page = 0
+        if cursor_x + width > page_size:
+            # Nuevo estante
+            shelf_y += shelf_height
+            cursor_x = shelf_height = 0
+        if shelf_y + height > page_size:
+            # Nueva página
+            page += 1
+            cursor_x = shelf_y = shelf_height = 0
+
+        placements[index] = (page, cursor_x, shelf_y)
+        cursor_x += width
+        shelf_height = max(shelf_height, height)
+
+    return placements
+
+
+def build_atlases(output_dir: str = ATLAS_DIR, page_size: int = ATLAS_PAGE_SIZE) -> str:
+    """
+    Genera las páginas del atlas y su manifiesto
+
+    Args:
+        output_dir: Carpeta de salida
+        page_size: Lado máximo de cada página en píxeles
+
+    Returns:
+        Ruta del manifiesto generado
+    """
+    images: List[pygame.Surface] = []  # Imágenes únicas
+    groups: List[int] = []  # Grupo de cada imagen única (0 = tiles, 1 = sprites)
+    unique: Dict[Tuple[int, int, int, bytes], int] = {}  # Píxeles -> índice en images
+    frame_images: Dict[str, int] = {}  # Frame -> índice en images
+    sources: Dict[str, Dict] = {}
+
+    def add_frame(name: str, image: pygame.Surface, group: int):
+        key = (group, image.get_width(), image.get_height(), pygame.image.tobytes(image, "RGBA"))
+        index = unique.get(key)
+        if index is None:
+            index = len(images)
+            images.append(image)
+            groups.append(group)
+            unique[key] = index
+        frame_images[name] = index
+
+    # Tilesets: un frame por tile
+    for path in ATLAS_TILESETS:
+        full_path = os.path.join(ASSETS_DIR, path)
+        if not os.path.exists(full_path):
+            print(f"[WARNING] Tileset no encontrado: {path}")
+            continue
+        sheet = pygame.image.load(full_path)
+        sources[_normalize(path)] = _source_info(path, sheet)
+        for tile_y in range(sheet.get_height() // TILE_SIZE):
+            for tile_x in range(sheet.get_width() // TILE_SIZE):
+                rect = pygame.Rect(tile_x * TILE_SIZE, tile_y * TILE_SIZE, TILE_SIZE, TILE_SIZE)
+                add_frame(tile_frame_name(path, tile_x, tile_y), sheet.subsurface(rect), 0)
+
+    # Sprites: un frame por imagen
+    for folder in ATLAS_SPRITE_DIRS:
+        pattern = os.path.join(ASSETS_DIR, folder, "**", "*.png")
+        for full_path in sorted(glob.glob(pattern, recursive=True)):
+            path = _normalize(os.path.relpath(full_path, ASSETS_DIR))
+            image = pygame.image.load(full_path)
+            if image.get_width() > page_size or image.get_height() > page_size:
+                print(f"[WARNING] {path} no cabe en una página del atlas, se carga aparte")
+                continue
+            sources[path] = _source_info(path, image)
+            add_frame(path, image, 1)
+
+    # Tiles y sprites van en páginas separadas: los mapas no cargan sprites
+    placements: List[Optional[Tuple[int, int, int]]] = [None] * len(images)
+    first_page = 0
+    for group in (0, 1):
+        members = [i for i, g in enumerate(groups) if g == group]
+        packed = pack_rects([images[i].get_size() for i in members], page_size)
+        for i, placement in zip(members, packed):
+            placements[i] = (first_page + placement[0], placement[1], placement[2])
+        first_page = max([p[0] for p in placements if p] + [first_page - 1]) + 1
+
+    # Tamaño real de cada página (recortada a lo que se usó)
+    page_sizes: Dict[int, List[int]] = {}
+    for image, placement in zip(images, placements):
+        page, x, y = placement
+        size = page_sizes.setdefault(page, [0, 0])
+        size[0] = max(size[0], x + image.get_width())
+        size[1] = max(size[1], y + image.get_height())
+
+    os.makedirs(output_dir, exist_ok=True)
+    pages = []
+    for page in sorted(page_sizes):
+        width, height = page_sizes[page]
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        for image, placement in zip(images, placements):
+            if placement[0] == page:
+                # BLEND_RGBA_ADD sobre transparente copia los píxeles tal cual
+                surface.blit(image, placement[1:], special_flags=pygame.BLEND_RGBA_ADD)
+        filename = f"atlas_{page}.png"
+        pygame.image.save(surface, os.path.join(output_dir, filename))
+        pages.append({"image": filename, "width": width, "height": height})
+
+    frames = {}
+    for name, index in frame_images.items():
+        page, x, y = placements[index]
+        width, height = images[index].get_size()
+        frames[name] = [page, x, y, width, height]
+
+    manifest = {"version": ATLAS_VERSION, "pages": pages, "sources": sources, "frames": frames}
+    manifest_path = os.path.join(output_dir, ATLAS_MANIFEST)
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, separators=(",", ":"))
+
+    return manifest_path
+
+
+def page_key(index: int) -> Tuple[str, int]:
+    """Clave de una página del atlas en la caché de imágenes"""
+    return ("atlas_page", index)
+
+
+class AtlasRegistry:
+    """
+    Sirve frames desde las páginas del atlas (cargadas bajo demanda)
+
+    Con page_cache, las páginas viven en esa caché (la de imágenes del
+    ResourceManager) con su tamaño completo, así que cuentan para el
+    presupuesto y se pueden descartar. Al descartar una página se olvidan
+    sus frames; la memoria se libera cuando nadie más los usa y la página se
+    vuelve a cargar con el próximo pedido.
+    """
+
+    def __init__(self, manifest_path: Optional[str] = None, page_cache=None):
+        """
+        Lee el manifiesto del atlas si existe
+
+        Los frames de archivos modificados después de generar el atlas se
+        descartan, así que el juego vuelve a cargar esos PNG directamente.
+
+        Args:
+            manifest_path: Ruta al manifiesto (por defecto assets/atlases/atlas.json)
+            page_cache: AssetCache donde guardar las páginas (None = para siempre en el registro)
+        """
+        self.manifest_path = manifest_path or os.path.join(ATLAS_DIR, ATLAS_MANIFEST)
+        self.pages: List[Dict] = []
+        self.sources: Dict[str, Dict] = {}
+        self.frames: Dict[str, List[int]] = {}
+        self.page_cache = page_cache
+        self._page_surfaces: Dict[int, pygame.Surface] = {}
+        self._frame_cache: Dict[str, pygame.Surface] = {}
+        self._page_frames: Dict[int, List[str]] = {}  # Frames en caché de cada página
+
+        if os.path.exists(self.manifest_path):
+            self._load_manifest()
+
+    def _load_manifest(self):
+        """Carga el manifiesto y descarta los orígenes desactualizados"""
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except Exception as e:
+            print(f"[WARNING] No se pudo leer el atlas {self.manifest_path}: {e}")
+            return
+
+        if manifest.get("version") != ATLAS_VERSION:
+            print("[WARNING] Atlas de versión distinta, se ignora (ejecutar build_atlases.py)")
+            return
+
+        stale = set()
+        for path, info in manifest["sources"].items():
+            try:
+                stat = os.stat(os.path.join(ASSETS_DIR, path))
+            except OSError:
+                continue  # Solo está en el atlas
+            if stat.st_mtime != info["mtime"] or stat.st_size != info["size"]:
+                stale.add(path)
+        if stale:
+            print(f"[WARNING] {len(stale)} imágenes cambiaron desde que se generó el atlas")
+
+        self.pages = manifest["pages"]
+        self.sources = {path: info for path, info in manifest["sources"].items()
+                        if path not in stale}
+        self.frames = {name: rect for name, rect in manifest["frames"].items()
+                       if name.split("#", 1)[0] not in stale}
+        print(f"[OK] Atlas cargado: {len(self.frames)} frames en {len(self.pages)} páginas")
+
+    def has_frame(self, name: str) -> bool:
+        """Retorna True si el atlas tiene un frame con ese nombre"""
+        return _normalize(name) in self.frames
+
+    def has_source(self, path: str) -> bool:
+        """Retorna True si el atlas contiene (al día) la imagen indicada"""
+        return _normalize(path) in self.sources
+
+    def get_source_size(self, path: str) -> Optional[Tuple[int, int]]:
+        """
+        Retorna el tamaño original de una imagen empaquetada
+
+        Args:
+            path: Ruta relativa a assets/
+
+        Returns:
+            Tupla (ancho, alto) o None si no está en el atlas
+        """
+        info = self.sources.get(_normalize(path))
+        if not info:
+            return None
+        return (info["width"], info["height"])
+
+    def get_frame(self, name: str) -> Optional[pygame.Surface]:
+        """
+        Obtiene un frame del atlas
+
+        Args:
+            name: Nombre del frame (ruta del sprite o nombre de tile)
+
+        Returns:
+            Subsuperficie de la página del atlas, o None si no existe
+        """
+        name = _normalize(name)
+        rect = self.frames.get(name)
+        if rect is None:
+            return None
+
+        # Pedir siempre la página para que cuente como usada en page_cache
+        page = self._get_page(rect[0])
+        if page is None:
+            return None
+        frame = self._frame_cache.get(name)
+        if frame is not None:
+            return frame
+        frame = page.subsurface(pygame.Rect(rect[1], rect[2], rect[3], rect[4]))
+        self._frame_cache[name] = frame
+        self._page_frames.setdefault(rect[0], []).append(name)
+        return frame
+
+    def get_tile(self, path: str, tile_x: int, tile_y: int) -> Optional[pygame.Surface]:
+        """Obtiene un tile de un tileset empaquetado"""
+        return self.get_frame(tile_frame_name(path, tile_x, tile_y))
+
+    def get_page_key(self, name: str) -> Optional[Hashable]:
+        """
+        Clave en page_cache de la página que contiene un frame
+
+        Args:
+            name: Nombre del frame
+
+        Returns:
+            Clave (ver page_key) o None si el frame no está en el atlas
+        """
+        rect = self.frames.get(_normalize(name))
+        return page_key(rect[0]) if rect is not None else None
+
+    def page_evicted(self, key: Hashable):
+        """
+        Olvida los frames de una página que salió de page_cache
+
+        Args:
+            key: Clave de la caché (las que no son páginas se ignoran)
+        """
+        if not (isinstance(key, tuple) and len(key) == 2 and key[0] == "atlas_page"):
+            return
+        for name in self._page_frames.pop(key[1], []):
+            self._frame_cache.pop(name, None)
+
+    def _get_page(self, index: int) -> Optional[pygame.Surface]:
+        """Carga una página del atlas (una vez mientras siga en caché)"""
+        if self.page_cache is not None:
+            page = self.page_cache.get(page_key(index))
+        else:
+            page = self._page_surfaces.get(index)
+        if page is None:
+            # Frames de una carga anterior de la página (ya descartada)
+            self.page_evicted(page_key(index))
+            path = os.path.join(os.path.dirname(self.manifest_path), self.pages[index]["image"])
+            try:
+                page = load_image_file(path)
+            except pygame.error as e:
+                print(f"[ERROR] No se pudo cargar la página del atlas {path}: {e}")
+                return None
+            if pygame.display.get_surface():
+                page = page.convert_alpha()
+            if self.page_cache is not None:
+                self.page_cache.put(page_key(index), page,
+                                    page.get_width() * page.get_height() * page.get_bytesize())
+            else:
+                self._page_surfaces[index] = page
+        return page
+
+    def get_stats(self) -> Dict[str, int]:
+        """Retorna las páginas del atlas y cuántas están cargadas (con sus bytes)"""
+        loaded = 0
+        resident_bytes = 0
+        for index in range(len(self.pages)):
+            if self.page_cache is not None:
+                page = self.page_cache.peek(page_key(index))
+            else:
+                page = self._page_surfaces.get(index)
+            if page is not None:
+                loaded += 1
+                resident_bytes += page.get_width() * page.get_height() * page.get_bytesize()
+        return {
+            "pages": len(self.pages),
+            "loaded_pages": loaded,
+            "frames": len(self._frame_cache),
+            "resident_bytes": resident_bytes,
+        }
+
+    def clear(self):
+        """Libera las páginas cargadas (se vuelven a cargar al pedir un frame)"""
+        if self.page_cache is not None:
+            for index in range(len(self.pages)):
+                self.page_cache.discard(page_key(index))
+        self._page_surfaces.clear()
+        self._frame_cache.clear()
+        self._page_frames.clear()